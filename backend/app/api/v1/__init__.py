@@ -1,4 +1,11 @@
 """API v1 module."""
-from app.api.v1.analyze import router
 
 __all__ = ["router"]
+
+
+def __getattr__(name: str):
+    # Imported on access so loading one v1 module does not load the analysis pipeline
+    if name == "router":
+        from app.api.v1.analyze import router
+        return router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
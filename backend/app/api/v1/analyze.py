@@ -4,26 +4,26 @@ TruthLens Analyze API v1
 Main analysis endpoint that orchestrates the full verification pipeline.
 """
 
+import asyncio
+import json
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, async_session
 from app.core.security import get_current_user
 from app.core.config import settings
 from app.models.check import Check
-from app.services import (
-    score_domain,
-    extract_claims,
-    search_factchecks,
-    search_news,
-    classify_all_stances,
-    weighted_stance,
-    aggregate_verdict,
-    generate_explanation,
-    llm_assess_claim,
-)
+from app.services import extract_claims, run_analysis
+from app.services.result_cache import analysis_cache
+from app.services.news_search import news_cache
+from app.services.llm_cache import llm_cache_stats
+from app.services.stance import stance_store
+from app.services.claim_index import index_analysis, claim_index_stats
+from app.services.domain_trust import extract_domain, domain_cache_stats
+from app.services.rating_learning import learned_rating_stats
 
 
 router = APIRouter(prefix="/api/v1", tags=["Analysis"])
@@ -35,6 +35,7 @@ class AnalyzeRequest(BaseModel):
     text: Optional[str] = Field(None, description="Claim or article text to analyze")
     url: Optional[str] = Field(None, description="URL of the article to analyze")
     language: str = Field("en", description="Language code")
+    bypass_cache: bool = Field(False, description="Re-run the full pipeline even if a cached result exists")
 
 
 class DomainTrustResponse(BaseModel):
@@ -42,6 +43,7 @@ class DomainTrustResponse(BaseModel):
     domain: Optional[str]
     score: str
     category: Optional[str] = "unknown"
+    matched_rule: Optional[str] = None
 
 
 class FactCheckResponse(BaseModel):
@@ -81,6 +83,10 @@ class AnalyzeResponse(BaseModel):
     evidence: list[EvidenceItem]
     stance_summary: StanceSummary
     explanation: str
+    timings: Optional[dict[str, float]] = Field(None, description="Per-stage duration in milliseconds")
+    cached: bool = Field(False, description="Whether the result was served from the analysis cache")
+    similar_claim: Optional[str] = Field(None, description="Previously analyzed claim this result was reused from")
+    similarity: Optional[float] = Field(None, description="Similarity to the reused claim (0-1)")
 
 
 # Claim extraction response for user confirmation
@@ -148,7 +154,7 @@ async def analyze_claim(
     """
     Analyze a claim or URL for misinformation.
     
-    Pipeline:
+    Pipeline (independent stages run concurrently, see app.services.pipeline):
     1. Domain trust scoring (if URL provided)
     2. Claim extraction (spaCy + Gemini)
     3. Fact-check lookup (Google Fact Check API)
@@ -172,93 +178,238 @@ async def analyze_claim(
             detail="Either text or url must be provided"
         )
     
-    # Step 1: Domain Trust
-    domain_trust = score_domain(request.url)
+    # Steps 1-7: run the pipeline stages concurrently where inputs allow
+    result = await run_analysis(
+        request.text,
+        request.url,
+        language=request.language,
+        use_cache=not request.bypass_cache
+    )
     
-    # Step 2: Claim Extraction
-    input_text = request.text or ""
+    # Step 8: Save to Database
+    await save_analysis(db, result, current_user['user_id'], request)
     
-    # If URL provided but no text, use URL for claim extraction
-    # In production, you'd fetch the URL content here
-    if request.url and not input_text:
-        input_text = f"Content from: {request.url}"
+    return build_analyze_response(result)
+
+
+def format_sse(event: str, data) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/analyze/stream")
+async def analyze_claim_stream(
+    request: AnalyzeRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Analyze a claim, streaming each stage result as a Server-Sent Event.
     
-    claim_result = await extract_claims(input_text)
-    primary_claim = claim_result.get('primary_claim')
+    Events are emitted as soon as each stage completes: domain_trust, claim,
+    factcheck, one evidence event per article (with its stance),
+    stance_summary, verdict and explanation. The final ``complete`` event
+    carries the saved check id and the full analysis response; an ``error``
+    event is sent instead if the pipeline fails.
     
-    if not primary_claim:
-        # Use the input text as the claim if extraction fails
-        primary_claim = input_text[:500] if input_text else "Unknown claim"
+    Args:
+        request: Analysis request with text and/or URL
+        current_user: Authenticated user from JWT
+        
+    Returns:
+        text/event-stream response
+    """
+    if not request.text and not request.url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either text or url must be provided"
+        )
+    
+    queue: asyncio.Queue = asyncio.Queue()
     
-    # Step 3: Fact Check
-    factcheck_result = await search_factchecks(primary_claim)
+    def emit(event: str, data):
+        queue.put_nowait((event, data))
     
-    # Step 4: Evidence Retrieval
-    news_articles = await search_news(primary_claim, max_results=5)
+    async def run():
+        try:
+            result = await run_analysis(
+                request.text,
+                request.url,
+                language=request.language,
+                use_cache=not request.bypass_cache,
+                on_event=emit
+            )
+            
+            # The request-scoped session is closed once streaming starts, so use our own
+            async with async_session() as db:
+                check = await save_analysis(db, result, current_user['user_id'], request)
+            
+            emit("complete", {
+                "check_id": check.id,
+                "result": build_analyze_response(result).model_dump()
+            })
+        except Exception as e:
+            print(f"Streaming analysis error: {e}")
+            emit("error", {"detail": "Analysis failed"})
+        finally:
+            queue.put_nowait(None)
     
-    # Step 5: Stance Classification
-    articles_with_stance = await classify_all_stances(primary_claim, news_articles)
-    stance_summary = weighted_stance(articles_with_stance)
+    async def event_stream():
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                yield format_sse(*item)
+        finally:
+            # Stop the pipeline if the client disconnects early
+            if not task.done():
+                task.cancel()
     
-    # Step 6: Verdict Aggregation
-    verdict_result = aggregate_verdict(
-        factcheck_result=factcheck_result,
-        stance_summary=stance_summary,
-        domain_trust=domain_trust
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
     )
+
+
+@router.get("/cache/stats")
+async def cache_stats(current_user: dict = Depends(get_current_user)):
+    """
+    Report size and hit/miss counters for the analysis caches.
     
-    # Step 6b: LLM Fallback for inconclusive verdicts
-    # If no clear verdict from fact-checks/evidence, use LLM to assess obvious claims
-    if verdict_result.get('basis') in ['insufficient_evidence', 'mixed_evidence']:
-        llm_result = await llm_assess_claim(primary_claim)
-        if llm_result.get('used') and llm_result.get('verdict'):
-            # LLM provided a verdict - use it but mark confidence appropriately
-            verdict_result = {
-                'verdict': llm_result['verdict'],
-                'confidence': llm_result.get('confidence', 'medium'),
-                'basis': 'llm_assessment'
-            }
+    Args:
+        current_user: Authenticated user
+        
+    Returns:
+        Dict of cache name to stats
+    """
+    return {
+        "analysis": analysis_cache.stats(),
+        "news": news_cache.stats(),
+        "stance": stance_store.stats(),
+        "llm": llm_cache_stats(),
+        "similar_claims": claim_index_stats(),
+        "domains": domain_cache_stats(),
+        "learned_ratings": learned_rating_stats()
+    }
+
+
+async def save_analysis(
+    db: AsyncSession,
+    result: dict,
+    user_id: int,
+    request: AnalyzeRequest
+) -> Check:
+    """
+    Save a pipeline result as the user's Check row.
     
-    # Step 7: Explanation Generation
-    explanation = await generate_explanation({
-        'claim': primary_claim,
-        'verdict': verdict_result['verdict'],
-        'confidence': verdict_result['confidence'],
-        'factcheck': factcheck_result,
-        'stance_summary': stance_summary,
-        'domain_trust': domain_trust
-    })
+    Freshly computed results are also added to the similar claim index so
+    paraphrases of the same claim can reuse them.
     
-    # Step 8: Save to Database
-    check = Check(
-        user_id=current_user['user_id'],
-        input_text=request.text,
-        input_url=request.url,
-        claim=primary_claim,
+    Args:
+        db: Database session
+        result: Result dict from run_analysis
+        user_id: Owner of the check
+        request: Original analysis request
+        
+    Returns:
+        Saved Check instance
+    """
+    check = build_check(result, user_id, request.text, request.url)
+    
+    db.add(check)
+    await db.commit()
+    
+    if not result.get('cached'):
+        remember_analysis(result, request.text, request.url, request.language)
+    
+    return check
+
+
+def remember_analysis(result: dict, input_text: Optional[str], input_url: Optional[str], language: str):
+    """
+    Add a freshly computed analysis to the similar claim index.
+    
+    Degraded results are skipped, like in the analysis cache, and so are
+    URL-only submissions, whose claim was extracted from placeholder text.
+    
+    Args:
+        result: Result dict from run_analysis
+        input_text: Original text submitted by the user
+        input_url: Original URL submitted by the user
+        language: Language code of the request
+    """
+    if result.get('degraded') or not input_text:
+        return
+    
+    payload = {key: value for key, value in result.items() if key != 'timings'}
+    index_analysis(
+        [input_text, result['claim']],
+        payload,
+        url_domain=extract_domain(input_url) if input_url else None,
+        language=language
+    )
+
+
+def build_check(result: dict, user_id: int, input_text: Optional[str], input_url: Optional[str]) -> Check:
+    """
+    Build a Check row from a pipeline result.
+    
+    Args:
+        result: Result dict from run_analysis
+        user_id: Owner of the check
+        input_text: Original text submitted by the user
+        input_url: Original URL submitted by the user
+        
+    Returns:
+        Unsaved Check instance
+    """
+    domain_trust = result['domain_trust']
+    factcheck_result = result['factcheck']
+    
+    return Check(
+        user_id=user_id,
+        input_text=input_text,
+        input_url=input_url,
+        claim=result['claim'],
         domain_score=domain_trust.get('score'),
         factcheck_rating=factcheck_result.get('rating'),
         factcheck_summary=factcheck_result.get('summary'),
-        stance_summary=stance_summary,
-        verdict=verdict_result['verdict'],
-        confidence=verdict_result['confidence'],
-        explanation=explanation,
+        stance_summary=result['stance_summary'],
+        verdict=result['verdict'],
+        confidence=result['confidence'],
+        explanation=result['explanation'],
         pipeline_version=settings.pipeline_version
     )
+
+
+def build_analyze_response(result: dict) -> AnalyzeResponse:
+    """
+    Convert a pipeline result into the API response model.
     
-    db.add(check)
-    await db.commit()
-    
-    # Build response
-    counts = stance_summary.get('counts', {})
+    Args:
+        result: Result dict from run_analysis
+        
+    Returns:
+        AnalyzeResponse
+    """
+    domain_trust = result['domain_trust']
+    factcheck_result = result['factcheck']
+    counts = result['stance_summary'].get('counts', {})
     
     return AnalyzeResponse(
-        claim=primary_claim,
-        verdict=verdict_result['verdict'],
-        confidence=verdict_result['confidence'],
+        claim=result['claim'],
+        verdict=result['verdict'],
+        confidence=result['confidence'],
         domain_trust=DomainTrustResponse(
             domain=domain_trust.get('domain'),
             score=domain_trust.get('score', 'unknown'),
-            category=domain_trust.get('category', 'unknown')
+            category=domain_trust.get('category', 'unknown'),
+            matched_rule=domain_trust.get('matched_rule')
         ),
         factcheck=FactCheckResponse(
             found=factcheck_result.get('found', False),
@@ -276,7 +427,7 @@ async def analyze_claim(
                 source=article.get('source'),
                 stance=article.get('stance', 'UNRELATED')
             )
-            for article in articles_with_stance
+            for article in result['articles']
         ],
         stance_summary=StanceSummary(
             supports=counts.get('SUPPORTS', 0),
@@ -284,5 +435,12 @@ async def analyze_claim(
             discuss=counts.get('DISCUSS', 0),
             unrelated=counts.get('UNRELATED', 0)
         ),
-        explanation=explanation
+        explanation=result['explanation'],
+        timings={
+            name: timing['duration_ms']
+            for name, timing in result.get('timings', {}).items()
+        },
+        cached=result.get('cached', False),
+        similar_claim=result.get('similar_claim'),
+        similarity=result.get('similarity')
     )
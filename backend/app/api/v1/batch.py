@@ -0,0 +1,263 @@
+"""
+TruthLens Batch Analyze API v1
+
+Analyzes many claims in one request. Identical claims within a batch are
+analyzed once, pipelines run under a process-wide concurrency limit, and
+all Check rows are inserted in a single transaction.
+"""
+
+import asyncio
+import json
+from typing import Callable, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.security import get_current_user
+from app.api.v1.analyze import (
+    AnalyzeResponse,
+    build_analyze_response,
+    build_check,
+    remember_analysis,
+)
+from app.services import run_analysis
+from app.services.pipeline import build_input_text
+from app.services.result_cache import analysis_cache_key
+
+
+router = APIRouter(prefix="/api/v1", tags=["Analysis"])
+
+# Process-wide limit on batch pipelines in flight (created lazily)
+_batch_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_batch_semaphore() -> asyncio.Semaphore:
+    global _batch_semaphore
+    if _batch_semaphore is None:
+        _batch_semaphore = asyncio.Semaphore(max(1, settings.batch_max_concurrency))
+    return _batch_semaphore
+
+
+# Request/Response Schemas
+class BatchItem(BaseModel):
+    """Single claim in a batch."""
+    id: Optional[str] = Field(None, description="Caller-supplied identifier echoed in the result")
+    text: Optional[str] = Field(None, description="Claim or article text to analyze")
+    url: Optional[str] = Field(None, description="URL of the article to analyze")
+
+
+class BatchAnalyzeRequest(BaseModel):
+    """Batch analysis request payload."""
+    items: List[BatchItem]
+    language: str = Field("en", description="Language code for all items")
+    bypass_cache: bool = Field(False, description="Re-run the full pipeline even if cached results exist")
+    stream: bool = Field(False, description="Stream per-item results as NDJSON while the batch runs")
+
+
+class BatchItemResult(BaseModel):
+    """Result for one batch item."""
+    index: int
+    id: Optional[str] = None
+    check_id: Optional[int] = None
+    result: Optional[AnalyzeResponse] = None
+    error: Optional[str] = None
+
+
+class BatchAnalyzeResponse(BaseModel):
+    """Batch analysis response."""
+    items: List[BatchItemResult]
+    total: int
+    unique: int
+    failed: int
+
+
+def _group_items(request: BatchAnalyzeRequest) -> Dict[tuple, List[int]]:
+    """Group item indexes by analysis cache key so duplicates run once."""
+    groups: Dict[tuple, List[int]] = {}
+    for index, item in enumerate(request.items):
+        key = analysis_cache_key(build_input_text(item.text, item.url), item.url, request.language)
+        if key is None:
+            continue
+        groups.setdefault(key, []).append(index)
+    return groups
+
+
+async def _run_group(item: BatchItem, request: BatchAnalyzeRequest) -> Dict:
+    async with _get_batch_semaphore():
+        return await run_analysis(
+            item.text,
+            item.url,
+            language=request.language,
+            use_cache=not request.bypass_cache
+        )
+
+
+async def _save_results(
+    request: BatchAnalyzeRequest,
+    results: Dict[int, Dict],
+    user_id: int
+) -> Dict[int, int]:
+    """
+    Insert one Check row per successful item in a single transaction.
+
+    Returns:
+        Mapping of item index to saved check id
+    """
+    checks = {
+        index: build_check(result, user_id, request.items[index].text, request.items[index].url)
+        for index, result in results.items()
+    }
+    if not checks:
+        return {}
+
+    async with async_session() as db:
+        db.add_all(list(checks.values()))
+        await db.commit()
+
+    return {index: check.id for index, check in checks.items()}
+
+
+def _remember_results(request: BatchAnalyzeRequest, groups: Dict[tuple, List[int]], results: Dict[int, Dict]):
+    """
+    Add freshly computed results to the similar claim index, once per group.
+
+    Called only after the Check rows are committed, as in save_analysis.
+    """
+    for indexes in groups.values():
+        result = results.get(indexes[0])
+        if result is not None and not result.get('cached'):
+            first = request.items[indexes[0]]
+            remember_analysis(result, first.text, first.url, request.language)
+
+
+@router.post("/analyze/batch")
+async def analyze_batch(
+    request: BatchAnalyzeRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Analyze many claims or URLs in one request.
+
+    Identical claims (same canonical text, URL domain and language) are
+    analyzed once and the result shared. With ``stream=true`` the response
+    is NDJSON: one line per item as soon as its analysis finishes (without
+    check ids), then a final summary line with the saved check ids.
+
+    Args:
+        request: Batch of items with text and/or URL
+        current_user: Authenticated user from JWT
+
+    Returns:
+        BatchAnalyzeResponse, or an application/x-ndjson stream
+    """
+    if not request.items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one item must be provided"
+        )
+
+    if len(request.items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch may contain at most {settings.batch_max_items} items"
+        )
+
+    user_id = current_user['user_id']
+    groups = _group_items(request)
+    grouped = {index for indexes in groups.values() for index in indexes}
+    errors = {
+        index: "Either text or url must be provided"
+        for index in range(len(request.items))
+        if index not in grouped
+    }
+
+    async def run_batch(on_item: Optional[Callable[[int, Optional[Dict]], None]] = None) -> Dict[int, Dict]:
+        """Run each unique claim once; on_item is called per item as it finishes."""
+        results: Dict[int, Dict] = {}
+
+        async def run_one(indexes: List[int]):
+            first = request.items[indexes[0]]
+            try:
+                result = await _run_group(first, request)
+            except Exception as e:
+                print(f"Batch analysis error: {e}")
+                result = None
+
+            for index in indexes:
+                if result is None:
+                    errors[index] = "Analysis failed"
+                else:
+                    results[index] = result
+                if on_item is not None:
+                    on_item(index, result)
+
+        await asyncio.gather(*(run_one(indexes) for indexes in groups.values()))
+        return results
+
+    def item_result(index: int, result: Optional[Dict], check_id: Optional[int] = None) -> BatchItemResult:
+        return BatchItemResult(
+            index=index,
+            id=request.items[index].id,
+            check_id=check_id,
+            result=build_analyze_response(result) if result else None,
+            error=errors.get(index)
+        )
+
+    if not request.stream:
+        results = await run_batch()
+        check_ids = await _save_results(request, results, user_id)
+        _remember_results(request, groups, results)
+
+        return BatchAnalyzeResponse(
+            items=[
+                item_result(index, results.get(index), check_ids.get(index))
+                for index in range(len(request.items))
+            ],
+            total=len(request.items),
+            unique=len(groups),
+            failed=len(errors)
+        )
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(index: int, result: Optional[Dict]):
+        queue.put_nowait(item_result(index, result).model_dump_json() + "\n")
+
+    async def produce():
+        try:
+            for index in list(errors):
+                emit(index, None)
+
+            results = await run_batch(on_item=emit)
+            check_ids = await _save_results(request, results, user_id)
+            _remember_results(request, groups, results)
+
+            queue.put_nowait(json.dumps({
+                "done": True,
+                "total": len(request.items),
+                "unique": len(groups),
+                "failed": len(errors),
+                "check_ids": {str(index): check_id for index, check_id in check_ids.items()}
+            }) + "\n")
+        except Exception as e:
+            print(f"Batch streaming error: {e}")
+            queue.put_nowait(json.dumps({"done": True, "error": "Batch failed"}) + "\n")
+        finally:
+            queue.put_nowait(None)
+
+    async def ndjson_stream():
+        task = asyncio.create_task(produce())
+        try:
+            while True:
+                line = await queue.get()
+                if line is None:
+                    break
+                yield line
+        finally:
+            # Stop the batch if the client disconnects early
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
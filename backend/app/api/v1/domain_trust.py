@@ -0,0 +1,130 @@
+"""
+TruthLens Domain Trust API v1
+
+Scores one domain (a cacheable GET) or many URLs in one request, e.g.
+every outbound link on a page.
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.core.security import get_current_user
+from app.services.domain_trust import extract_domain, score_domain, score_domain_name
+
+
+router = APIRouter(prefix="/api/v1/domain-trust", tags=["Domain Trust"])
+
+
+# Request/Response Schemas
+class DomainTrustBatchRequest(BaseModel):
+    """Batch domain trust request payload."""
+    urls: List[str] = Field(..., description="URLs to score")
+
+
+class DomainTrustResult(BaseModel):
+    """Trust information for one URL's domain."""
+    domain: Optional[str]
+    score: str
+    trust_score: int
+    category: str
+    label: str
+    reason: str
+    matched_rule: Optional[str] = None
+
+
+class DomainTrustBatchResponse(BaseModel):
+    """Batch domain trust response, keyed by the submitted URL."""
+    results: Dict[str, DomainTrustResult]
+    domains: int
+
+
+@router.get("", response_model=DomainTrustResult)
+async def get_domain_trust(
+    response: Response,
+    domain: str = Query(..., description="Domain or URL to score"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Score a single domain.
+
+    The response carries an ETag and Cache-Control header so browsers and
+    extensions can reuse it; a matching If-None-Match returns 304.
+
+    Args:
+        response: Response used to set caching headers
+        domain: Domain (``news.example.com``) or URL to score
+        if_none_match: ETag from a previous response
+        current_user: Authenticated user from JWT
+
+    Returns:
+        Trust result for the domain
+    """
+    url = domain.strip()
+    if '://' not in url:
+        url = f"https://{url}"
+
+    result = score_domain(url)
+    etag = '"' + hashlib.sha1(json.dumps(result, sort_keys=True).encode('utf-8')).hexdigest() + '"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={settings.domain_trust_cache_seconds}",
+        "Vary": "Authorization"
+    }
+
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(',')]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return result
+
+
+@router.post("/batch", response_model=DomainTrustBatchResponse)
+async def score_domains_batch(
+    request: DomainTrustBatchRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Score the domains of many URLs in one pass.
+
+    URLs are deduplicated by extracted domain, so each domain is looked up
+    once however many links point to it. POST responses are not cacheable;
+    use GET /api/v1/domain-trust for a cacheable single lookup.
+
+    Args:
+        request: URLs to score
+        current_user: Authenticated user from JWT
+
+    Returns:
+        Trust results keyed by URL, and the number of distinct domains
+    """
+    if not request.urls:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one URL must be provided"
+        )
+
+    if len(request.urls) > settings.domain_trust_batch_max_urls:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch may contain at most {settings.domain_trust_batch_max_urls} URLs"
+        )
+
+    by_domain: Dict[str, dict] = {}
+    results: Dict[str, dict] = {}
+
+    for url in dict.fromkeys(request.urls):
+        domain = extract_domain(url) if url else None
+        if domain is None:
+            # No URL / invalid URL results
+            results[url] = score_domain(url)
+            continue
+        if domain not in by_domain:
+            by_domain[domain] = score_domain_name(domain)
+        results[url] = by_domain[domain]
+
+    return {"results": results, "domains": len(by_domain)}
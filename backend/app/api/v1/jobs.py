@@ -0,0 +1,153 @@
+"""
+TruthLens Jobs API v1
+
+Asynchronous analysis: submit a job, get an id back immediately, and poll
+for its status. Status is read from the job's database row, so any API
+worker can answer a poll; results are read from the saved Check row.
+"""
+
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db, async_session
+from app.core.security import get_current_user
+from app.models.check import Check
+from app.models.job import AnalysisJob
+from app.api.v1.analyze import AnalyzeRequest, save_analysis
+from app.api.v1.history import HistoryDetailResponse
+from app.services import run_analysis
+from app.services.jobs import Job, QueueFullError, get_job_status, job_manager
+
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["Jobs"])
+
+
+# Request/Response Schemas
+class JobSubmitRequest(AnalyzeRequest):
+    """Analysis job submission payload."""
+    priority: Literal["interactive", "bulk"] = Field(
+        "interactive",
+        description="Priority lane; interactive jobs run before bulk ones"
+    )
+
+
+class JobResponse(BaseModel):
+    """Job status."""
+    job_id: str
+    status: str
+    priority: str
+    check_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[HistoryDetailResponse] = None
+
+
+async def process_analysis_job(job: Job) -> int:
+    """
+    Run the pipeline for a queued job and save its Check row.
+
+    Args:
+        job: Job whose payload is a JobSubmitRequest
+
+    Returns:
+        Id of the saved check
+    """
+    request: JobSubmitRequest = job.payload
+    result = await run_analysis(
+        request.text,
+        request.url,
+        language=request.language,
+        use_cache=not request.bypass_cache
+    )
+
+    async with async_session() as db:
+        check = await save_analysis(db, result, job.user_id, request)
+
+    return check.id
+
+
+def build_job_response(job: AnalysisJob, check: Optional[Check] = None) -> JobResponse:
+    """Convert a job row (and its saved check, if any) into the API response."""
+    return JobResponse(
+        job_id=job.id,
+        status=job.status,
+        priority=job.priority,
+        check_id=job.check_id,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=HistoryDetailResponse.model_validate(check) if check else None
+    )
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(
+    request: JobSubmitRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Queue a claim or URL for analysis and return immediately.
+
+    Args:
+        request: Analysis request with text and/or URL and a priority lane
+        current_user: Authenticated user from JWT
+
+    Returns:
+        Queued job status; poll GET /api/v1/jobs/{job_id} for the result
+    """
+    if not request.text and not request.url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either text or url must be provided"
+        )
+
+    try:
+        job = await job_manager.submit(current_user['user_id'], request, request.priority)
+    except (QueueFullError, RuntimeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+
+    return JobResponse(job_id=job.id, status="queued", priority=job.priority, created_at=job.created_at)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the status of an analysis job, including the saved check once completed.
+
+    Args:
+        job_id: Id returned by POST /api/v1/jobs
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Job status and result
+    """
+    job = await get_job_status(job_id)
+
+    if not job or job.user_id != current_user['user_id']:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    check = None
+    if job.check_id is not None:
+        query = select(Check).where(Check.id == job.check_id, Check.user_id == job.user_id)
+        result = await db.execute(query)
+        check = result.scalar_one_or_none()
+
+    return build_job_response(job, check)
@@ -0,0 +1,131 @@
+"""
+TruthLens Learned Ratings API v1
+
+Review and export of the fact-check rating interpretations learned from the
+LLM fallback, so wrong promotions can be spotted and removed.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel
+
+from app.core.security import get_current_user
+from app.services.rating_learning import forget_learned_rating, list_learned_ratings
+
+
+router = APIRouter(prefix="/api/v1/ratings", tags=["Ratings"])
+
+EXPORT_COLUMNS = [
+    "publisher", "rating", "original_rating", "verdict", "counts", "sightings",
+    "promoted", "created_at", "updated_at", "promoted_at"
+]
+
+
+# Response Schemas
+class LearnedRatingResponse(BaseModel):
+    """One publisher's textual rating and how the LLM interpreted it."""
+    id: int
+    publisher: str
+    rating: str
+    original_rating: Optional[str]
+    verdict: str
+    counts: Dict[str, int]
+    sightings: int
+    promoted: bool
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    promoted_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class LearnedRatingListResponse(BaseModel):
+    """Learned rating list response."""
+    items: List[LearnedRatingResponse]
+    total: int
+
+
+@router.get("/learned", response_model=LearnedRatingListResponse)
+async def get_learned_ratings(
+    promoted: Optional[bool] = None,
+    publisher: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    List learned ratings, most seen first.
+
+    Args:
+        promoted: Only promoted (true) or only pending (false) entries
+        publisher: Only entries of this fact-checking organization
+        skip: Number of items to skip (pagination)
+        limit: Maximum items to return
+        current_user: Authenticated user
+
+    Returns:
+        Learned ratings and the total number matching the filters
+    """
+    items, total = await list_learned_ratings(promoted, publisher, limit, skip)
+    return LearnedRatingListResponse(
+        items=[LearnedRatingResponse.model_validate(item) for item in items],
+        total=total
+    )
+
+
+@router.get("/learned/export")
+async def export_learned_ratings(
+    promoted: Optional[bool] = None,
+    publisher: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Download learned ratings as CSV.
+
+    Args:
+        promoted: Only promoted (true) or only pending (false) entries
+        publisher: Only entries of this fact-checking organization
+        current_user: Authenticated user
+
+    Returns:
+        CSV attachment with one row per learned rating
+    """
+    items, _ = await list_learned_ratings(promoted, publisher)
+
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(EXPORT_COLUMNS)
+    for item in items:
+        row = LearnedRatingResponse.model_validate(item).model_dump(mode="json")
+        row["counts"] = json.dumps(row["counts"], sort_keys=True)
+        writer.writerow([row[column] for column in EXPORT_COLUMNS])
+
+    return Response(
+        content=output.getvalue(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="learned_ratings.csv"'}
+    )
+
+
+@router.delete("/learned/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_learned_rating(
+    entry_id: int,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Forget a learned rating; the LLM interprets it again from scratch.
+
+    Args:
+        entry_id: ID of the learned rating
+        current_user: Authenticated user
+    """
+    if not await forget_learned_rating(entry_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Learned rating not found"
+        )
@@ -0,0 +1,305 @@
+"""
+TruthLens Command Line Interface
+
+Offline tools that run the analysis pipeline without the HTTP API.
+
+Usage:
+    python -m app.cli verify claims.jsonl -o results.jsonl
+    python -m app.cli verify claims.csv -o results.jsonl --concurrency 32 --workers 4
+    python -m app.cli verify claims.jsonl -o results.jsonl --save
+    python -m app.cli build-domain-store reputation.csv -o data/domain_trust.bin
+
+``verify`` streams claims from a JSONL or CSV file (fields: text, url, and
+optionally id and language), runs spaCy candidate extraction in the shared
+worker process pool and the upstream calls concurrently on the event loop,
+and appends one JSON line per input line to the output file as soon as it
+finishes.
+Re-running with the same output file skips lines that already completed,
+so an interrupted run resumes where it stopped. No database is needed
+unless ``--save`` is given, which persists fact-check lookups and learned
+ratings in DATABASE_URL for later runs and the API.
+
+``build-domain-store`` compiles a domain trust CSV into the memory-mapped
+store format. The output is replaced atomically, so running API workers
+pick up the new file on their next reload check.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.database import init_db
+from app.core.http_client import init_http_client, close_http_client
+from app.services.claim_extractor import nlp_pool
+from app.services.domain_store import DomainStoreError, build_domain_store_from_csv
+from app.services.llm_gateway import init_llm_models, shutdown_llm_gateway
+from app.services.pipeline import run_analysis
+
+
+def read_records(path: Path) -> Iterator[Tuple[int, Optional[Dict]]]:
+    """
+    Stream input records with their line index.
+
+    JSONL line indexes count every line of the file (blank lines are
+    skipped); CSV indexes count data rows. Lines that cannot be parsed are
+    yielded as None so they are reported instead of silently dropped.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.suffix.lower() == '.csv':
+            for index, row in enumerate(csv.DictReader(f)):
+                yield index, row
+            return
+
+        for index, line in enumerate(f):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                yield index, None
+                continue
+            yield index, record if isinstance(record, dict) else None
+
+
+def load_completed(path: Path) -> Set[int]:
+    """
+    Return the line indexes that already have a successful result in an output file.
+
+    Failed lines are not included, so they are retried on the next run.
+    """
+    completed: Set[int] = set()
+    if not path.exists():
+        return completed
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Partially written line from an interrupted run
+                continue
+            if not isinstance(entry, dict) or 'line' not in entry:
+                continue
+            if entry.get('error'):
+                completed.discard(entry['line'])
+            else:
+                completed.add(entry['line'])
+
+    return completed
+
+
+class Progress:
+    """Counts processed lines and reports throughput."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.done = 0
+        self.failed = 0
+        self.skipped = 0
+        self.cached = 0
+
+    def record(self, failed: bool = False, cached: bool = False):
+        self.done += 1
+        self.failed += failed
+        self.cached += cached
+
+    def summary(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        return (
+            f"{self.done} processed ({self.failed} failed, {self.cached} cached), "
+            f"{self.skipped} skipped | {rate:.2f} claims/s | {elapsed:.1f}s elapsed"
+        )
+
+
+async def _report_progress(progress: Progress, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        print(f"[verify] {progress.summary()}", file=sys.stderr, flush=True)
+
+
+async def verify_file(
+    input_path: Path,
+    output_path: Path,
+    concurrency: int = 16,
+    workers: int = 2,
+    language: str = 'en',
+    use_cache: bool = True,
+    progress_interval: float = 10.0,
+    save: bool = False
+) -> Progress:
+    """
+    Verify every claim in an input file and append results to a JSONL file.
+
+    Args:
+        input_path: JSONL or CSV file of claims
+        output_path: JSONL file results are appended to
+        concurrency: Maximum pipelines in flight
+        workers: spaCy worker processes (0 extracts in a thread)
+        language: Default language for records without one
+        use_cache: Whether to reuse cached analyses
+        progress_interval: Seconds between progress reports on stderr
+        save: Persist fact-check lookups and learned ratings in the database;
+            without it the database is never touched
+
+    Returns:
+        Final progress counters
+    """
+    if save:
+        await init_db()
+    else:
+        # The database-backed stores are the pipeline's only database use
+        settings.factcheck_cache_enabled = False
+        settings.rating_learning_enabled = False
+    init_llm_models()
+    await init_http_client()
+    await nlp_pool.start(workers)
+
+    completed = load_completed(output_path)
+    progress = Progress()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    pending: Set[asyncio.Task] = set()
+    reporter = asyncio.create_task(_report_progress(progress, progress_interval))
+
+    # Start on a fresh line if the previous run stopped mid-write
+    needs_newline = output_path.exists() and output_path.stat().st_size > 0
+    if needs_newline:
+        with open(output_path, 'rb') as f:
+            f.seek(-1, 2)
+            needs_newline = f.read(1) != b'\n'
+
+    out = open(output_path, 'a', encoding='utf-8')
+    if needs_newline:
+        out.write('\n')
+
+    def write(entry: Dict):
+        out.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+        out.flush()
+
+    async def verify_one(index: int, record: Optional[Dict]):
+        try:
+            if record is None:
+                raise ValueError("Unparseable input line")
+
+            text = record.get('text') or None
+            url = record.get('url') or None
+            if not text and not url:
+                raise ValueError("Either text or url must be provided")
+
+            result = await run_analysis(
+                text,
+                url,
+                language=record.get('language') or language,
+                use_cache=use_cache
+            )
+            write({'line': index, 'id': record.get('id'), 'text': text, 'url': url, 'result': result})
+            progress.record(cached=result.get('cached', False))
+        except Exception as e:
+            print(f"Line {index} failed: {e}", file=sys.stderr)
+            write({'line': index, 'id': (record or {}).get('id'), 'error': str(e)})
+            progress.record(failed=True)
+        finally:
+            semaphore.release()
+
+    try:
+        for index, record in read_records(input_path):
+            if index in completed:
+                progress.skipped += 1
+                continue
+
+            await semaphore.acquire()
+            task = asyncio.create_task(verify_one(index, record))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        await asyncio.gather(*pending)
+    finally:
+        reporter.cancel()
+        out.close()
+        await nlp_pool.shutdown()
+        await close_http_client()
+        shutdown_llm_gateway()
+
+    return progress
+
+
+def _verify_command(args: argparse.Namespace) -> int:
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Input file not found: {input_path}", file=sys.stderr)
+        return 1
+
+    progress = asyncio.run(verify_file(
+        input_path,
+        Path(args.output),
+        concurrency=args.concurrency,
+        workers=args.workers,
+        language=args.language,
+        use_cache=not args.no_cache,
+        progress_interval=args.progress_interval,
+        save=args.save
+    ))
+    print(f"[verify] done: {progress.summary()}", file=sys.stderr)
+    return 1 if progress.failed else 0
+
+
+def _build_domain_store_command(args: argparse.Namespace) -> int:
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Input file not found: {input_path}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    try:
+        count = build_domain_store_from_csv(input_path, Path(args.output))
+    except (DomainStoreError, OSError, KeyError, ValueError) as e:
+        print(f"Failed to build domain store: {e}", file=sys.stderr)
+        return 1
+
+    size_mb = Path(args.output).stat().st_size / (1024 * 1024)
+    print(f"Wrote {count} domains to {args.output} ({size_mb:.1f} MB) in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m app.cli', description="TruthLens offline tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    verify = commands.add_parser('verify', help="Verify claims from a JSONL or CSV file")
+    verify.add_argument('input', help="JSONL or CSV file with text/url (and optional id, language) fields")
+    verify.add_argument('-o', '--output', required=True, help="JSONL file results are appended to (resumable)")
+    verify.add_argument('--concurrency', type=int, default=16, help="Pipelines in flight (default: 16)")
+    verify.add_argument('--workers', type=int, default=2,
+                        help="spaCy worker processes; 0 extracts in a thread (default: 2)")
+    verify.add_argument('--language', default='en', help="Default language code (default: en)")
+    verify.add_argument('--no-cache', action='store_true', help="Re-run the pipeline even for cached claims")
+    verify.add_argument('--save', action='store_true',
+                        help="Persist fact-check lookups and learned ratings in DATABASE_URL "
+                             "(default: run without a database)")
+    verify.add_argument('--progress-interval', type=float, default=10.0,
+                        help="Seconds between throughput reports (default: 10)")
+    verify.set_defaults(func=_verify_command)
+
+    store = commands.add_parser('build-domain-store', help="Compile a domain trust CSV into the binary store")
+    store.add_argument('input', nargs='?', default=settings.domain_trust_csv_path,
+                       help="CSV with domain, trust_level, category, score, label, notes columns")
+    store.add_argument('-o', '--output', default=settings.domain_trust_store_path,
+                       help=f"Store file to write (default: {settings.domain_trust_store_path})")
+    store.set_defaults(func=_build_domain_store_command)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
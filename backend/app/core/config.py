@@ -38,10 +38,93 @@ class Settings(BaseSettings):
     
     # Data paths
     domain_trust_csv_path: str = "data/domain_trust_seed.csv"
+    # Compiled store (python -m app.cli build-domain-store); used instead of the CSV when present
+    domain_trust_store_path: str = "data/domain_trust.bin"
+    domain_trust_reload_interval: float = 5.0  # Seconds between checks for a replaced store file
+    domain_trust_batch_max_urls: int = 1000
+    domain_cache_size: int = 100000  # LRU entries for URL -> domain and domain -> trust lookups
+    domain_trust_cache_seconds: int = 3600  # Cache-Control max-age for GET /api/v1/domain-trust
     
     # Pipeline versioning
     pipeline_version: str = "0.1.0"
     
+    # Stance classification concurrency
+    stance_max_concurrency: int = 16  # Gemini stance calls in flight per process
+    stance_request_concurrency: int = 5  # Gemini stance calls in flight per request
+    
+    # Stance memoization per (claim, article) pair
+    stance_store_enabled: bool = True
+    stance_store_size: int = 50000  # entries
+    stance_store_ttl_seconds: int = 7 * 24 * 3600
+    
+    # LLM gateway
+    llm_max_concurrency: int = 32  # Gemini calls in flight per process
+    llm_thread_pool_size: int = 8  # Threads for SDK calls without an async API
+    llm_timeout_seconds: float = 30.0
+    
+    # Shared HTTP client for upstream APIs
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0  # seconds
+    http_enable_http2: bool = False  # Requires the optional 'h2' package
+    http_default_timeout: float = 10.0
+    factcheck_timeout_seconds: float = 10.0
+    gnews_timeout_seconds: float = 10.0
+    
+    # End-to-end analysis result cache
+    analysis_cache_enabled: bool = True
+    analysis_cache_size: int = 5000  # entries
+    analysis_cache_ttl_seconds: int = 6 * 3600
+    
+    # Persistent Fact Check API cache
+    factcheck_cache_enabled: bool = True
+    factcheck_cache_positive_ttl_hours: int = 7 * 24  # Fact-check found
+    factcheck_cache_negative_ttl_hours: int = 12  # No fact-check found
+    
+    # Learned fact-check ratings (LLM interpretations per publisher and textual rating)
+    rating_learning_enabled: bool = True
+    rating_learning_promote_after: int = 3  # Identical interpretations before the LLM is skipped
+    rating_learning_max_samples: int = 10  # Give up on a rating still inconsistent after this many
+    
+    # GNews evidence cache (stale-while-revalidate)
+    news_cache_enabled: bool = True
+    news_cache_size: int = 2000  # entries
+    news_cache_fresh_seconds: int = 30 * 60  # Served without refresh
+    news_cache_stale_seconds: int = 6 * 3600  # Served while refreshing in background
+    
+    # LLM response cache (keyed by model, generation config and prompt)
+    llm_cache_enabled: bool = True
+    llm_cache_size: int = 20000  # entries
+    llm_cache_ttl_seconds: int = 24 * 3600
+    
+    # Near-duplicate claim index (MinHash/LSH over analyzed claims)
+    claim_index_enabled: bool = True
+    claim_index_threshold: float = 0.7  # Minimum Jaccard similarity of content words
+    claim_index_max_entries: int = 50000
+    claim_index_ttl_seconds: int = 6 * 3600  # Matches analysis_cache_ttl_seconds
+    claim_index_num_perm: int = 64
+    claim_index_bands: int = 16
+    
+    # Background analysis jobs
+    jobs_workers: int = 4  # Concurrent pipeline workers per process
+    jobs_max_queue_size: int = 1000  # Pending jobs before submissions are rejected
+    jobs_retention_seconds: int = 6 * 3600  # Finished job rows kept for polling
+    
+    # Batch analysis
+    batch_max_items: int = 500
+    batch_max_concurrency: int = 8  # Batch pipelines in flight per process
+    
+    # Startup warm-up
+    warmup_parallel: bool = True
+    warmup_fail_fast: bool = True  # Refuse to start if a required resource (e.g. spaCy model) fails to load
+    
+    # Claim extraction (spaCy)
+    nlp_model: str = "en_core_web_sm"
+    nlp_mode: str = "full"  # full, parser, senter or sentencizer; the lighter modes are opt-in
+    nlp_pool_workers: int = 2  # 0 runs spaCy in a thread of the API process
+    nlp_batch_size: int = 32  # Texts per nlp.pipe call
+    nlp_batch_window_ms: float = 5.0  # How long to wait for more texts before dispatching a batch
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
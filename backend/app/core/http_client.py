@@ -0,0 +1,73 @@
+"""
+TruthLens HTTP Client Module
+
+Provides a shared, pooled httpx client for upstream APIs (Fact Check, GNews).
+"""
+
+from typing import Optional
+import httpx
+
+from app.core.config import settings
+
+
+# Shared client (created at startup or lazily on first use)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client from settings.
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    http2 = settings.http_enable_http2
+    if http2 and not _http2_available():
+        print("HTTP/2 requested but 'h2' is not installed; falling back to HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry
+        ),
+        timeout=httpx.Timeout(settings.http_default_timeout),
+        http2=http2
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it if startup has not run
+    (e.g. in scripts).
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def init_http_client():
+    """Create the shared HTTP client at application startup."""
+    get_http_client()
+
+
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
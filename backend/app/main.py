@@ -4,15 +4,27 @@ TruthLens Backend API
 FastAPI application for misinformation analysis.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.database import init_db
+from app.core.http_client import close_http_client
 from app.api.auth.auth import router as auth_router
 from app.api.v1.analyze import router as analyze_router
+from app.api.v1.batch import router as batch_router
+from app.api.v1.domain_trust import router as domain_trust_router
 from app.api.v1.history import router as history_router
+from app.api.v1.jobs import router as jobs_router, process_analysis_job
+from app.api.v1.ratings import router as ratings_router
+from app.services.claim_extractor import nlp_pool
+from app.services.factcheck_cache import prune_factcheck_cache_periodically
+from app.services.llm_gateway import shutdown_llm_gateway
+from app.services.jobs import job_manager
+from app.services.warmup import readiness, warm_up
 
 
 @asynccontextmanager
@@ -22,9 +34,26 @@ async def lifespan(app: FastAPI):
     await init_db()
     print("Database initialized")
     
+    # Startup: Load spaCy workers, domain trust data, Gemini client and
+    # upstream connection pool before taking traffic
+    await warm_up()
+    print(f"Warm-up finished: {readiness.status}")
+    
+    # Startup: Launch background analysis workers
+    job_manager.start(process_analysis_job)
+    
+    # Startup: Delete expired fact-check cache rows in the background
+    factcheck_pruner = asyncio.create_task(prune_factcheck_cache_periodically())
+    
     yield
     
     # Shutdown: Cleanup if needed
+    factcheck_pruner.cancel()
+    await asyncio.gather(factcheck_pruner, return_exceptions=True)
+    await job_manager.stop()
+    await nlp_pool.shutdown()
+    await close_http_client()
+    shutdown_llm_gateway()
     print("Application shutting down")
 
 
@@ -48,7 +77,11 @@ app.add_middleware(
 # Include routers
 app.include_router(auth_router)
 app.include_router(analyze_router)
+app.include_router(batch_router)
+app.include_router(domain_trust_router)
 app.include_router(history_router)
+app.include_router(jobs_router)
+app.include_router(ratings_router)
 
 
 @app.get("/")
@@ -65,3 +98,12 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe - returns 200 only once models and data are warm."""
+    return JSONResponse(
+        status_code=200 if readiness.ready else 503,
+        content=readiness.to_dict()
+    )
@@ -6,5 +6,8 @@ Exports all database models.
 
 from app.models.user import User
 from app.models.check import Check
+from app.models.factcheck_cache import FactCheckCache
+from app.models.rating_interpretation import RatingInterpretation
+from app.models.job import AnalysisJob
 
-__all__ = ["User", "Check"]
+__all__ = ["User", "Check", "FactCheckCache", "RatingInterpretation", "AnalysisJob"]
@@ -0,0 +1,37 @@
+"""
+TruthLens Fact-Check Cache Model
+
+SQLAlchemy model for persisting Google Fact Check API lookups.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, UniqueConstraint
+
+from app.core.database import Base
+
+
+class FactCheckCache(Base):
+    """Cached fact-check lookup result for a normalized query."""
+
+    __tablename__ = "factcheck_cache"
+    __table_args__ = (
+        UniqueConstraint("query_hash", "language", name="uq_factcheck_cache_query_language"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Lookup key
+    query_hash = Column(String(64), nullable=False, index=True)  # sha256 of normalized query
+    language = Column(String(10), nullable=False, default="en")
+    query = Column(Text, nullable=False)  # Normalized query, kept for inspection
+
+    # Parsed result (same shape as search_factchecks output, incl. original_rating)
+    found = Column(Boolean, nullable=False, default=False)
+    result = Column(JSON, nullable=False)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<FactCheckCache(id={self.id}, found={self.found}, language={self.language})>"
@@ -0,0 +1,33 @@
+"""
+TruthLens Analysis Job Model
+
+SQLAlchemy model for the status of asynchronous analysis jobs.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+
+from app.core.database import Base
+
+
+class AnalysisJob(Base):
+    """Status of a queued analysis job, readable by every API worker."""
+
+    __tablename__ = "analysis_jobs"
+
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    priority = Column(String(20), nullable=False, default="interactive")
+
+    # Lifecycle
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, completed, failed
+    check_id = Column(Integer, ForeignKey("checks.id"), nullable=True)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<AnalysisJob(id={self.id}, status={self.status}, priority={self.priority})>"
@@ -0,0 +1,65 @@
+"""
+TruthLens Rating Interpretation Model
+
+SQLAlchemy model for LLM interpretations of publishers' textual fact-check ratings.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, UniqueConstraint
+
+from app.core.database import Base
+
+
+# Verdict recorded for labels whose meaning depends on the article
+CONTEXTUAL = "Contextual"
+
+# Verdict -> column counting it; counters are incremented atomically in SQL
+VERDICT_COLUMNS = {
+    "True": "true_count",
+    "False": "false_count",
+    "Misleading": "misleading_count",
+    "Unverifiable": "unverifiable_count",
+    CONTEXTUAL: "contextual_count",
+}
+
+
+class RatingInterpretation(Base):
+    """How the LLM has interpreted one publisher's textual rating, on its own, so far."""
+
+    __tablename__ = "rating_interpretations"
+    __table_args__ = (
+        UniqueConstraint("publisher", "rating", name="uq_rating_interpretations_publisher_rating"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Lookup key
+    publisher = Column(String(255), nullable=False, index=True)  # Lowercased publisher name
+    rating = Column(String(255), nullable=False)  # Normalized textual rating
+    original_rating = Column(Text, nullable=True)  # Rating text as first seen, kept for review
+
+    # Interpretations
+    verdict = Column(String(20), nullable=False)  # Most frequent interpretation, or Contextual
+    true_count = Column(Integer, nullable=False, default=0)
+    false_count = Column(Integer, nullable=False, default=0)
+    misleading_count = Column(Integer, nullable=False, default=0)
+    unverifiable_count = Column(Integer, nullable=False, default=0)
+    contextual_count = Column(Integer, nullable=False, default=0)
+    sightings = Column(Integer, nullable=False, default=0)
+    promoted = Column(Boolean, nullable=False, default=False, index=True)  # Answered without the LLM
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    promoted_at = Column(DateTime, nullable=True)
+
+    @property
+    def counts(self) -> dict:
+        """Interpretations seen so far, e.g. {"False": 3, "Misleading": 1}."""
+        return {
+            verdict: getattr(self, column) for verdict, column in VERDICT_COLUMNS.items()
+            if getattr(self, column)
+        }
+
+    def __repr__(self):
+        return f"<RatingInterpretation(id={self.id}, publisher={self.publisher}, rating={self.rating}, verdict={self.verdict})>"
@@ -2,29 +2,56 @@
 TruthLens Services Module
 
 Exports all analysis services.
+
+Services are imported on first attribute access, so importing this package
+(or an API module that uses one service) does not load spaCy, the Gemini
+SDK or the rest of the pipeline until they are needed.
 """
 
-from app.services.domain_trust import score_domain, load_domain_trust_db
-from app.services.claim_extractor import extract_claims, extract_candidates, refine_claims
-from app.services.factcheck import search_factchecks
-from app.services.news_search import search_news
-from app.services.stance import classify_all_stances, weighted_stance
-from app.services.aggregation import aggregate_verdict
-from app.services.explanation import generate_explanation
-from app.services.llm_verdict import llm_assess_claim
-
-__all__ = [
-    "score_domain",
-    "load_domain_trust_db",
-    "extract_claims",
-    "extract_candidates",
-    "refine_claims",
-    "search_factchecks",
-    "search_news",
-    "classify_all_stances",
-    "weighted_stance",
-    "aggregate_verdict",
-    "generate_explanation",
-    "llm_assess_claim",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+# Exported name -> module that defines it
+_EXPORTS = {
+    "score_domain": "app.services.domain_trust",
+    "load_domain_trust_db": "app.services.domain_trust",
+    "extract_claims": "app.services.claim_extractor",
+    "extract_candidates": "app.services.claim_extractor",
+    "refine_claims": "app.services.claim_extractor",
+    "search_factchecks": "app.services.factcheck",
+    "search_news": "app.services.news_search",
+    "classify_all_stances": "app.services.stance",
+    "weighted_stance": "app.services.stance",
+    "aggregate_verdict": "app.services.aggregation",
+    "generate_explanation": "app.services.explanation",
+    "llm_assess_claim": "app.services.llm_verdict",
+    "run_analysis": "app.services.pipeline",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from app.services.domain_trust import score_domain, load_domain_trust_db
+    from app.services.claim_extractor import extract_claims, extract_candidates, refine_claims
+    from app.services.factcheck import search_factchecks
+    from app.services.news_search import search_news
+    from app.services.stance import classify_all_stances, weighted_stance
+    from app.services.aggregation import aggregate_verdict
+    from app.services.explanation import generate_explanation
+    from app.services.llm_verdict import llm_assess_claim
+    from app.services.pipeline import run_analysis
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,33 +2,124 @@
 TruthLens Claim Extractor Service
 
 Extracts factual claims from text using spaCy and Gemini.
+
+Sentence extraction is CPU-bound, so in the API it runs in a warm pool of
+worker processes (each loads the spaCy model once) instead of on the event
+loop. Texts that arrive together are batched through ``nlp.pipe``.
+
+Only sentence boundaries are needed. By default the full model is loaded;
+lighter modes that keep just the components producing them are opt-in via
+NLP_MODE (see NLP_MODES). spaCy itself is imported on first load, so
+processes that only hand texts to the worker pool never import it.
 """
 
-from typing import List, Optional
-import spacy
-import google.generativeai as genai
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
 from app.core.config import settings
+from app.services.llm_gateway import generate_text
+
 
+# Sentence segmentation modes, from heaviest to lightest
+NLP_MODES = {
+    'full': "Every component of the model",
+    'parser': "Dependency parser for sentence boundaries; tagger, lemmatizer and NER excluded",
+    'senter': "Statistical sentence recognizer only",
+    'sentencizer': "Rule-based punctuation splitter; needs no trained model",
+}
+
+# Components that never contribute to sentence boundaries
+_NON_SENTENCE_COMPONENTS = ['tagger', 'morphologizer', 'attribute_ruler', 'lemmatizer', 'ner']
 
 # Load spaCy model (lazy loading)
 _nlp = None
 
 
+def _drop_unused_tok2vec(nlp):
+    """Remove the shared tok2vec layer when no remaining component listens to it."""
+    if 'tok2vec' in nlp.pipe_names and not nlp.get_pipe('tok2vec').listening_components:
+        nlp.remove_pipe('tok2vec')
+
+
+def load_nlp(mode: Optional[str] = None, model_name: Optional[str] = None):
+    """
+    Load a spaCy pipeline with only the components a mode needs.
+    
+    Args:
+        mode: One of NLP_MODES (defaults to settings.nlp_mode)
+        model_name: Trained model package (defaults to settings.nlp_model)
+        
+    Returns:
+        spaCy Language object whose docs have sentence boundaries
+    """
+    mode = mode or settings.nlp_mode
+    model_name = model_name or settings.nlp_model
+    if mode not in NLP_MODES:
+        raise ValueError(f"Unknown spaCy mode '{mode}', expected one of {', '.join(NLP_MODES)}")
+    
+    import spacy
+    
+    if mode == 'sentencizer':
+        # Only the language is needed: "en" from "en_core_web_sm" or a model directory's meta
+        meta_path = Path(model_name) / 'meta.json'
+        lang = spacy.util.load_meta(meta_path)['lang'] if meta_path.exists() else model_name.split('_')[0]
+        nlp = spacy.blank(lang)
+        nlp.add_pipe('sentencizer')
+        return nlp
+    
+    if mode == 'full':
+        return spacy.load(model_name)
+    
+    if mode == 'parser':
+        nlp = spacy.load(model_name, exclude=_NON_SENTENCE_COMPONENTS + ['senter'])
+    else:
+        nlp = spacy.load(model_name, exclude=_NON_SENTENCE_COMPONENTS + ['parser'])
+        if 'senter' in nlp.disabled:
+            nlp.enable_pipe('senter')
+    
+    if not any(name in nlp.pipe_names for name in ('parser', 'senter', 'sentencizer')):
+        # Model ships without the expected component; fall back to rules
+        nlp.add_pipe('sentencizer')
+    
+    _drop_unused_tok2vec(nlp)
+    return nlp
+
+
 def get_nlp():
     """Get or load spaCy NLP model."""
     global _nlp
     if _nlp is None:
         try:
-            _nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Model not installed, download it
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            _nlp = spacy.load("en_core_web_sm")
+            _nlp = load_nlp()
+        except OSError as e:
+            # Never download in the request path; the model ships with the image
+            raise OSError(
+                f"spaCy model '{settings.nlp_model}' is not installed. "
+                f"Install it with: python -m spacy download {settings.nlp_model}"
+            ) from e
+        print(f"spaCy pipeline ({settings.nlp_mode}): {', '.join(_nlp.pipe_names)}")
     return _nlp
 
 
+def nlp_components() -> List[str]:
+    """Return the names of the active components of this process's pipeline."""
+    return list(get_nlp().pipe_names)
+
+
+def _candidates_from_doc(doc) -> List[str]:
+    candidates = []
+    for sent in doc.sents:
+        sentence = sent.text.strip()
+        # Filter out very short sentences or questions
+        if len(sentence) > 20 and not sentence.endswith('?'):
+            candidates.append(sentence)
+    
+    return candidates
+
+
 def extract_candidates(text: str) -> List[str]:
     """
     Extract candidate sentences from text using spaCy.
@@ -43,16 +134,184 @@ def extract_candidates(text: str) -> List[str]:
         return []
     
     nlp = get_nlp()
-    doc = nlp(text)
+    return _candidates_from_doc(nlp(text))
+
+
+def extract_candidates_batch(texts: List[str]) -> List[List[str]]:
+    """
+    Extract candidate sentences from several texts with one ``nlp.pipe`` pass.
     
-    candidates = []
-    for sent in doc.sents:
-        sentence = sent.text.strip()
-        # Filter out very short sentences or questions
-        if len(sentence) > 20 and not sentence.endswith('?'):
-            candidates.append(sentence)
+    Args:
+        texts: Input texts to process
+        
+    Returns:
+        List of candidate sentence lists, in input order
+    """
+    results: List[List[str]] = [[] for _ in texts]
+    indexes = [i for i, text in enumerate(texts) if text and text.strip()]
+    if not indexes:
+        return results
     
-    return candidates
+    nlp = get_nlp()
+    docs = nlp.pipe((texts[i] for i in indexes), batch_size=settings.nlp_batch_size)
+    for i, doc in zip(indexes, docs):
+        results[i] = _candidates_from_doc(doc)
+    
+    return results
+
+
+def _init_nlp_worker():
+    """Load the spaCy model once per worker process."""
+    get_nlp()
+
+
+def _warm_nlp_worker() -> List[str]:
+    return nlp_components()
+
+
+class NLPPool:
+    """
+    Warm process pool for spaCy extraction with micro-batching.
+    
+    Requests arriving within ``batch_window_ms`` of each other (or until
+    ``batch_size`` texts are waiting) are sent to a worker as one batch.
+    Until the pool is started, extraction runs in a thread so the event
+    loop is never blocked.
+    """
+    
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._workers = 0
+        self._components: Optional[List[str]] = None
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+        self._stats = {'texts': 0, 'batches': 0, 'fallbacks': 0}
+    
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+    
+    async def start(self, workers: Optional[int] = None):
+        """
+        Start the worker processes and wait until each has loaded the model.
+        
+        Args:
+            workers: Number of processes (defaults to settings.nlp_pool_workers);
+                0 keeps extraction in a thread of this process
+        """
+        count = settings.nlp_pool_workers if workers is None else workers
+        if self.running or count <= 0:
+            return
+        
+        self._workers = count
+        self._executor = ProcessPoolExecutor(
+            max_workers=count,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_nlp_worker
+        )
+        # Workers are spawned on demand; one concurrent task per worker starts them all
+        loop = asyncio.get_running_loop()
+        try:
+            components = await asyncio.gather(*(
+                loop.run_in_executor(self._executor, _warm_nlp_worker) for _ in range(count)
+            ))
+            self._components = components[0]
+        except Exception as e:
+            print(f"spaCy worker pool failed to start, extracting in-process: {e}")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def shutdown(self):
+        """Finish queued batches and stop the worker processes."""
+        if self._pending:
+            self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def extract(self, text: str) -> List[str]:
+        """
+        Extract candidate sentences without blocking the event loop.
+        
+        Args:
+            text: Input text to process
+            
+        Returns:
+            List of candidate sentences
+        """
+        if not text or not text.strip():
+            return []
+        
+        self._stats['texts'] += 1
+        if not self.running:
+            return await asyncio.to_thread(extract_candidates, text)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        
+        if len(self._pending) >= settings.nlp_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(settings.nlp_batch_window_ms / 1000, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        texts = [text for text, _ in batch]
+        self._stats['batches'] += 1
+        
+        try:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(self._executor, extract_candidates_batch, texts)
+        except Exception as e:
+            # Broken or shut down pool: degrade to in-process extraction
+            print(f"spaCy worker pool error: {e}")
+            self._stats['fallbacks'] += 1
+            try:
+                results = await asyncio.to_thread(extract_candidates_batch, texts)
+            except Exception as fallback_error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(fallback_error)
+                return
+        
+        for (_, future), candidates in zip(batch, results):
+            if not future.done():
+                future.set_result(candidates)
+    
+    def components(self) -> List[str]:
+        """Return the active spaCy components used for extraction."""
+        if self.running and self._components is not None:
+            return self._components
+        return nlp_components()
+    
+    def stats(self) -> Dict:
+        """Return pool size, active pipeline and batching counters."""
+        return {
+            'workers': self._workers if self.running else 0,
+            'mode': settings.nlp_mode,
+            'components': self._components if self.running else (list(_nlp.pipe_names) if _nlp else None),
+            'pending': len(self._pending),
+            **self._stats
+        }
+
+
+nlp_pool = NLPPool()
 
 
 async def refine_claims(candidates: List[str]) -> List[str]:
@@ -73,9 +332,6 @@ async def refine_claims(candidates: List[str]) -> List[str]:
         return candidates[:3]
     
     try:
-        genai.configure(api_key=settings.gemini_api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
         prompt = f"""Analyze the following text segments and extract 1-3 specific, verifiable factual claims.
 
 Text segments:
@@ -90,8 +346,7 @@ Rules:
 
 Factual claims:"""
 
-        response = model.generate_content(prompt)
-        response_text = response.text.strip()
+        response_text = await generate_text(prompt, site='claim_refinement')
         
         if response_text == "NO_CLAIMS":
             return []
@@ -129,17 +384,20 @@ def get_primary_claim(claims: List[str]) -> Optional[str]:
     return claims[0]
 
 
-async def extract_claims(text: str) -> dict:
+async def extract_claims(text: str, candidates: Optional[List[str]] = None) -> dict:
     """
     Full claim extraction pipeline.
     
     Args:
         text: Input text
+        candidates: Candidate sentences already extracted from the text;
+            extracted through the spaCy worker pool if not given
         
     Returns:
         Dict with candidates, refined claims, and primary claim
     """
-    candidates = extract_candidates(text)
+    if candidates is None:
+        candidates = await nlp_pool.extract(text)
     refined = await refine_claims(candidates)
     primary = get_primary_claim(refined)
     
@@ -0,0 +1,347 @@
+"""
+TruthLens Similar Claim Index
+
+In-process MinHash/LSH index over previously analyzed claims. Paraphrases
+such as "5G spreads COVID" and "COVID is spread by 5G towers" miss the
+exact-match analysis cache but share most content words; above a
+configurable similarity threshold the stored analysis is reused instead of
+re-running the pipeline.
+
+Candidates come from LSH band buckets and are then verified with the exact
+Jaccard similarity of their token sets. Claims that differ in negation
+("X causes Y" vs "X does not cause Y"), in any number or date
+("... in March 2020" vs "... in 2021") or in a capitalised name
+("Biden won ..." vs "Trump won ...") never match. Entries expire like the
+analysis cache, so a claim is re-analyzed once its stored result is stale.
+"""
+
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+
+from app.core.cache import normalize_claim
+from app.core.config import settings
+
+
+# Words that carry no claim content. Question words, pronouns and
+# quantifiers are kept: "who" vs "what" or "all" vs "some" changes the claim.
+STOPWORDS = frozenset("""
+a an the is are was were be been being am do does did has have had of in on at to for
+from by with as that this these those it its and or but if then than so such there
+just about into over under very can could will would shall should
+may might must also says said claim claims according
+""".split())
+
+# Month names and number words; together with any token containing a digit
+# they must match exactly, since claims differing only in a date or figure
+# are different claims
+ANCHOR_WORDS = frozenset("""
+january february march april june july august september october november december
+jan feb mar apr jun jul aug sep sept oct nov dec
+zero one two three four five six seven eight nine ten eleven twelve twenty thirty
+forty fifty sixty seventy eighty ninety hundred thousand million billion trillion
+half third quarter percent
+""".split())
+
+# Negation markers; claims with different negation parity never match
+NEGATIONS = frozenset(['not', 'no', 'never', 'none', 'nor', 'cannot', 'dont', 'doesnt', 'isnt', 'arent', 'wasnt', 'didnt'])
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+def _stem(token: str) -> str:
+    """Very small suffix stripper so inflections share a feature."""
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3 and not token.endswith('ss'):
+            token = token[:-len(suffix)]
+            break
+    if token.endswith('e') and len(token) > 3:
+        token = token[:-1]
+    return token
+
+
+def _is_anchor(word: str) -> bool:
+    return word in ANCHOR_WORDS or any(char.isdigit() for char in word)
+
+
+def _capitalised_words(text: str) -> FrozenSet[str]:
+    """Lowercased words written with a capital letter (names, places, acronyms)."""
+    text = _PUNCTUATION_RE.sub(' ', unicodedata.normalize('NFKC', text))
+    return frozenset(
+        word.lower() for word in text.split()
+        if word[0].isupper() and word.lower() not in STOPWORDS
+    )
+
+
+def _content_words(text: str) -> FrozenSet[str]:
+    return frozenset(word for word in normalize_claim(text).split() if word not in STOPWORDS)
+
+
+def claim_tokens(text: str) -> FrozenSet[str]:
+    """
+    Reduce a claim to its set of content tokens.
+
+    Args:
+        text: Claim text
+
+    Returns:
+        Frozen set of stemmed content words, including negation markers;
+        numbers and dates are kept unstemmed
+    """
+    tokens = set()
+    for word in normalize_claim(text).split():
+        if word in NEGATIONS or _is_anchor(word):
+            tokens.add(word)
+        elif word not in STOPWORDS:
+            tokens.add(_stem(word))
+    return frozenset(tokens)
+
+
+def _negation_parity(tokens: FrozenSet[str]) -> int:
+    return len(tokens & NEGATIONS) % 2
+
+
+def _anchors(text: str, tokens: FrozenSet[str]) -> FrozenSet[str]:
+    return frozenset(token for token in tokens if _is_anchor(token)) | _capitalised_words(text)
+
+
+def _same_anchors(words: FrozenSet[str], anchors: FrozenSet[str], entry: Dict) -> bool:
+    """
+    Whether two claims agree on every anchor either of them has.
+
+    An anchor (number, date or capitalised word) of one claim must appear
+    in the other, written in any case: "Vaccines cause autism" matches
+    "autism is caused by vaccines", but "Biden won ..." never matches
+    "Trump won ...".
+    """
+    return all((anchor in words) == (anchor in entry['words']) for anchor in anchors | entry['anchors'])
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+class SimilarClaimIndex:
+    """MinHash signatures bucketed by LSH bands, with per-entry expiry and bounded FIFO eviction."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, max_entries: int = 50000,
+                 ttl: Optional[float] = None, seed: int = 7):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # a < 2^31 and 32-bit token hashes keep (a * h + b) below 2^64
+        self._a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+        self._entries: "OrderedDict[int, dict]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+        self._next_id = 0
+
+    def signature(self, tokens: FrozenSet[str]) -> np.ndarray:
+        """Compute the MinHash signature of a token set."""
+        hashes = np.fromiter((_token_hash(t) for t in tokens), dtype=np.uint64, count=len(tokens))
+        # (a * h + b) mod p for every permutation/token pair
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def add(self, text: str, scope: tuple, payload: Dict) -> Optional[int]:
+        """
+        Index a claim.
+
+        Args:
+            text: Claim text
+            scope: Partition key (e.g. pipeline version, language, domain); only
+                entries with the same scope can match each other
+            payload: Stored analysis result returned on a match
+
+        Returns:
+            Entry id, or None if the claim has no content tokens
+        """
+        tokens = claim_tokens(text)
+        if not tokens:
+            return None
+
+        signature = self.signature(tokens)
+        band_keys = self._band_keys(signature)
+        entry_id = self._next_id
+        self._next_id += 1
+
+        now = time.monotonic()
+        self._evict_expired(now)
+        self._entries[entry_id] = {
+            'tokens': tokens,
+            'words': _content_words(text),
+            'anchors': _anchors(text, tokens),
+            'scope': scope,
+            'band_keys': band_keys,
+            'payload': payload,
+            'text': text,
+            'expires_at': now + self.ttl if self.ttl is not None else None
+        }
+        for key in band_keys:
+            self._buckets[key].append(entry_id)
+
+        while len(self._entries) > self.max_entries:
+            self._evict_oldest()
+
+        return entry_id
+
+    @staticmethod
+    def _expired(entry: Dict, now: float) -> bool:
+        return entry['expires_at'] is not None and entry['expires_at'] <= now
+
+    def _evict_expired(self, now: float):
+        # Entries share one TTL, so insertion order is expiry order
+        while self._entries and self._expired(next(iter(self._entries.values())), now):
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        entry_id, entry = self._entries.popitem(last=False)
+        for key in entry['band_keys']:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(entry_id)
+            except ValueError:
+                pass
+            if not bucket:
+                del self._buckets[key]
+
+    def query(self, text: str, scope: tuple, threshold: float) -> Optional[Dict]:
+        """
+        Find the most similar indexed claim at or above a Jaccard threshold.
+
+        Args:
+            text: Claim text to look up
+            scope: Partition key the match must share
+            threshold: Minimum Jaccard similarity of content tokens (0-1)
+
+        Returns:
+            Dict with payload, matched text and similarity, or None
+        """
+        tokens = claim_tokens(text)
+        now = time.monotonic()
+        self._evict_expired(now)
+        if not tokens or not self._entries:
+            return None
+
+        candidates = set()
+        for key in self._band_keys(self.signature(tokens)):
+            candidates.update(self._buckets.get(key, ()))
+
+        parity = _negation_parity(tokens)
+        words = _content_words(text)
+        anchors = _anchors(text, tokens)
+        best = None
+        best_score = threshold
+
+        for entry_id in candidates:
+            entry = self._entries.get(entry_id)
+            if entry is None or entry['scope'] != scope:
+                continue
+            if _negation_parity(entry['tokens']) != parity or not _same_anchors(words, anchors, entry):
+                continue
+
+            other = entry['tokens']
+            score = len(tokens & other) / len(tokens | other)
+            if score >= best_score:
+                best, best_score = entry, score
+
+        if best is None:
+            return None
+
+        return {
+            'payload': best['payload'],
+            'text': best['text'],
+            'similarity': round(best_score, 3)
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """Return index size information."""
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'buckets': len(self._buckets),
+            'num_perm': self.num_perm,
+            'bands': self.bands
+        }
+
+
+claim_index = SimilarClaimIndex(
+    num_perm=settings.claim_index_num_perm,
+    bands=settings.claim_index_bands,
+    max_entries=settings.claim_index_max_entries,
+    ttl=settings.claim_index_ttl_seconds
+)
+
+# Lookup counters for the shared index
+_lookups = {'hits': 0, 'misses': 0}
+
+
+def _scope(url_domain: Optional[str], language: str) -> tuple:
+    return (settings.pipeline_version, language, url_domain or '')
+
+
+def find_similar_analysis(text: str, url_domain: Optional[str] = None, language: str = 'en') -> Optional[Dict]:
+    """
+    Look up a stored analysis for a near-duplicate claim.
+
+    Args:
+        text: Submitted claim text
+        url_domain: Domain of the submitted URL, if any
+        language: Language code of the request
+
+    Returns:
+        Match dict (payload, text, similarity) or None
+    """
+    if not settings.claim_index_enabled:
+        return None
+
+    match = claim_index.query(text, _scope(url_domain, language), settings.claim_index_threshold)
+    _lookups['hits' if match else 'misses'] += 1
+    return match
+
+
+def index_analysis(texts: List[str], result: Dict, url_domain: Optional[str] = None, language: str = 'en'):
+    """
+    Add a finished analysis to the index under each of its texts
+    (e.g. the submitted text and the extracted claim).
+    """
+    if not settings.claim_index_enabled:
+        return
+
+    scope = _scope(url_domain, language)
+    for text in dict.fromkeys(t for t in texts if t):
+        claim_index.add(text, scope, result)
+
+
+def claim_index_stats() -> Dict:
+    """Return index size and lookup counters."""
+    return {
+        'enabled': settings.claim_index_enabled,
+        'threshold': settings.claim_index_threshold,
+        **claim_index.stats(),
+        **_lookups
+    }
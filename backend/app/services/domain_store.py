@@ -0,0 +1,307 @@
+"""
+TruthLens Domain Store
+
+Compiled, memory-mapped domain reputation table for feeds with millions of
+rows. The file is mapped read-only, so every worker process on a host
+shares the same page-cache copy instead of holding its own dict of dicts.
+
+File layout (little-endian, sections 8-byte aligned):
+
+    header    magic, version, record/slot/string counts, section offsets
+    slots     u32 open-addressing hash table of record index + 1 (0 = empty)
+    hashes    u32 CRC-32 of the key in each slot, checked before comparing keys
+    key_offs  u32 offsets into the key blob (record_count + 1 entries)
+    keys      UTF-8 domain rules, sorted
+    scores    u8 numeric score per record
+    trust     u16 string id of the trust level per record
+    category  u16 string id of the category per record
+    label     u16 string id of the label per record
+    notes     u32 string id of the notes per record
+    str_offs  u32 offsets into the string blob (string_count + 1 entries)
+    strings   UTF-8 interned strings
+
+Files are written to a temporary path and renamed into place, so readers
+either see the old file or the complete new one. Strings are decoded from
+the mapping on access (hot ones through a small LRU), so a worker's heap
+does not grow with the feed's notes.
+"""
+
+import csv
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+
+MAGIC = b'TLDSTORE'
+VERSION = 1
+
+# Decoded strings kept per open store; trust levels, categories and labels repeat
+STRING_CACHE_SIZE = 4096
+
+# magic, version, record count, slot count, string count, then 11 section offsets
+_HEADER = struct.Struct('<8sIIII11Q')
+
+
+class DomainStoreError(Exception):
+    """Raised when a store file is missing, truncated or of an unknown format."""
+
+
+def _hash(key: bytes) -> int:
+    return zlib.crc32(key)
+
+
+def _align(buffer: bytearray):
+    buffer.extend(b'\0' * (-len(buffer) % 8))
+
+
+def read_domain_csv(csv_path: Path) -> Iterator[Tuple[str, Dict]]:
+    """
+    Stream (domain rule, info) pairs from a domain trust CSV.
+
+    Uses the same columns and defaults as the seed CSV loader.
+    """
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            domain = (row.get('domain') or '').strip().lower().rstrip('.')
+            if not domain:
+                continue
+            try:
+                score = int(row.get('score', 50))
+            except (ValueError, TypeError):
+                score = 50
+            yield domain, {
+                'trust_level': row.get('trust_level') or 'unknown',
+                'category': row.get('category') or 'unknown',
+                'score': max(0, min(100, score)),
+                'label': row.get('label') or 'Unknown',
+                'notes': row.get('notes') or ''
+            }
+
+
+def build_domain_store(rows: Mapping[str, Dict], out_path: Path) -> int:
+    """
+    Compile domain rules into a store file, replacing it atomically.
+
+    Args:
+        rows: Mapping from domain rule to info dict (trust_level, category,
+            score, label, notes); later duplicates already resolved
+        out_path: Destination file
+
+    Returns:
+        Number of records written
+    """
+    keys = sorted(rows)
+    count = len(keys)
+    slot_count = 1
+    while slot_count < max(8, count * 2):
+        slot_count <<= 1
+
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    encoded = [key.encode('utf-8') for key in keys]
+    key_offs, offset = [0], 0
+    for key in encoded:
+        offset += len(key)
+        key_offs.append(offset)
+
+    scores = bytes(rows[key]['score'] for key in keys)
+    # Short fields are interned first so their ids fit in u16; notes use u32 ids
+    trust = [intern(rows[key]['trust_level']) for key in keys]
+    category = [intern(rows[key]['category']) for key in keys]
+    label = [intern(rows[key]['label']) for key in keys]
+    if len(strings) > 0xFFFF:
+        raise DomainStoreError("Too many distinct trust levels, categories and labels")
+    notes = [intern(rows[key]['notes']) for key in keys]
+
+    slots = [0] * slot_count
+    slot_hashes = [0] * slot_count
+    mask = slot_count - 1
+    for index, key in enumerate(encoded):
+        key_hash = _hash(key)
+        slot = key_hash & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+        slot_hashes[slot] = key_hash
+
+    encoded_strings = [value.encode('utf-8') for value in strings]
+    str_offs, offset = [0], 0
+    for value in encoded_strings:
+        offset += len(value)
+        str_offs.append(offset)
+
+    body = bytearray()
+    offsets = []
+    sections = [
+        struct.pack(f'<{slot_count}I', *slots),
+        struct.pack(f'<{slot_count}I', *slot_hashes),
+        struct.pack(f'<{count + 1}I', *key_offs),
+        b''.join(encoded),
+        scores,
+        struct.pack(f'<{count}H', *trust),
+        struct.pack(f'<{count}H', *category),
+        struct.pack(f'<{count}H', *label),
+        struct.pack(f'<{count}I', *notes),
+        struct.pack(f'<{len(strings) + 1}I', *str_offs),
+        b''.join(encoded_strings),
+    ]
+    for section in sections:
+        offsets.append(_HEADER.size + len(body))
+        body.extend(section)
+        _align(body)
+
+    header = _HEADER.pack(MAGIC, VERSION, count, slot_count, len(strings), *offsets)
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=out_path.parent, prefix=f".{out_path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return count
+
+
+def build_domain_store_from_csv(csv_path: Path, out_path: Path) -> int:
+    """Compile a domain trust CSV into a store file. Later rows win on duplicates."""
+    return build_domain_store(dict(read_domain_csv(Path(csv_path))), out_path)
+
+
+class DomainStore(Mapping):
+    """Read-only mapping from domain rule to info dict, backed by an mmap."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        try:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise DomainStoreError(f"Cannot open domain store {self.path}: {e}") from e
+
+        # Identity of the mapped file, used to detect replacement
+        self.file_id = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+        if len(self._mmap) < _HEADER.size:
+            raise DomainStoreError(f"Domain store {self.path} is truncated")
+        magic, version, count, slot_count, string_count, *offsets = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise DomainStoreError(f"{self.path} is not a version {VERSION} domain store")
+
+        if slot_count == 0 or slot_count & (slot_count - 1) or count >= slot_count:
+            raise DomainStoreError(f"Domain store {self.path} has an invalid hash table size")
+
+        self._count = count
+        self._mask = slot_count - 1
+        view = memoryview(self._mmap)
+        (slots_off, hashes_off, key_offs_off, keys_off, scores_off, trust_off,
+         category_off, label_off, notes_off, str_offs_off, strings_off) = offsets
+
+        def section(name: str, offset: int, size: int) -> memoryview:
+            if offset < _HEADER.size or offset + size > len(self._mmap):
+                raise DomainStoreError(f"Domain store {self.path} is truncated or corrupt ({name} section)")
+            return view[offset:offset + size]
+
+        self._slots = section('slots', slots_off, 4 * slot_count).cast('I')
+        self._hashes = section('hashes', hashes_off, 4 * slot_count).cast('I')
+        self._key_offs = section('key_offs', key_offs_off, 4 * (count + 1)).cast('I')
+        self._keys = section('keys', keys_off, self._key_offs[count])
+        self._scores = section('scores', scores_off, count)
+        self._trust = section('trust', trust_off, 2 * count).cast('H')
+        self._category = section('category', category_off, 2 * count).cast('H')
+        self._label = section('label', label_off, 2 * count).cast('H')
+        self._notes = section('notes', notes_off, 4 * count).cast('I')
+        str_offs = section('str_offs', str_offs_off, 4 * (string_count + 1)).cast('I')
+        strings = section('strings', strings_off, str_offs[string_count])
+        path = self.path
+
+        # A closure rather than a method, so the cache holds no reference to self
+        # and a replaced store's mapping is released as soon as it is dropped
+        @lru_cache(maxsize=STRING_CACHE_SIZE)
+        def decode_string(string_id: int) -> str:
+            if string_id >= string_count:
+                raise DomainStoreError(f"Domain store {path} is corrupt (string id {string_id})")
+            start, end = str_offs[string_id], str_offs[string_id + 1]
+            if not start <= end <= len(strings):
+                raise DomainStoreError(f"Domain store {path} is corrupt (string offsets of {string_id})")
+            return bytes(strings[start:end]).decode('utf-8')
+
+        self._string = decode_string
+
+    def _corrupt(self, what: str) -> DomainStoreError:
+        return DomainStoreError(f"Domain store {self.path} is corrupt ({what})")
+
+    def _key(self, index: int) -> bytes:
+        start, end = self._key_offs[index], self._key_offs[index + 1]
+        if not start <= end <= len(self._keys):
+            raise self._corrupt(f"key offsets of record {index}")
+        return self._keys[start:end]
+
+    def _find(self, key: str) -> int:
+        encoded = key.encode('utf-8')
+        key_hash = _hash(encoded)
+        slots, hashes, mask = self._slots, self._hashes, self._mask
+        slot = key_hash & mask
+        # Bounded so a corrupt table without empty slots cannot loop forever
+        for _ in range(mask + 1):
+            entry = slots[slot]
+            if entry == 0:
+                return -1
+            if entry > self._count:
+                raise self._corrupt(f"slot {slot}")
+            if hashes[slot] == key_hash and self._key(entry - 1) == encoded:
+                return entry - 1
+            slot = (slot + 1) & mask
+        return -1
+
+    def _record(self, index: int) -> Dict:
+        return {
+            'trust_level': self._string(self._trust[index]),
+            'category': self._string(self._category[index]),
+            'score': self._scores[index],
+            'label': self._string(self._label[index]),
+            'notes': self._string(self._notes[index])
+        }
+
+    def get(self, key: str, default=None) -> Optional[Dict]:
+        index = self._find(key)
+        return self._record(index) if index >= 0 else default
+
+    def __getitem__(self, key: str) -> Dict:
+        index = self._find(key)
+        if index < 0:
+            raise KeyError(key)
+        return self._record(index)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield bytes(self._key(index)).decode('utf-8')
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self):
+        return f"<DomainStore(path={self.path}, records={self._count})>"
@@ -1,67 +1,169 @@
 """
 TruthLens Domain Trust Service
 
-Provides domain trust scoring based on a CSV database.
+Provides domain trust scoring based on a CSV database, or on a compiled,
+memory-mapped store (app.services.domain_store) for large reputation feeds.
+A store file replaced in place is picked up without a restart.
+
+URL parsing and domain lookups are memoized in bounded LRU caches shared by
+every caller in the process (news retrieval, stance weighting, the analyze
+and batch endpoints), so each unique domain is resolved once. Returned
+trust dicts are shared and must be treated as read-only.
+
+Rules match by domain suffix, so a rule for ``bbc.co.uk`` also covers
+``news.bbc.co.uk``. A rule written as ``*.blogspot.com`` covers every
+subdomain of blogspot.com but not blogspot.com itself. The longest matching
+rule wins, and an exact rule beats a wildcard of the same length.
 """
 
-import csv
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
 from app.core.config import settings
+from app.services.domain_store import DomainStore, DomainStoreError, read_domain_csv
+
+
+# Weight of an article's stance by the trust level of its source
+TRUST_WEIGHTS = {
+    'trusted': 1.0,
+    'mixed': 0.5,
+    'low': 0.1,
+    'unknown': 0.3
+}
+
+# In-memory domain trust database (dict from CSV, or a DomainStore)
+_domain_trust_db: Mapping[str, dict] = {}
+
+# Compiled store state for hot-reload
+_store: Optional[DomainStore] = None
+_store_checked_at: Optional[float] = None
+_store_rejected_id: Optional[tuple] = None
+
+
+def _data_path(configured: str) -> Path:
+    """Resolve a data file path, falling back to the repository data directory."""
+    path = Path(configured)
+    if not path.exists():
+        # Try relative to backend directory
+        path = Path(__file__).parent.parent.parent.parent / "data" / path.name
+    return path
 
 
-# In-memory domain trust database
-_domain_trust_db: Dict[str, dict] = {}
+def _store_file_id(path: Path) -> Optional[tuple]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
 
 
-def load_domain_trust_db() -> Dict[str, dict]:
+def _refresh_store() -> Optional[DomainStore]:
     """
-    Load domain trust data from CSV file.
+    Open the compiled store, or reopen it if the file was replaced.
+    
+    Checks at most every domain_trust_reload_interval seconds, also while no
+    store file exists, so lookups do not stat the filesystem each time. A
+    store that fails to open keeps the previous one in service. The old mapping is not
+    closed explicitly; it is released once no lookup references it.
+    """
+    global _store, _store_checked_at, _store_rejected_id
+    
+    now = time.monotonic()
+    if _store_checked_at is not None and now - _store_checked_at < settings.domain_trust_reload_interval:
+        return _store
+    _store_checked_at = now
+    
+    path = _data_path(settings.domain_trust_store_path)
+    file_id = _store_file_id(path)
+    if file_id is None or file_id == _store_rejected_id or (_store is not None and _store.file_id == file_id):
+        return _store
+    
+    try:
+        store = DomainStore(path)
+    except DomainStoreError as e:
+        print(f"Domain store load error: {e}")
+        _store_rejected_id = file_id
+        return _store
+    
+    if _store is not None:
+        print(f"Domain store reloaded: {len(store)} domains")
+    _store = store
+    _lookup_domain.cache_clear()
+    return _store
+
+
+def load_domain_trust_db() -> Mapping[str, dict]:
+    """
+    Load domain trust data.
+    
+    Uses the compiled store when one exists at domain_trust_store_path
+    (re-opened when the file is replaced), otherwise the CSV file.
     
     Returns:
-        Dictionary mapping domains to their trust info
+        Mapping from domain rule to trust info
     """
     global _domain_trust_db
     
+    store = _refresh_store()
+    if store is not None:
+        return store
+    
     if _domain_trust_db:
         return _domain_trust_db
     
-    csv_path = Path(settings.domain_trust_csv_path)
-    
-    if not csv_path.exists():
-        # Try relative to backend directory
-        csv_path = Path(__file__).parent.parent.parent.parent / "data" / "domain_trust_seed.csv"
+    csv_path = _data_path(settings.domain_trust_csv_path)
     
     if not csv_path.exists():
         return {}
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            domain = row.get('domain', '').strip().lower()
-            if domain:
-                # Parse numeric score with fallback
-                try:
-                    score = int(row.get('score', 50))
-                except (ValueError, TypeError):
-                    score = 50
-                
-                _domain_trust_db[domain] = {
-                    'trust_level': row.get('trust_level', 'unknown'),
-                    'category': row.get('category', 'unknown'),
-                    'score': score,
-                    'label': row.get('label', 'Unknown'),
-                    'notes': row.get('notes', '')
-                }
+    _domain_trust_db = dict(read_domain_csv(csv_path))
     
     return _domain_trust_db
 
 
+def match_domain_rule(domain: str, rules: Mapping[str, Any]) -> Optional[Tuple[str, Any]]:
+    """
+    Find the longest rule matching a domain.
+    
+    Probes the domain and each parent suffix in turn (``a.b.example.com``,
+    ``*.b.example.com``, ``b.example.com``, ``*.example.com``, ...), so a
+    lookup costs one probe per label and per wildcard, like walking a
+    reversed-label trie, without holding one node per label in memory.
+    
+    Args:
+        domain: Lowercase domain name
+        rules: Mapping from rule (``example.com`` or ``*.example.com``) to data
+        
+    Returns:
+        Tuple of (matched rule, rule data), or None if no rule matches
+    """
+    suffix = domain
+    while suffix:
+        info = rules.get(suffix)
+        if info is not None:
+            return suffix, info
+        
+        dot = suffix.find('.')
+        if dot == -1:
+            return None
+        
+        suffix = suffix[dot + 1:]
+        wildcard = '*.' + suffix
+        info = rules.get(wildcard)
+        if info is not None:
+            return wildcard, info
+    
+    return None
+
+
+@lru_cache(maxsize=settings.domain_cache_size)
 def extract_domain(url: str) -> Optional[str]:
     """
-    Extract the domain from a URL.
+    Extract the domain from a URL (memoized).
     
     Args:
         url: URL string
@@ -71,7 +173,8 @@ def extract_domain(url: str) -> Optional[str]:
     """
     try:
         parsed = urlparse(url)
-        domain = parsed.netloc.lower()
+        # hostname drops credentials and port and is already lowercase
+        domain = (parsed.hostname or '').rstrip('.')
         
         # Remove www. prefix
         if domain.startswith('www.'):
@@ -100,7 +203,8 @@ def score_domain(url: Optional[str]) -> dict:
         url: URL to score
         
     Returns:
-        Dict with domain, score (0-100), trust_level, category, label, and reason
+        Dict with domain, score (0-100), trust_level, category, label, reason
+        and the rule that matched (None for unknown domains)
     """
     if not url:
         return {
@@ -109,7 +213,8 @@ def score_domain(url: Optional[str]) -> dict:
             'trust_score': 50,
             'category': 'unknown',
             'label': 'No URL provided',
-            'reason': 'No URL was provided for domain trust analysis.'
+            'reason': 'No URL was provided for domain trust analysis.',
+            'matched_rule': None
         }
     
     domain = extract_domain(url)
@@ -121,23 +226,66 @@ def score_domain(url: Optional[str]) -> dict:
             'trust_score': 50,
             'category': 'unknown',
             'label': 'Invalid URL',
-            'reason': 'Could not extract domain from the provided URL.'
+            'reason': 'Could not extract domain from the provided URL.',
+            'matched_rule': None
         }
     
-    # Load database if not loaded
+    return score_domain_name(domain)
+
+
+def score_domain_name(domain: str) -> dict:
+    """
+    Score the trust level of an already extracted domain (memoized).
+    
+    Args:
+        domain: Lowercase domain name (as returned by extract_domain)
+        
+    Returns:
+        Same dict as score_domain; shared between callers, do not modify
+    """
+    # Picks up a replaced store (and clears the memo) before looking up
+    load_domain_trust_db()
+    return _lookup_domain(domain)
+
+
+def trust_weight(trust_level: Optional[str]) -> float:
+    """Weight of evidence from a source with the given trust level."""
+    return TRUST_WEIGHTS.get(trust_level, TRUST_WEIGHTS['unknown'])
+
+
+def domain_cache_stats() -> dict:
+    """Return hit statistics of the domain memo caches."""
+    stats = {}
+    for name, cached in (('urls', extract_domain), ('domains', _lookup_domain)):
+        info = cached.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            'size': info.currsize,
+            'maxsize': info.maxsize,
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': round(info.hits / lookups, 3) if lookups else 0.0
+        }
+    return stats
+
+
+@lru_cache(maxsize=settings.domain_cache_size)
+def _lookup_domain(domain: str) -> dict:
     db = load_domain_trust_db()
     
-    # Look up domain
-    trust_info = db.get(domain)
+    # Look up the longest matching domain rule
+    match = match_domain_rule(domain, db)
     
-    if trust_info:
+    if match:
+        rule, trust_info = match
         return {
             'domain': domain,
             'score': trust_info['trust_level'],
             'trust_score': trust_info['score'],
             'category': trust_info['category'],
             'label': trust_info['label'],
-            'reason': trust_info['notes'] or f"Domain is classified as {trust_info['trust_level']} based on our database."
+            'reason': trust_info['notes'] or f"Domain is classified as {trust_info['trust_level']} based on our database.",
+            'matched_rule': rule
         }
     
     # Unknown domain - assign moderate default
@@ -147,5 +295,6 @@ def score_domain(url: Optional[str]) -> dict:
         'trust_score': 50,
         'category': 'unknown',
         'label': 'Unknown Source',
-        'reason': 'This domain is not in our trust database. Exercise caution and verify from other sources.'
+        'reason': 'This domain is not in our trust database. Exercise caution and verify from other sources.',
+        'matched_rule': None
     }
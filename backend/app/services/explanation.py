@@ -5,9 +5,9 @@ Generates user-friendly explanations using Gemini based on analysis signals.
 """
 
 from typing import Dict
-import google.generativeai as genai
 
 from app.core.config import settings
+from app.services.llm_gateway import generate_text
 
 
 async def generate_explanation(signals: Dict) -> str:
@@ -38,9 +38,6 @@ async def generate_explanation(signals: Dict) -> str:
         return _generate_fallback_explanation(signals)
     
     try:
-        genai.configure(api_key=settings.gemini_api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
         # Build context for the LLM
         context_parts = [
             f"Claim analyzed: \"{claim}\"",
@@ -84,8 +81,7 @@ Rules:
 
 Explanation:"""
 
-        response = model.generate_content(prompt)
-        return response.text.strip()
+        return await generate_text(prompt, site='explanation')
         
     except Exception as e:
         print(f"Explanation generation error: {e}")
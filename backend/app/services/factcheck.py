@@ -4,11 +4,17 @@ TruthLens Fact Check Service
 Queries Google Fact Check Tools API for existing fact-checks.
 """
 
-from typing import Optional, Dict, List
+import asyncio
+import re
+from functools import lru_cache
+from typing import Callable, Optional, Dict, List
 import httpx
-import google.generativeai as genai
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.services.factcheck_cache import get_cached_factcheck, store_factcheck
+from app.services.llm_gateway import generate_text
+from app.services.rating_learning import CONTEXTUAL, learned_rating, record_interpretation
 
 
 # Google Fact Check API endpoint
@@ -28,12 +34,15 @@ RATING_NORMALIZATION = {
     'verified': 'True',
     'factual': 'True',
     'evidence supports': 'True',
+    'mostly accurate': 'True',
     
     # False variants
     'false': 'False',
     'mostly false': 'False',
     'pants on fire': 'False',
     'incorrect': 'False',
+    'inaccurate': 'False',
+    'untrue': 'False',
     'wrong': 'False',
     'debunked': 'False',
     'hoax': 'False',
@@ -49,6 +58,8 @@ RATING_NORMALIZATION = {
     'partly false': 'Misleading',
     'partly true': 'Misleading',
     'out of context': 'Misleading',
+    'missing context': 'Misleading',
+    'lacks context': 'Misleading',
     'exaggerated': 'Misleading',
     'distorted': 'Misleading',
     'cherry-picked': 'Misleading',
@@ -56,6 +67,10 @@ RATING_NORMALIZATION = {
     # Unverifiable variants
     'unproven': 'Unverifiable',
     'unverified': 'Unverifiable',
+    'not verified': 'Unverifiable',
+    'not proven': 'Unverifiable',
+    'unsupported': 'Unverifiable',
+    'not supported': 'Unverifiable',
     'no evidence': 'Unverifiable',
     'needs context': 'Unverifiable',
     'insufficient evidence': 'Unverifiable',
@@ -63,7 +78,115 @@ RATING_NORMALIZATION = {
 }
 
 
-async def llm_interpret_rating(rating: str, summary: str, claim: str, url: str = "", source: str = "") -> str:
+# Words that invert the rating phrase after them, e.g. "not true", "isn't accurate"
+RATING_NEGATIONS = r"not|isn'?t|wasn'?t|never|hardly"
+
+# Hedges between a negation and the phrase; "not entirely true" is partly true
+RATING_QUALIFIERS = r"entirely|completely|wholly|fully|totally|quite|exactly|really|all"
+
+_WORD_SEPARATOR = re.compile(r'[\s\-]+')
+
+
+def _canonical(phrase: str) -> str:
+    return _WORD_SEPARATOR.sub(' ', phrase.lower().replace('\u2019', "'")).strip()
+
+
+def _trie_regex(phrases: List[str]) -> str:
+    """
+    Build an alternation of phrases factored on common prefixes.
+    
+    "mostly true|mostly false" becomes "mostly (?:true|false)", so
+    the regex engine reads each character at most once per start position
+    instead of retrying every phrase.
+    """
+    trie: Dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def emit(node: Dict) -> str:
+        ends_here = '' in node
+        branches = [
+            (r'[\s\-]+' if char == ' ' else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Longer phrases are tried first; the shorter one only if they fail
+        if ends_here:
+            body = '(?:' + body + ')?' if len(branches) == 1 else body[:-1] + ')?'
+        return body
+    
+    return emit(trie)
+
+
+class RatingMatcher:
+    """
+    Rating phrases compiled into one regex.
+    
+    The phrases share a prefix trie, and each may be preceded by a
+    negation, so one left-to-right pass finds every phrase. Spaces and
+    hyphens inside a phrase are interchangeable ("half-true", "half  true").
+    """
+    
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = {_canonical(key): value for key, value in mapping.items()}
+        self.pattern = re.compile(
+            rf"(?<!\w)(?:(?P<negation>{RATING_NEGATIONS})\s+(?:(?P<qualifier>{RATING_QUALIFIERS})\s+)?)?"
+            rf"(?P<phrase>{_trie_regex(list(self.mapping))})\b"
+        )
+    
+    def _resolve(self, match: re.Match) -> Optional[str]:
+        phrase = match.group('phrase')
+        if phrase not in self.mapping:
+            phrase = _canonical(phrase)  # "half-true", "half  true"
+        negation = match.group('negation')
+        if negation is None:
+            return self.mapping[phrase]
+        
+        qualifier = match.group('qualifier')
+        if qualifier is None and f"{negation} {phrase}" in self.mapping:
+            return self.mapping[f"{negation} {phrase}"]  # e.g. "not verified"
+        
+        rating = self.mapping[phrase]
+        if qualifier is not None and rating in ('True', 'False'):
+            return 'Misleading'  # "not entirely true", "not entirely false"
+        if rating != 'True':
+            return None  # "not false" or "not misleading" says nothing definite
+        return 'False'
+    
+    def match(self, rating: str) -> Optional[str]:
+        """Return the normalized rating of the longest matching phrase, or None."""
+        best, best_length = None, 0
+        for match in self.pattern.finditer(rating.lower().replace('\u2019', "'")):
+            length = match.end() - match.start()
+            if length > best_length:
+                resolved = self._resolve(match)
+                if resolved is not None:
+                    best, best_length = resolved, length
+        return best
+
+
+_rating_matcher = RatingMatcher(RATING_NORMALIZATION)
+
+
+# Bulk runs see the same few hundred textual ratings over and over
+@lru_cache(maxsize=4096)
+def _match_rating(rating: str) -> Optional[str]:
+    return _rating_matcher.match(rating)
+
+
+async def llm_interpret_rating(
+    rating: str,
+    summary: str,
+    claim: str,
+    url: str = "",
+    source: str = "",
+    default: Optional[str] = 'Unverifiable'
+) -> Optional[str]:
     """
     Use LLM to interpret an unclear fact-check rating.
     
@@ -73,17 +196,16 @@ async def llm_interpret_rating(rating: str, summary: str, claim: str, url: str =
         claim: The original claim being checked
         url: URL of the fact-check article (often contains the verdict in the title)
         source: Name of the fact-checking organization
+        default: Returned when no LLM is configured, the call fails or the
+            answer is not one of the four ratings
         
     Returns:
         Interpreted rating: True, False, Misleading, or Unverifiable
     """
     if not settings.gemini_api_key:
-        return 'Unverifiable'
+        return default
     
     try:
-        genai.configure(api_key=settings.gemini_api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
         prompt = f"""You are a fact-check rating interpreter. Your job is to determine whether a fact-check article SUPPORTS or REFUTES the original claim.
 
 IMPORTANT: The "summary" field often contains the CLAIM BEING FACT-CHECKED, not the fact-checker's conclusion. You must look at the URL and source to understand the actual verdict.
@@ -108,24 +230,92 @@ Respond with ONLY ONE of these exact words:
 
 Your response (one word only):"""
 
-        response = await model.generate_content_async(prompt)
-        result = response.text.strip().upper()
+        response_text = await generate_text(prompt, site='rating_interpretation')
+        result = response_text.upper()
         
         # Validate response
         if result in ['TRUE', 'FALSE', 'MISLEADING', 'UNVERIFIABLE']:
             return result.capitalize() if result != 'UNVERIFIABLE' else 'Unverifiable'
         
-        return 'Unverifiable'
+        return default
         
     except Exception as e:
         print(f"LLM rating interpretation error: {e}")
-        return 'Unverifiable'
+        return default
+
+
+async def llm_interpret_rating_label(rating: str, source: str = "") -> Optional[str]:
+    """
+    Ask the LLM what a textual rating label means on its own.
+    
+    Unlike llm_interpret_rating, the prompt sees no claim, summary or URL, so
+    the answer describes the label rather than one article and can be
+    learned for the publisher (see rating_learning). The response cache is
+    bypassed so repeated sightings are independent samples.
+    
+    Args:
+        rating: Original rating text from fact-checker
+        source: Name of the fact-checking organization
+        
+    Returns:
+        True, False, Misleading, Unverifiable, or CONTEXTUAL if the label's
+        meaning depends on the article; None if no LLM is configured, the
+        call fails or the answer is unusable
+    """
+    if not settings.gemini_api_key:
+        return None
+    
+    try:
+        prompt = f"""You are a fact-check rating interpreter. Fact-checking organizations label the claims they check with short textual ratings.
+
+Fact-checking organization: {source}
+Rating label: "{rating}"
+
+Considering ONLY this label and this organization's rating scale, what does the label say about the claim it was given to?
+
+Respond with ONLY ONE of these exact words:
+- TRUE (the label always means the claim is true or accurate)
+- FALSE (the label always means the claim is false)
+- MISLEADING (the label always means the claim is partly true or missing context)
+- UNVERIFIABLE (the label always means the claim could not be verified)
+- CONTEXTUAL (the label does not say by itself, e.g. "Explainer", or you do not know this label)
+
+Your response (one word only):"""
+
+        response_text = await generate_text(prompt, site='rating_label', use_cache=False)
+        result = response_text.strip().upper()
+        
+        if result in ['TRUE', 'FALSE', 'MISLEADING']:
+            return result.capitalize()
+        if result == 'UNVERIFIABLE':
+            return 'Unverifiable'
+        if result == 'CONTEXTUAL':
+            return CONTEXTUAL
+        
+        return None
+        
+    except Exception as e:
+        print(f"LLM rating label interpretation error: {e}")
+        return None
+
+
+async def _learn_rating_label(rating: str, source: str):
+    """Sample the rating-only interpretation of a label and record it."""
+    verdict = await llm_interpret_rating_label(rating, source)
+    if verdict is not None:
+        await record_interpretation(source, rating, verdict)
 
 
 def normalize_rating(rating: str) -> str:
     """
     Normalize a fact-check rating to a standard format using static mapping.
     
+    Phrases only match on word boundaries ("untrue" is not "true"), the
+    longest matching phrase wins ("mostly false" over "false"), and a
+    preceding negation turns a True phrase False ("not true"), a hedged
+    one Misleading ("not entirely true"), and leaves other phrases
+    undecided ("not false").
+    
     Args:
         rating: Original rating text
         
@@ -135,21 +325,115 @@ def normalize_rating(rating: str) -> str:
     if not rating:
         return None  # Return None to signal LLM fallback needed
     
-    rating_lower = rating.lower().strip()
+    return _match_rating(rating)
+
+
+async def _parse_factcheck_response(data: Dict, claim: str) -> Dict:
+    """
+    Turn a Fact Check API response into a result dict.
+    
+    Args:
+        data: Decoded JSON response
+        claim: The claim being checked (context for LLM rating interpretation)
+        
+    Returns:
+        Dict with found (bool), rating, original_rating, summary, source, and url;
+        rating_fallback is True when the rating is a default 'Unverifiable'
+        because the LLM could not interpret it
+    """
+    claims = data.get('claims', [])
+    
+    if not claims:
+        return {
+            'found': False,
+            'rating': None,
+            'summary': None,
+            'source': None,
+            'url': None
+        }
+    
+    # Get the first (most relevant) claim review
+    first_claim = claims[0]
+    claim_reviews = first_claim.get('claimReview', [])
+    
+    if not claim_reviews:
+        return {
+            'found': False,
+            'rating': None,
+            'summary': None,
+            'source': None,
+            'url': None
+        }
+    
+    review = claim_reviews[0]
+    original_rating = review.get('textualRating', '')
+    summary_text = first_claim.get('text', '')
+    article_url = review.get('url', '')
+    source_name = review.get('publisher', {}).get('name', 'Unknown')
+    
+    # Try static normalization first
+    normalized_rating = normalize_rating(original_rating)
+    
+    # Then what this publisher's label was consistently learned to mean
+    sample_label = False
+    if normalized_rating is None:
+        normalized_rating, sample_label = await learned_rating(source_name, original_rating)
     
-    for key, value in RATING_NORMALIZATION.items():
-        if key in rating_lower:
-            return value
+    # If static mapping failed, use LLM to interpret with full context;
+    # meanwhile sample what the label means on its own for the learned table
+    rating_fallback = False
+    if normalized_rating is None:
+        interpret = llm_interpret_rating(
+            rating=original_rating,
+            summary=summary_text,
+            claim=claim,
+            url=article_url,
+            source=source_name,
+            default=None
+        )
+        if sample_label:
+            normalized_rating, _ = await asyncio.gather(
+                interpret, _learn_rating_label(original_rating, source_name)
+            )
+        else:
+            normalized_rating = await interpret
+        
+        # No LLM, a failed call or an unusable answer; not a real verdict
+        if normalized_rating is None:
+            normalized_rating = 'Unverifiable'
+            rating_fallback = True
     
-    return None  # Return None to signal LLM fallback needed
+    return {
+        'found': True,
+        'rating': normalized_rating,
+        'rating_fallback': rating_fallback,
+        'original_rating': original_rating,
+        'summary': summary_text,
+        'source': source_name,
+        'url': article_url
+    }
 
 
-async def search_factchecks(claim: str) -> Dict:
+async def search_factchecks(
+    claim: str,
+    language: str = 'en',
+    client: Optional[httpx.AsyncClient] = None,
+    on_degraded: Optional[Callable[[str], None]] = None
+) -> Dict:
     """
     Search for existing fact-checks for a claim.
     
+    Parsed results (including "nothing found") are persisted in the
+    fact-check cache; API and transport errors are not cached. Results
+    whose rating fell back to the default are kept only as long as
+    "nothing found" results, so the rating is interpreted again soon.
+    
     Args:
         claim: The claim to search for
+        language: Language code for the search
+        client: HTTP client to use (defaults to the shared pooled client)
+        on_degraded: Called with a reason when the API failed or the rating
+            is only the fallback default
         
     Returns:
         Dict with found (bool), rating, summary, source, and url
@@ -172,82 +456,42 @@ async def search_factchecks(claim: str) -> Dict:
             'url': None
         }
     
+    cached = await get_cached_factcheck(claim, language)
+    if cached is not None:
+        if cached.get('rating_fallback') and on_degraded is not None:
+            on_degraded('factcheck_rating_fallback')
+        return cached
+    
+    http = client or get_http_client()
+    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                FACTCHECK_API_URL,
-                params={
-                    'key': settings.google_factcheck_api_key,
-                    'query': claim,
-                    'languageCode': 'en'
-                },
-                timeout=10.0
-            )
-            
-            if response.status_code != 200:
-                return {
-                    'found': False,
-                    'rating': None,
-                    'summary': f'API error: {response.status_code}',
-                    'source': None,
-                    'url': None
-                }
-            
-            data = response.json()
-            claims = data.get('claims', [])
-            
-            if not claims:
-                return {
-                    'found': False,
-                    'rating': None,
-                    'summary': None,
-                    'source': None,
-                    'url': None
-                }
-            
-            # Get the first (most relevant) claim review
-            first_claim = claims[0]
-            claim_reviews = first_claim.get('claimReview', [])
-            
-            if not claim_reviews:
-                return {
-                    'found': False,
-                    'rating': None,
-                    'summary': None,
-                    'source': None,
-                    'url': None
-                }
-            
-            review = claim_reviews[0]
-            original_rating = review.get('textualRating', '')
-            summary_text = first_claim.get('text', '')
-            article_url = review.get('url', '')
-            source_name = review.get('publisher', {}).get('name', 'Unknown')
-            
-            # Try static normalization first
-            normalized_rating = normalize_rating(original_rating)
-            
-            # If static mapping failed, use LLM to interpret with full context
-            if normalized_rating is None:
-                normalized_rating = await llm_interpret_rating(
-                    rating=original_rating,
-                    summary=summary_text,
-                    claim=claim,
-                    url=article_url,
-                    source=source_name
-                )
-            
+        response = await http.get(
+            FACTCHECK_API_URL,
+            params={
+                'key': settings.google_factcheck_api_key,
+                'query': claim,
+                'languageCode': language
+            },
+            timeout=settings.factcheck_timeout_seconds
+        )
+        
+        if response.status_code != 200:
+            if on_degraded is not None:
+                on_degraded('factcheck_error')
             return {
-                'found': True,
-                'rating': normalized_rating,
-                'original_rating': original_rating,
-                'summary': summary_text,
-                'source': source_name,
-                'url': article_url
+                'found': False,
+                'rating': None,
+                'summary': f'API error: {response.status_code}',
+                'source': None,
+                'url': None
             }
-            
+        
+        result = await _parse_factcheck_response(response.json(), claim)
+        
     except Exception as e:
         print(f"Fact-check API error: {e}")
+        if on_degraded is not None:
+            on_degraded('factcheck_error')
         return {
             'found': False,
             'rating': None,
@@ -255,3 +499,10 @@ async def search_factchecks(claim: str) -> Dict:
             'source': None,
             'url': None
         }
+    
+    await store_factcheck(claim, language, result)
+    
+    if result.get('rating_fallback') and on_degraded is not None:
+        on_degraded('factcheck_rating_fallback')
+    
+    return result
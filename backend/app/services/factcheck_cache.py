@@ -0,0 +1,138 @@
+"""
+TruthLens Fact-Check Cache Service
+
+Persists Google Fact Check API results in the database so repeat lookups
+skip the external round trip and survive restarts. Hits and
+"no fact-check found" results are kept for different lengths of time;
+expired rows are deleted hourly by prune_factcheck_cache_periodically.
+"""
+
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.cache import normalize_claim
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.factcheck_cache import FactCheckCache
+
+
+def _query_hash(normalized_query: str) -> str:
+    return hashlib.sha256(normalized_query.encode('utf-8')).hexdigest()
+
+
+async def get_cached_factcheck(query: str, language: str = 'en') -> Optional[Dict]:
+    """
+    Look up a stored fact-check result.
+
+    Args:
+        query: Claim text used as the search query
+        language: Language code of the search
+
+    Returns:
+        Stored result dict, or None if missing, expired or disabled
+    """
+    if not settings.factcheck_cache_enabled:
+        return None
+
+    normalized = normalize_claim(query)
+    if not normalized:
+        return None
+
+    try:
+        async with async_session() as session:
+            row = (await session.execute(
+                select(FactCheckCache).where(
+                    FactCheckCache.query_hash == _query_hash(normalized),
+                    FactCheckCache.language == language
+                )
+            )).scalar_one_or_none()
+    except Exception as e:
+        print(f"Fact-check cache read error: {e}")
+        return None
+
+    if row is None or row.expires_at <= datetime.utcnow():
+        return None
+
+    return row.result
+
+
+async def store_factcheck(query: str, language: str, result: Dict):
+    """
+    Store a fact-check result with a TTL based on whether a fact-check was found.
+
+    A found fact-check whose rating is only the fallback default
+    (rating_fallback) gets the short negative TTL.
+
+    Args:
+        query: Claim text used as the search query
+        language: Language code of the search
+        result: Parsed search_factchecks result
+    """
+    if not settings.factcheck_cache_enabled:
+        return
+
+    normalized = normalize_claim(query)
+    if not normalized:
+        return
+
+    found = bool(result.get('found'))
+    ttl_hours = (
+        settings.factcheck_cache_positive_ttl_hours if found and not result.get('rating_fallback')
+        else settings.factcheck_cache_negative_ttl_hours
+    )
+    now = datetime.utcnow()
+    query_hash = _query_hash(normalized)
+
+    try:
+        async with async_session() as session:
+            row = (await session.execute(
+                select(FactCheckCache).where(
+                    FactCheckCache.query_hash == query_hash,
+                    FactCheckCache.language == language
+                )
+            )).scalar_one_or_none()
+
+            if row is None:
+                row = FactCheckCache(query_hash=query_hash, language=language, query=normalized)
+                session.add(row)
+
+            row.found = found
+            row.result = result
+            row.created_at = now
+            row.expires_at = now + timedelta(hours=ttl_hours)
+
+            await session.commit()
+    except IntegrityError:
+        # Another request stored the same lookup concurrently
+        pass
+    except Exception as e:
+        print(f"Fact-check cache write error: {e}")
+
+
+async def prune_factcheck_cache() -> int:
+    """
+    Delete stored results past their expiry.
+
+    Returns:
+        Number of deleted rows
+    """
+    async with async_session() as session:
+        deleted = await session.execute(
+            delete(FactCheckCache).where(FactCheckCache.expires_at <= datetime.utcnow())
+        )
+        await session.commit()
+    return deleted.rowcount
+
+
+async def prune_factcheck_cache_periodically():
+    """Delete expired fact-check rows hourly until cancelled."""
+    while True:
+        try:
+            await prune_factcheck_cache()
+        except Exception as e:
+            print(f"Fact-check cache pruning failed: {e}")
+        await asyncio.sleep(3600)
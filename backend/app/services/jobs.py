@@ -0,0 +1,252 @@
+"""
+TruthLens Analysis Job Queue
+
+Accepts analysis jobs immediately and runs them on a pool of background
+workers, so request acceptance is decoupled from slow upstream calls.
+
+Jobs are ordered by priority lane (interactive before bulk, FIFO within a
+lane). The queue storage is pluggable through JobQueueBackend; the default
+is an in-process asyncio priority queue.
+
+Job status is stored in the analysis_jobs table, so a poll can be answered
+by any API worker and finished jobs survive restarts. Jobs still queued in
+a process when it shuts down are marked failed.
+"""
+
+import asyncio
+import itertools
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from sqlalchemy import delete, update
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.job import AnalysisJob
+
+
+# Priority lanes (lower runs first)
+PRIORITY_LANES = {
+    'interactive': 0,
+    'bulk': 1,
+}
+
+
+class Job:
+    """A queued analysis job as held by this process; its status lives in AnalysisJob."""
+
+    def __init__(self, user_id: int, payload: Any, priority: str = 'interactive'):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.payload = payload
+        self.priority = priority
+        self.created_at = datetime.utcnow()
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, priority={self.priority})>"
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity."""
+
+
+class JobQueueBackend(ABC):
+    """Storage interface for pending jobs."""
+
+    @abstractmethod
+    async def put(self, job: Job):
+        """Enqueue a job, raising QueueFullError if at capacity."""
+
+    @abstractmethod
+    async def get(self) -> Job:
+        """Wait for and return the next job to run."""
+
+    @abstractmethod
+    def get_nowait(self) -> Optional[Job]:
+        """Return the next job without waiting, or None if there is none."""
+
+    @abstractmethod
+    def qsize(self) -> int:
+        """Number of pending jobs."""
+
+
+class InProcessJobQueue(JobQueueBackend):
+    """asyncio priority queue ordered by (lane, submission order)."""
+
+    def __init__(self, maxsize: int = 0):
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=maxsize)
+        self._counter = itertools.count()
+
+    async def put(self, job: Job):
+        try:
+            self._queue.put_nowait((PRIORITY_LANES[job.priority], next(self._counter), job))
+        except asyncio.QueueFull:
+            raise QueueFullError("Job queue is full")
+
+    async def get(self) -> Job:
+        _, _, job = await self._queue.get()
+        return job
+
+    def get_nowait(self) -> Optional[Job]:
+        try:
+            _, _, job = self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+        return job
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+
+JobHandler = Callable[[Job], Awaitable[Optional[int]]]
+
+
+async def _update_job(job_id: str, **values):
+    async with async_session() as session:
+        await session.execute(update(AnalysisJob).where(AnalysisJob.id == job_id).values(**values))
+        await session.commit()
+
+
+async def get_job_status(job_id: str) -> Optional[AnalysisJob]:
+    """Return the stored status of a job, whichever process ran it."""
+    async with async_session() as session:
+        return await session.get(AnalysisJob, job_id)
+
+
+class JobManager:
+    """Queues jobs and runs them on a pool of worker tasks."""
+
+    def __init__(self, backend: Optional[JobQueueBackend] = None):
+        self.backend = backend
+        self._workers: List[asyncio.Task] = []
+        self._pruner: Optional[asyncio.Task] = None
+        self._handler: Optional[JobHandler] = None
+        self._active = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self, handler: JobHandler, num_workers: Optional[int] = None):
+        """
+        Start the worker pool.
+
+        Args:
+            handler: Coroutine that runs a job and returns the saved check id
+            num_workers: Number of workers (defaults to settings.jobs_workers)
+        """
+        if self.running:
+            return
+        if self.backend is None:
+            self.backend = InProcessJobQueue(maxsize=settings.jobs_max_queue_size)
+
+        self._handler = handler
+        count = num_workers or settings.jobs_workers
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(max(1, count))
+        ]
+        self._pruner = asyncio.create_task(self._prune_finished(), name="job-pruner")
+
+    async def stop(self):
+        """Cancel the workers and mark jobs that did not get to run as failed."""
+        tasks = self._workers + ([self._pruner] if self._pruner else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._pruner = None
+
+        while self.backend is not None and (job := self.backend.get_nowait()) is not None:
+            try:
+                await _update_job(
+                    job.id, status='failed', error='Server shut down before the job ran',
+                    finished_at=datetime.utcnow()
+                )
+            except Exception as e:
+                print(f"Analysis job {job.id} status update failed: {e}")
+
+    async def submit(self, user_id: int, payload: Any, priority: str = 'interactive') -> Job:
+        """
+        Queue a job and store its status row.
+
+        Raises:
+            ValueError: If the priority lane is unknown
+            QueueFullError: If the queue is at capacity
+            RuntimeError: If the workers are not running
+        """
+        if priority not in PRIORITY_LANES:
+            raise ValueError(f"Unknown priority lane '{priority}'")
+        if not self.running:
+            raise RuntimeError("Job workers are not running")
+        if self.backend.qsize() >= settings.jobs_max_queue_size > 0:
+            raise QueueFullError("Job queue is full")
+
+        job = Job(user_id, payload, priority)
+        # The row exists before a worker can pick the job up
+        async with async_session() as session:
+            session.add(AnalysisJob(
+                id=job.id, user_id=user_id, priority=priority,
+                status='queued', created_at=job.created_at
+            ))
+            await session.commit()
+
+        try:
+            await self.backend.put(job)
+        except QueueFullError:
+            async with async_session() as session:
+                await session.execute(delete(AnalysisJob).where(AnalysisJob.id == job.id))
+                await session.commit()
+            raise
+        return job
+
+    async def _worker(self):
+        while True:
+            job = await self.backend.get()
+            self._active += 1
+            values = {}
+            try:
+                await _update_job(job.id, status='running', started_at=datetime.utcnow())
+                check_id = await self._handler(job)
+                values = {'status': 'completed', 'check_id': check_id}
+            except asyncio.CancelledError:
+                values = {'status': 'failed', 'error': 'Cancelled during shutdown'}
+                raise
+            except Exception as e:
+                print(f"Analysis job {job.id} failed: {e}")
+                values = {'status': 'failed', 'error': str(e)}
+            finally:
+                self._active -= 1
+                try:
+                    await asyncio.shield(_update_job(job.id, finished_at=datetime.utcnow(), **values))
+                except Exception as e:
+                    print(f"Analysis job {job.id} status update failed: {e}")
+
+    async def _prune_finished(self):
+        """Delete finished job rows older than jobs_retention_seconds, hourly."""
+        while True:
+            cutoff = datetime.utcnow() - timedelta(seconds=settings.jobs_retention_seconds)
+            try:
+                async with async_session() as session:
+                    await session.execute(
+                        delete(AnalysisJob).where(
+                            AnalysisJob.finished_at.is_not(None),
+                            AnalysisJob.finished_at < cutoff
+                        )
+                    )
+                    await session.commit()
+            except Exception as e:
+                print(f"Analysis job pruning failed: {e}")
+            await asyncio.sleep(min(3600, settings.jobs_retention_seconds))
+
+    def stats(self) -> Dict:
+        """Return queue depth and worker count of this process."""
+        return {
+            'workers': len(self._workers),
+            'queued': self.backend.qsize() if self.backend else 0,
+            'running': self._active
+        }
+
+
+job_manager = JobManager()
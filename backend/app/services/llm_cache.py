@@ -0,0 +1,100 @@
+"""
+TruthLens LLM Response Cache
+
+Content-addressed cache for Gemini responses. Entries are keyed by a hash
+of (model name, generation config, prompt text), so identical prompts from
+any user or service are answered without a new LLM call.
+
+Storage is pluggable: the default backend is an in-process TTL/LRU cache,
+and alternative stores (e.g. Redis) can be installed with
+``set_llm_cache_backend``.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Dict, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+class LLMCacheBackend(ABC):
+    """Storage interface for cached LLM responses."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for key, or None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str):
+        """Store response text for key."""
+
+    def stats(self) -> Dict:
+        """Return backend-specific size information."""
+        return {}
+
+
+class MemoryLLMCache(LLMCacheBackend):
+    """In-process backend with size and TTL eviction."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str):
+        self._cache.set(key, value)
+
+    def stats(self) -> Dict:
+        stats = self._cache.stats()
+        return {
+            'size': stats['size'],
+            'maxsize': stats['maxsize'],
+            'ttl_seconds': stats['ttl_seconds']
+        }
+
+
+_backend: LLMCacheBackend = MemoryLLMCache(
+    maxsize=settings.llm_cache_size,
+    ttl=settings.llm_cache_ttl_seconds
+)
+
+# Per call site hit/miss counters
+_site_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {'hits': 0, 'misses': 0})
+
+
+def llm_cache_key(model_name: str, config_key: str, prompt: str) -> str:
+    """Hash the inputs that determine an LLM response."""
+    digest = hashlib.sha256()
+    for part in (model_name, config_key, prompt):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def get_llm_cache_backend() -> LLMCacheBackend:
+    """Get the active cache backend."""
+    return _backend
+
+
+def set_llm_cache_backend(backend: LLMCacheBackend):
+    """Replace the cache backend (e.g. with a shared external store)."""
+    global _backend
+    _backend = backend
+
+
+def record_lookup(site: str, hit: bool):
+    """Count a cache lookup for a call site."""
+    _site_stats[site]['hits' if hit else 'misses'] += 1
+
+
+def llm_cache_stats() -> Dict:
+    """Return backend stats and per call site hit/miss counters."""
+    return {
+        'enabled': settings.llm_cache_enabled,
+        'backend': type(_backend).__name__,
+        **_backend.stats(),
+        'sites': {site: dict(counts) for site, counts in _site_stats.items()}
+    }
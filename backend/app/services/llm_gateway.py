@@ -0,0 +1,174 @@
+"""
+TruthLens LLM Gateway
+
+Single entry point for Gemini calls made by the analysis services.
+Calls are made with the SDK's native async API so they never block the
+event loop; a small dedicated thread pool is used only when a model does
+not expose an async method. Responses are looked up in the LLM response
+cache (app.services.llm_cache) before any call is made.
+
+The Gemini SDK is imported when the first model is created, not when this
+module is imported.
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+from app.core.config import settings
+from app.services.llm_cache import get_llm_cache_backend, llm_cache_key, record_lookup
+
+
+# Default Gemini model used by all services
+DEFAULT_MODEL = 'gemini-2.5-flash'
+
+# Process-wide model registry keyed by (model name, generation config)
+_models: Dict[Tuple[str, str], "genai.GenerativeModel"] = {}
+_models_lock = threading.Lock()
+_configured = False
+
+# Process-wide limit on concurrent Gemini calls (created lazily)
+_semaphore: Optional[asyncio.Semaphore] = None
+
+# Dedicated pool for blocking SDK calls (created lazily)
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding in-flight Gemini calls."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(max(1, settings.llm_max_concurrency))
+    return _semaphore
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the bounded thread pool used for blocking SDK calls."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.llm_thread_pool_size),
+            thread_name_prefix='llm'
+        )
+    return _executor
+
+
+def _config_key(generation_config: Optional[Dict]) -> str:
+    """Stable registry key for a generation config."""
+    if not generation_config:
+        return ''
+    return json.dumps(generation_config, sort_keys=True)
+
+
+def get_model(
+    model_name: str = DEFAULT_MODEL,
+    generation_config: Optional[Dict] = None
+) -> "genai.GenerativeModel":
+    """
+    Get a shared Gemini model, creating it on first use.
+
+    The SDK is configured once per process and each (model, config) pair is
+    constructed once, so repeated calls reuse the same client and transport.
+
+    Args:
+        model_name: Gemini model name
+        generation_config: Optional generation config (temperature, etc.)
+
+    Returns:
+        Shared GenerativeModel instance
+    """
+    global _configured
+    key = (model_name, _config_key(generation_config))
+
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    import google.generativeai as genai
+
+    with _models_lock:
+        if not _configured:
+            genai.configure(api_key=settings.gemini_api_key)
+            _configured = True
+
+        model = _models.get(key)
+        if model is None:
+            model = genai.GenerativeModel(model_name, generation_config=generation_config)
+            _models[key] = model
+
+    return model
+
+
+def init_llm_models():
+    """Configure the SDK and create the default model at startup."""
+    if not settings.gemini_api_key:
+        return
+    get_model(DEFAULT_MODEL)
+
+
+async def generate_text(
+    prompt: str,
+    model_name: str = DEFAULT_MODEL,
+    generation_config: Optional[Dict] = None,
+    site: str = 'default',
+    use_cache: bool = True
+) -> str:
+    """
+    Generate a completion for a prompt without blocking the event loop.
+
+    Args:
+        prompt: Prompt text
+        model_name: Gemini model to use
+        generation_config: Optional generation config for the model
+        site: Call site name used for cache hit statistics
+        use_cache: Whether to consult and fill the response cache
+
+    Returns:
+        Stripped response text
+
+    Raises:
+        Exception: Any SDK or timeout error, so callers can apply their own fallback
+    """
+    cache = get_llm_cache_backend() if use_cache and settings.llm_cache_enabled else None
+    key = None
+
+    if cache is not None:
+        key = llm_cache_key(model_name, _config_key(generation_config), prompt)
+        cached = await cache.get(key)
+        record_lookup(site, cached is not None)
+        if cached is not None:
+            return cached
+
+    model = get_model(model_name, generation_config)
+
+    async with _get_semaphore():
+        if hasattr(model, 'generate_content_async'):
+            call = model.generate_content_async(prompt)
+        else:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(_get_executor(), model.generate_content, prompt)
+
+        response = await asyncio.wait_for(call, timeout=settings.llm_timeout_seconds)
+
+    text = response.text.strip()
+
+    if cache is not None and text:
+        await cache.set(key, text)
+
+    return text
+
+
+def shutdown_llm_gateway():
+    """Release the blocking-call thread pool and drop shared models."""
+    global _executor, _configured
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    with _models_lock:
+        _models.clear()
+        _configured = False
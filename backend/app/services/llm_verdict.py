@@ -5,8 +5,8 @@ Uses Gemini to assess claims when traditional fact-checking yields insufficient
 This is a fallback for obvious claims that can be verified with common knowledge.
 """
 
-import google.generativeai as genai
 from app.core.config import settings
+from app.services.llm_gateway import generate_text
 
 
 async def llm_assess_claim(claim: str) -> dict:
@@ -40,9 +40,6 @@ async def llm_assess_claim(claim: str) -> dict:
         }
     
     try:
-        genai.configure(api_key=settings.gemini_api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
         prompt = f"""You are a fact-checker AI. Assess the following claim based on scientific consensus and widely verified facts.
 
 CLAIM: "{claim}"
@@ -65,8 +62,7 @@ Examples:
 
 Now assess the claim:"""
 
-        response = model.generate_content(prompt)
-        response_text = response.text.strip()
+        response_text = await generate_text(prompt, site='verdict')
         
         # Parse response
         verdict = None
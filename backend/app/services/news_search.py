@@ -2,33 +2,131 @@
 TruthLens News Search Service
 
 Retrieves related news articles using GNews API.
+
+Article lists are cached per (query, language, max_results). Fresh entries
+are served directly; stale entries are served immediately while a
+background task refreshes them (stale-while-revalidate), which keeps
+popular claims from exhausting the GNews daily quota.
 """
 
-from typing import List, Dict
+import asyncio
+import time
+from typing import Callable, List, Dict, Optional
 import httpx
 
+from app.core.cache import TTLCache, normalize_claim
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.services.domain_trust import extract_domain
 
 
 # GNews API endpoint
 GNEWS_API_URL = "https://gnews.io/api/v4/search"
 
+# Cached article lists: key -> (articles, fetched_at)
+news_cache = TTLCache(
+    maxsize=settings.news_cache_size,
+    ttl=settings.news_cache_fresh_seconds + settings.news_cache_stale_seconds
+)
+
+# In-flight background refreshes, so each key is refreshed at most once at a time
+_refresh_tasks: Dict[tuple, asyncio.Task] = {}
+
+
+async def _fetch_news(
+    query: str,
+    language: str,
+    max_results: int,
+    http: httpx.AsyncClient
+) -> Optional[List[Dict]]:
+    """
+    Query GNews for articles.
+
+    Returns:
+        List of article dicts, or None if the request failed
+    """
+    try:
+        response = await http.get(
+            GNEWS_API_URL,
+            params={
+                'apikey': settings.gnews_api_key,
+                'q': query,
+                'lang': language,
+                'max': max_results,
+                'sortby': 'relevance'
+            },
+            timeout=settings.gnews_timeout_seconds
+        )
+
+        if response.status_code != 200:
+            return None
+
+        data = response.json()
+        articles = data.get('articles', [])
+
+        results = []
+        for article in articles:
+            url = article.get('url', '')
+            results.append({
+                'title': article.get('title', ''),
+                'description': article.get('description', ''),
+                'domain': extract_domain(url) if url else None,
+                'url': url,
+                'source': article.get('source', {}).get('name', ''),
+                'published_at': article.get('publishedAt', '')
+            })
+
+        return results
+
+    except Exception as e:
+        print(f"GNews API error: {e}")
+        return None
+
 
-async def search_news(claim: str, max_results: int = 5) -> List[Dict]:
+async def _refresh_news(key: tuple, query: str, language: str, max_results: int):
+    """Refresh a stale cache entry in the background."""
+    try:
+        results = await _fetch_news(query, language, max_results, get_http_client())
+        if results is not None:
+            news_cache.set(key, (results, time.monotonic()))
+    finally:
+        _refresh_tasks.pop(key, None)
+
+
+def _schedule_refresh(key: tuple, query: str, language: str, max_results: int):
+    if key in _refresh_tasks:
+        return
+    _refresh_tasks[key] = asyncio.create_task(
+        _refresh_news(key, query, language, max_results)
+    )
+
+
+async def search_news(
+    claim: str,
+    max_results: int = 5,
+    language: str = 'en',
+    client: Optional[httpx.AsyncClient] = None,
+    on_degraded: Optional[Callable[[str], None]] = None
+) -> List[Dict]:
     """
     Search for news articles related to a claim.
-    
+
     Args:
         claim: The claim to search for
         max_results: Maximum number of results to return
-        
+        language: Language code for the search
+        client: HTTP client to use (defaults to the shared pooled client)
+        on_degraded: Called with a reason when the request failed and no
+            articles could be returned
+
     Returns:
-        List of article dicts with title, description, domain, url
+        List of article dicts with title, description, domain and url.
+        Trust is not attached: cached lists outlive domain store reloads,
+        so weighted_stance resolves it from the domain when weighting.
     """
     if not claim:
         return []
-    
+
     if not settings.gnews_api_key:
         return [{
             'title': 'News API not configured',
@@ -36,41 +134,27 @@ async def search_news(claim: str, max_results: int = 5) -> List[Dict]:
             'domain': None,
             'url': None
         }]
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                GNEWS_API_URL,
-                params={
-                    'apikey': settings.gnews_api_key,
-                    'q': claim[:200],  # Limit query length
-                    'lang': 'en',
-                    'max': max_results,
-                    'sortby': 'relevance'
-                },
-                timeout=10.0
-            )
-            
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
-            articles = data.get('articles', [])
-            
-            results = []
-            for article in articles:
-                url = article.get('url', '')
-                results.append({
-                    'title': article.get('title', ''),
-                    'description': article.get('description', ''),
-                    'domain': extract_domain(url),
-                    'url': url,
-                    'source': article.get('source', {}).get('name', ''),
-                    'published_at': article.get('publishedAt', '')
-                })
-            
-            return results
-            
-    except Exception as e:
-        print(f"GNews API error: {e}")
+
+    query = claim[:200]  # Limit query length
+    key = (normalize_claim(query), language, max_results)
+
+    if settings.news_cache_enabled:
+        entry = news_cache.get(key)
+        if entry is not None:
+            articles, fetched_at = entry
+            if time.monotonic() - fetched_at > settings.news_cache_fresh_seconds:
+                # Stale: serve now, refresh in the background
+                _schedule_refresh(key, query, language, max_results)
+            return list(articles)
+
+    results = await _fetch_news(query, language, max_results, client or get_http_client())
+
+    if results is None:
+        if on_degraded is not None:
+            on_degraded('news_error')
         return []
+
+    if settings.news_cache_enabled:
+        news_cache.set(key, (results, time.monotonic()))
+
+    return list(results)
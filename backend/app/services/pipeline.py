@@ -0,0 +1,346 @@
+"""
+TruthLens Analysis Pipeline
+
+Runs the verification steps as a small dependency graph so that independent
+stages (e.g. fact-check lookup and news retrieval) overlap instead of
+executing one after another.
+"""
+
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.domain_trust import score_domain, extract_domain
+from app.services.claim_extractor import extract_claims
+from app.services.factcheck import search_factchecks
+from app.services.news_search import search_news
+from app.services.stance import classify_all_stances, weighted_stance
+from app.services.aggregation import aggregate_verdict
+from app.services.explanation import generate_explanation
+from app.services.llm_verdict import llm_assess_claim
+from app.services.result_cache import get_cached_analysis, store_analysis
+from app.services.claim_index import find_similar_analysis
+
+
+class Stage:
+    """A named pipeline step and the stages whose results it needs."""
+
+    def __init__(self, name: str, func: Callable[[Dict], Any], depends_on: Iterable[str] = ()):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+    def __repr__(self):
+        return f"<Stage(name={self.name}, depends_on={self.depends_on})>"
+
+
+def _topological_order(stages: List[Stage]) -> List[Stage]:
+    """
+    Order stages so every stage comes after its dependencies.
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle
+    """
+    by_name = {stage.name: stage for stage in stages}
+    ordered: List[Stage] = []
+    state: Dict[str, str] = {}
+
+    def visit(stage: Stage):
+        if state.get(stage.name) == 'done':
+            return
+        if state.get(stage.name) == 'visiting':
+            raise ValueError(f"Pipeline stage cycle detected at '{stage.name}'")
+        state[stage.name] = 'visiting'
+        for dep in stage.depends_on:
+            if dep not in by_name:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+            visit(by_name[dep])
+        state[stage.name] = 'done'
+        ordered.append(stage)
+
+    for stage in stages:
+        visit(stage)
+
+    return ordered
+
+
+async def run_stages(
+    stages: List[Stage],
+    context: Optional[Dict] = None,
+    on_stage_complete: Optional[Callable[[str, Any], None]] = None
+) -> Tuple[Dict, Dict[str, Dict[str, float]]]:
+    """
+    Execute stages concurrently, starting each one as soon as its inputs are ready.
+
+    Each stage function receives the shared results dict (seeded with
+    ``context``) and may be sync or async. Its return value is stored under
+    the stage name.
+
+    Args:
+        stages: Stages making up the graph
+        context: Initial values available to every stage
+        on_stage_complete: Called with (stage name, value) as each stage finishes
+
+    Returns:
+        Tuple of (results keyed by stage name, timings keyed by stage name).
+        Timings hold ``start_ms`` (offset from pipeline start) and ``duration_ms``.
+    """
+    ordered = _topological_order(stages)
+    results: Dict[str, Any] = dict(context or {})
+    timings: Dict[str, Dict[str, float]] = {}
+    tasks: Dict[str, asyncio.Task] = {}
+    pipeline_start = time.perf_counter()
+
+    async def run(stage: Stage):
+        if stage.depends_on:
+            await asyncio.gather(*(tasks[dep] for dep in stage.depends_on))
+
+        stage_start = time.perf_counter()
+        value = stage.func(results)
+        if inspect.isawaitable(value):
+            value = await value
+        stage_end = time.perf_counter()
+
+        results[stage.name] = value
+        timings[stage.name] = {
+            'start_ms': round((stage_start - pipeline_start) * 1000, 1),
+            'duration_ms': round((stage_end - stage_start) * 1000, 1)
+        }
+        if on_stage_complete is not None:
+            on_stage_complete(stage.name, value)
+        return value
+
+    for stage in ordered:
+        tasks[stage.name] = asyncio.create_task(run(stage), name=f"stage:{stage.name}")
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    timings['total'] = {
+        'start_ms': 0.0,
+        'duration_ms': round((time.perf_counter() - pipeline_start) * 1000, 1)
+    }
+
+    return results, timings
+
+
+def build_input_text(text: Optional[str], url: Optional[str]) -> str:
+    """Build the text used for claim extraction from the request fields."""
+    input_text = text or ""
+
+    # If URL provided but no text, use URL for claim extraction
+    # In production, you'd fetch the URL content here
+    if url and not input_text:
+        input_text = f"Content from: {url}"
+
+    return input_text
+
+
+async def _extract_primary_claim(results: Dict) -> str:
+    input_text = results['input_text']
+    claim_result = await extract_claims(input_text)
+    primary_claim = claim_result.get('primary_claim')
+
+    if not primary_claim:
+        # Use the input text as the claim if extraction fails
+        primary_claim = input_text[:500] if input_text else "Unknown claim"
+
+    return primary_claim
+
+
+async def _decide_verdict(results: Dict) -> Dict:
+    verdict_result = aggregate_verdict(
+        factcheck_result=results['factcheck'],
+        stance_summary=results['stance_summary'],
+        domain_trust=results['domain_trust']
+    )
+
+    # LLM fallback for inconclusive verdicts
+    # If no clear verdict from fact-checks/evidence, use LLM to assess obvious claims
+    if verdict_result.get('basis') in ['insufficient_evidence', 'mixed_evidence']:
+        llm_result = await llm_assess_claim(results['claim'])
+        if llm_result.get('used') and llm_result.get('verdict'):
+            # LLM provided a verdict - use it but mark confidence appropriately
+            verdict_result = {
+                'verdict': llm_result['verdict'],
+                'confidence': llm_result.get('confidence', 'medium'),
+                'basis': 'llm_assessment'
+            }
+
+    return verdict_result
+
+
+async def _explain(results: Dict) -> str:
+    verdict_result = results['verdict']
+    return await generate_explanation({
+        'claim': results['claim'],
+        'verdict': verdict_result['verdict'],
+        'confidence': verdict_result['confidence'],
+        'factcheck': results['factcheck'],
+        'stance_summary': results['stance_summary'],
+        'domain_trust': results['domain_trust']
+    })
+
+
+# Analysis graph:
+#   domain_trust ───────────────────────────────┐
+#   claim ─┬─ factcheck ────────────────────────┼─ verdict ─ explanation
+#          └─ news ─ stances ─ stance_summary ──┘
+ANALYSIS_STAGES = [
+    Stage('domain_trust', lambda r: score_domain(r['url'])),
+    Stage('claim', _extract_primary_claim),
+    Stage('factcheck', lambda r: search_factchecks(r['claim'], r['language'], on_degraded=r['degraded'].append),
+          depends_on=['claim']),
+    Stage('news', lambda r: search_news(r['claim'], max_results=5, language=r['language'],
+                                        on_degraded=r['degraded'].append),
+          depends_on=['claim']),
+    Stage('stances', lambda r: classify_all_stances(r['claim'], r['news'], on_result=r.get('on_evidence'),
+                                                    on_degraded=r['degraded'].append),
+          depends_on=['news']),
+    Stage('stance_summary', lambda r: weighted_stance(r['stances']), depends_on=['stances']),
+    Stage('verdict', _decide_verdict, depends_on=['factcheck', 'stance_summary', 'domain_trust']),
+    Stage('explanation', _explain, depends_on=['verdict']),
+]
+
+
+# Stages streamed to clients, with how each result is presented as an event payload
+STREAMED_STAGES = {
+    'domain_trust': lambda value: value,
+    'claim': lambda value: {'claim': value},
+    'factcheck': lambda value: value,
+    'stance_summary': lambda value: value,
+    'verdict': lambda value: value,
+    'explanation': lambda value: {'explanation': value},
+}
+
+
+def _replay_events(result: Dict, on_event: Callable[[str, Dict], None]):
+    """Emit the stage events for an already computed (cached) result."""
+    on_event('domain_trust', result['domain_trust'])
+    on_event('claim', {'claim': result['claim']})
+    on_event('factcheck', result['factcheck'])
+    for index, article in enumerate(result['articles']):
+        on_event('evidence', {'index': index, **article})
+    on_event('stance_summary', result['stance_summary'])
+    on_event('verdict', {
+        'verdict': result['verdict'],
+        'confidence': result['confidence'],
+        'basis': result.get('basis')
+    })
+    on_event('explanation', {'explanation': result['explanation']})
+
+
+async def run_analysis(
+    text: Optional[str],
+    url: Optional[str] = None,
+    language: str = 'en',
+    use_cache: bool = True,
+    on_event: Optional[Callable[[str, Dict], None]] = None
+) -> Dict:
+    """
+    Run the full verification pipeline for a claim.
+
+    Results are served from the analysis cache when an equivalent claim
+    (same canonical text, URL domain and pipeline version) was analyzed
+    recently in the same language, or from the similar claim index when a
+    close paraphrase of the submitted text was. With ``use_cache=False``
+    both lookups are skipped but the fresh result still refreshes the cache.
+    Results of degraded runs (a stage fell back after an API or LLM failure)
+    are not cached.
+
+    Args:
+        text: Claim or article text
+        url: Optional article URL
+        language: Language code of the claim
+        use_cache: Whether to serve a cached result when available
+        on_event: Called with (event name, payload) as results become available:
+            domain_trust, claim, factcheck, evidence (one per article),
+            stance_summary, verdict and explanation
+
+    Returns:
+        Dict with claim, domain_trust, factcheck, articles (with stance),
+        stance_summary, verdict, confidence, explanation, per-stage timings,
+        whether the result came from the cache and the degraded stages'
+        reasons (empty when every stage succeeded)
+    """
+    input_text = build_input_text(text, url)
+
+    if use_cache:
+        lookup_start = time.perf_counter()
+        cached = get_cached_analysis(input_text, url, language)
+        if cached is not None:
+            lookup_ms = round((time.perf_counter() - lookup_start) * 1000, 1)
+            result = {
+                **cached,
+                'cached': True,
+                'timings': {'cache': {'start_ms': 0.0, 'duration_ms': lookup_ms},
+                            'total': {'start_ms': 0.0, 'duration_ms': lookup_ms}}
+            }
+            if on_event is not None:
+                _replay_events(result, on_event)
+            return result
+
+        # URL-only submissions are not matched: the placeholder text says nothing about the claim
+        similar = find_similar_analysis(input_text, extract_domain(url) if url else None, language) if text else None
+        if similar is not None:
+            lookup_ms = round((time.perf_counter() - lookup_start) * 1000, 1)
+            result = {
+                **similar['payload'],
+                # The reused analysis was extracted from another submission
+                'claim': input_text[:500],
+                'cached': True,
+                'similar_claim': similar['text'],
+                'similarity': similar['similarity'],
+                'timings': {'similar_claim': {'start_ms': 0.0, 'duration_ms': lookup_ms},
+                            'total': {'start_ms': 0.0, 'duration_ms': lookup_ms}}
+            }
+            if on_event is not None:
+                _replay_events(result, on_event)
+            return result
+
+    context = {
+        'text': text,
+        'url': url,
+        'language': language,
+        'input_text': input_text,
+        # Reasons reported by stages that fell back instead of succeeding
+        'degraded': []
+    }
+    on_stage_complete = None
+
+    if on_event is not None:
+        context['on_evidence'] = lambda index, article: on_event('evidence', {'index': index, **article})
+
+        def on_stage_complete(name: str, value: Any):
+            if name in STREAMED_STAGES:
+                on_event(name, STREAMED_STAGES[name](value))
+
+    results, timings = await run_stages(ANALYSIS_STAGES, context, on_stage_complete)
+
+    verdict_result = results['verdict']
+
+    result = {
+        'claim': results['claim'],
+        'domain_trust': results['domain_trust'],
+        'factcheck': results['factcheck'],
+        'articles': results['stances'],
+        'stance_summary': results['stance_summary'],
+        'verdict': verdict_result['verdict'],
+        'confidence': verdict_result['confidence'],
+        'basis': verdict_result.get('basis'),
+        'explanation': results['explanation'],
+        'timings': timings,
+        'cached': False,
+        'degraded': sorted(set(results['degraded']))
+    }
+
+    # A fallback result would otherwise be served until the TTL expires
+    if not result['degraded']:
+        store_analysis(input_text, url, language, result)
+
+    return result
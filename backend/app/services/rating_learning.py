@@ -0,0 +1,239 @@
+"""
+TruthLens Rating Learning Service
+
+Learns what publishers' textual fact-check ratings mean when the static
+rating table has no match. Each time such a rating is seen, the LLM is asked
+what the label means on its own (publisher and rating text only, no claim or
+article), and the answer is counted per (publisher, normalized rating). Once
+a rating has been interpreted the same way rating_learning_promote_after
+times, and never differently, it is promoted and answered from the table
+from then on. Labels whose meaning depends on the article ("Explainer") are
+promoted as CONTEXTUAL: they keep using the per-article LLM prompt but are
+no longer sampled.
+
+Lookups read the database, so a promotion or deletion made by one API
+worker applies to all of them immediately. Deleting an entry makes the LLM
+decide again.
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.core.config import settings
+from app.core.database import async_session, engine
+from app.models.rating_interpretation import CONTEXTUAL, VERDICT_COLUMNS, RatingInterpretation
+
+
+_EDGE_PUNCTUATION = re.compile(r'^[\W_]+|[\W_]+$')
+_WORD_SEPARATOR = re.compile(r'[\s\-]+')
+
+_COLUMN_VERDICTS = {column: verdict for verdict, column in VERDICT_COLUMNS.items()}
+
+_stats = {'learned_hits': 0, 'llm_fallbacks': 0, 'samples': 0, 'promotions': 0}
+
+
+def rating_key(publisher: Optional[str], rating: Optional[str]) -> Tuple[str, str]:
+    """
+    Normalize a (publisher, textual rating) pair for lookup.
+
+    Case, surrounding punctuation and whitespace/hyphen runs are ignored,
+    so "Pants on Fire!" and "pants-on-fire" share an entry.
+    """
+    publisher = _WORD_SEPARATOR.sub(' ', (publisher or '').strip().lower())
+    rating = (rating or '').lower().replace('\u2019', "'")
+    rating = _WORD_SEPARATOR.sub(' ', _EDGE_PUNCTUATION.sub('', rating))
+    return publisher[:255], rating[:255]
+
+
+async def learned_rating(publisher: Optional[str], rating: Optional[str]) -> Tuple[Optional[str], bool]:
+    """
+    Look up a publisher's textual rating in the learned table.
+
+    Args:
+        publisher: Fact-checking organization name
+        rating: Textual rating as published
+
+    Returns:
+        Tuple of (promoted verdict or None, whether the rating should be
+        sampled with the rating-only LLM prompt)
+    """
+    if not settings.rating_learning_enabled:
+        return None, False
+
+    key = rating_key(publisher, rating)
+    if not key[1]:
+        return None, False
+
+    try:
+        async with async_session() as session:
+            row = (await session.execute(
+                select(
+                    RatingInterpretation.verdict,
+                    RatingInterpretation.promoted,
+                    RatingInterpretation.sightings
+                ).where(
+                    RatingInterpretation.publisher == key[0],
+                    RatingInterpretation.rating == key[1]
+                )
+            )).first()
+    except Exception as e:
+        print(f"Learned rating read error: {e}")
+        return None, False
+
+    if row is None:
+        _stats['llm_fallbacks'] += 1
+        return None, True
+
+    verdict, promoted, sightings = row
+    if promoted and verdict != CONTEXTUAL:
+        _stats['learned_hits'] += 1
+        return verdict, False
+
+    _stats['llm_fallbacks'] += 1
+    # Stop sampling labels that are settled as contextual or never became consistent
+    return None, not promoted and sightings < settings.rating_learning_max_samples
+
+
+def _insert():
+    # Both dialects support INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+    return sqlite_insert if engine.dialect.name == 'sqlite' else postgresql_insert
+
+
+async def record_interpretation(publisher: Optional[str], rating: Optional[str], verdict: str):
+    """
+    Count one rating-only LLM interpretation and promote the rating once it is consistent.
+
+    The sighting is counted with a single INSERT ... ON CONFLICT DO UPDATE
+    that increments the verdict's counter in SQL, so concurrent sightings
+    (including of a new rating) are never lost. The derived verdict and
+    promotion are then written only if no later sighting landed meanwhile;
+    that sighting's own update takes care of them.
+
+    Args:
+        publisher: Fact-checking organization name
+        rating: Textual rating as published
+        verdict: True, False, Misleading, Unverifiable or CONTEXTUAL
+    """
+    if not settings.rating_learning_enabled or verdict not in VERDICT_COLUMNS:
+        return
+
+    key = rating_key(publisher, rating)
+    if not key[1]:
+        return
+
+    now = datetime.utcnow()
+    table = RatingInterpretation.__table__
+    column = VERDICT_COLUMNS[verdict]
+    counters = list(VERDICT_COLUMNS.values())
+
+    statement = _insert()(table).values(
+        publisher=key[0], rating=key[1], original_rating=rating, verdict=verdict,
+        sightings=1, promoted=False, created_at=now, updated_at=now,
+        **{name: int(name == column) for name in counters}
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=['publisher', 'rating'],
+        set_={
+            column: table.c[column] + 1,
+            'sightings': table.c.sightings + 1,
+            'updated_at': now,
+        }
+    ).returning(table.c.id, table.c.sightings, table.c.promoted, *(table.c[name] for name in counters))
+
+    try:
+        async with async_session() as session:
+            row = (await session.execute(statement)).one()
+            counts = {name: row._mapping[name] for name in counters}
+
+            # A single disagreement keeps (or takes) the rating out of the table
+            top = max(counts, key=counts.get)
+            promoted = counts[top] == row.sightings >= settings.rating_learning_promote_after
+            values = {'verdict': _COLUMN_VERDICTS[top], 'promoted': promoted}
+            if promoted and not row.promoted:
+                values['promoted_at'] = now
+
+            await session.execute(
+                update(RatingInterpretation)
+                .where(RatingInterpretation.id == row.id, RatingInterpretation.sightings == row.sightings)
+                .values(**values)
+            )
+            await session.commit()
+    except Exception as e:
+        print(f"Learned rating write error: {e}")
+        return
+
+    _stats['samples'] += 1
+    if promoted and not row.promoted:
+        _stats['promotions'] += 1
+
+
+async def list_learned_ratings(
+    promoted: Optional[bool] = None,
+    publisher: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Tuple[List[RatingInterpretation], int]:
+    """
+    List learned ratings for review, most seen first.
+
+    Args:
+        promoted: Only promoted (True) or only pending (False) entries
+        publisher: Only entries of this publisher
+        limit: Maximum entries to return (all if None)
+        offset: Entries to skip
+
+    Returns:
+        Tuple of (entries, total matching entries)
+    """
+    filters = []
+    if promoted is not None:
+        filters.append(RatingInterpretation.promoted.is_(promoted))
+    if publisher:
+        filters.append(RatingInterpretation.publisher == rating_key(publisher, '')[0])
+
+    query = (
+        select(RatingInterpretation)
+        .where(*filters)
+        .order_by(RatingInterpretation.sightings.desc(), RatingInterpretation.id)
+        .offset(offset)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+
+    async with async_session() as session:
+        total = (await session.execute(
+            select(func.count()).select_from(RatingInterpretation).where(*filters)
+        )).scalar()
+        rows = (await session.execute(query)).scalars().all()
+
+    return list(rows), total
+
+
+async def forget_learned_rating(entry_id: int) -> bool:
+    """
+    Delete a learned rating so the LLM interprets it again.
+
+    Returns:
+        True if the entry existed
+    """
+    async with async_session() as session:
+        row = await session.get(RatingInterpretation, entry_id)
+        if row is None:
+            return False
+        await session.delete(row)
+        await session.commit()
+    return True
+
+
+def learned_rating_stats() -> Dict:
+    """Return how often fact-check ratings were answered from the learned table."""
+    lookups = _stats['learned_hits'] + _stats['llm_fallbacks']
+    return {
+        'enabled': settings.rating_learning_enabled,
+        **_stats,
+        'hit_rate': round(_stats['learned_hits'] / lookups, 3) if lookups else 0.0
+    }
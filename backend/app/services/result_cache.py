@@ -0,0 +1,68 @@
+"""
+TruthLens Analysis Result Cache
+
+Caches full pipeline results keyed by the canonicalized claim, the
+pipeline version and the submitted URL's domain.
+"""
+
+from typing import Dict, Optional
+
+from app.core.cache import TTLCache, normalize_claim
+from app.core.config import settings
+from app.services.domain_trust import extract_domain
+
+
+analysis_cache = TTLCache(
+    maxsize=settings.analysis_cache_size,
+    ttl=settings.analysis_cache_ttl_seconds
+)
+
+
+def analysis_cache_key(
+    input_text: str,
+    url: Optional[str] = None,
+    language: str = 'en'
+) -> Optional[tuple]:
+    """
+    Build the cache key for an analysis request.
+
+    Args:
+        input_text: Text the claim is extracted from
+        url: Optional article URL (only its domain is part of the key)
+        language: Language code of the request
+
+    Returns:
+        Key tuple, or None if the text normalizes to nothing
+    """
+    claim_key = normalize_claim(input_text)
+    if not claim_key:
+        return None
+
+    domain = extract_domain(url) if url else None
+    return (settings.pipeline_version, language, domain or '', claim_key)
+
+
+def get_cached_analysis(
+    input_text: str,
+    url: Optional[str] = None,
+    language: str = 'en'
+) -> Optional[Dict]:
+    """Return a cached pipeline result, if any."""
+    if not settings.analysis_cache_enabled:
+        return None
+
+    key = analysis_cache_key(input_text, url, language)
+    if key is None:
+        return None
+
+    return analysis_cache.get(key)
+
+
+def store_analysis(input_text: str, url: Optional[str], language: str, result: Dict):
+    """Cache a pipeline result."""
+    if not settings.analysis_cache_enabled:
+        return
+
+    key = analysis_cache_key(input_text, url, language)
+    if key is not None:
+        analysis_cache.set(key, result)
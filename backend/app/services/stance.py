@@ -4,24 +4,60 @@ TruthLens Stance Classification Service
 Uses Gemini to classify the stance of evidence snippets toward a claim.
 """
 
-from typing import List, Dict
-import google.generativeai as genai
+import asyncio
+import hashlib
+from contextlib import AsyncExitStack
+from typing import Callable, List, Dict, Optional
 
+from app.core.cache import TTLCache, normalize_claim
 from app.core.config import settings
-from app.services.domain_trust import score_domain
+from app.services.domain_trust import extract_domain, score_domain_name, trust_weight
+from app.services.llm_gateway import generate_text
 
 
 # Stance labels
 STANCE_LABELS = ['SUPPORTS', 'REFUTES', 'DISCUSS', 'UNRELATED']
 
+# Process-wide limit on concurrent stance calls (created lazily)
+_process_semaphore: Optional[asyncio.Semaphore] = None
 
-async def classify_stance(claim: str, snippet: str) -> str:
+
+def _get_process_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding stance calls across all requests."""
+    global _process_semaphore
+    if _process_semaphore is None:
+        _process_semaphore = asyncio.Semaphore(max(1, settings.stance_max_concurrency))
+    return _process_semaphore
+
+
+# Memoized stances keyed by (pipeline version, normalized claim, article URL or snippet hash)
+stance_store = TTLCache(
+    maxsize=settings.stance_store_size,
+    ttl=settings.stance_store_ttl_seconds
+)
+
+
+def stance_store_key(claim: str, article: Dict, snippet: str) -> tuple:
+    """
+    Build the stance store key for a claim/article pair.
+    
+    Falls back to a hash of the snippet when the article has no URL.
+    Including the pipeline version invalidates stored stances on upgrades.
+    """
+    article_key = article.get('url') or (
+        'snippet:' + hashlib.sha1(snippet.encode('utf-8')).hexdigest()
+    )
+    return (settings.pipeline_version, normalize_claim(claim), article_key)
+
+
+async def classify_stance(claim: str, snippet: str, raise_errors: bool = False) -> str:
     """
     Classify the stance of a snippet toward a claim.
     
     Args:
         claim: The claim being verified
         snippet: Text snippet (title + description from news)
+        raise_errors: Re-raise LLM errors instead of returning UNRELATED
         
     Returns:
         Stance label: SUPPORTS, REFUTES, DISCUSS, or UNRELATED
@@ -44,9 +80,6 @@ async def classify_stance(claim: str, snippet: str) -> str:
         return 'UNRELATED'
     
     try:
-        genai.configure(api_key=settings.gemini_api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
         prompt = f"""Classify the stance of the following text snippet toward the given claim.
 
 Claim: {claim}
@@ -61,8 +94,8 @@ Classify as exactly one of:
 
 Respond with ONLY the classification label (SUPPORTS, REFUTES, DISCUSS, or UNRELATED):"""
 
-        response = model.generate_content(prompt)
-        stance = response.text.strip().upper()
+        response_text = await generate_text(prompt, site='stance')
+        stance = response_text.upper()
         
         # Validate response
         if stance in STANCE_LABELS:
@@ -76,33 +109,114 @@ Respond with ONLY the classification label (SUPPORTS, REFUTES, DISCUSS, or UNREL
         return 'UNRELATED'
         
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"Stance classification error: {e}")
         return 'UNRELATED'
 
 
-async def classify_all_stances(claim: str, articles: List[Dict]) -> List[Dict]:
+async def classify_all_stances(
+    claim: str,
+    articles: List[Dict],
+    concurrent: bool = True,
+    max_concurrency: Optional[int] = None,
+    on_result: Optional[Callable[[int, Dict], None]] = None,
+    on_degraded: Optional[Callable[[str], None]] = None
+) -> List[Dict]:
     """
     Classify stances for all articles.
     
+    Stances already known for a (claim, article) pair are taken from the
+    stance store, so only new articles cost an LLM call. Only stances the
+    LLM produced are stored; keyword-fallback and failed classifications
+    are recomputed next time.
+    
+    In concurrent mode all remaining snippets are classified at once, bounded
+    by the per-request limit (``max_concurrency`` or
+    ``settings.stance_request_concurrency``) and the per-process limit
+    (``settings.stance_max_concurrency``). A failure for one article degrades
+    that article to UNRELATED without cancelling the rest.
+    
     Args:
         claim: The claim being verified
         articles: List of article dicts from news search
+        concurrent: Classify articles in parallel instead of one by one
+        max_concurrency: Override for the per-request concurrency limit
+        on_result: Called with (index, article with stance) as each article is classified
+        on_degraded: Called with a reason when a stance came from the keyword
+            fallback (no LLM configured) or a failed classification
         
     Returns:
-        List of articles with stance added
+        List of articles with stance added, in the same order as the input
     """
-    results = []
+    snippets = [
+        f"{article.get('title', '')} {article.get('description', '')}"
+        for article in articles
+    ]
+    
+    use_store = settings.stance_store_enabled and bool(claim)
+    keys = [
+        stance_store_key(claim, article, snippet) if use_store else None
+        for article, snippet in zip(articles, snippets)
+    ]
+    stances: List[Optional[str]] = [
+        stance_store.get(key) if key is not None else None
+        for key in keys
+    ]
+    
+    def finish(i: int, stance: str):
+        stances[i] = stance
+        if on_result is not None:
+            on_result(i, {**articles[i], 'stance': stance})
     
-    for article in articles:
-        snippet = f"{article.get('title', '')} {article.get('description', '')}"
-        stance = await classify_stance(claim, snippet)
+    # Without an LLM, classify_stance uses the keyword fallback
+    llm_available = bool(settings.gemini_api_key)
+    
+    pending = []
+    for i, stance in enumerate(stances):
+        if stance is None:
+            pending.append(i)
+        else:
+            finish(i, stance)
+    
+    async def classify_one(i: int, semaphores: List[asyncio.Semaphore]):
+        try:
+            async with AsyncExitStack() as stack:
+                for semaphore in semaphores:
+                    await stack.enter_async_context(semaphore)
+                stance = await classify_stance(claim, snippets[i], raise_errors=True)
+        except Exception as e:
+            print(f"Stance classification error: {e}")
+            if on_degraded is not None:
+                on_degraded('stance_error')
+            finish(i, 'UNRELATED')
+            return
         
-        results.append({
+        if keys[i] is not None and llm_available:
+            stance_store.set(keys[i], stance)
+        finish(i, stance)
+    
+    if pending and not llm_available and on_degraded is not None:
+        on_degraded('stance_keyword_fallback')
+    
+    if not concurrent:
+        for i in pending:
+            await classify_one(i, [])
+    else:
+        request_limit = max_concurrency or settings.stance_request_concurrency
+        semaphores = [
+            asyncio.Semaphore(max(1, request_limit)),
+            _get_process_semaphore()
+        ]
+        await asyncio.gather(*(classify_one(i, semaphores) for i in pending))
+    
+    return [
+        {
             **article,
             'stance': stance
-        })
-    
-    return results
+        }
+        for article, stance in zip(articles, stances)
+    ]
 
 
 def weighted_stance(stances_with_domains: List[Dict]) -> Dict:
@@ -110,19 +224,13 @@ def weighted_stance(stances_with_domains: List[Dict]) -> Dict:
     Calculate weighted stance summary based on domain trust.
     
     Args:
-        stances_with_domains: List of articles with stance and domain info
+        stances_with_domains: List of articles with stance and domain info;
+            trust is always resolved from the current domain store (memoized),
+            never taken from the article, which may come from a cache
         
     Returns:
         Dict with counts and weighted signals
     """
-    # Trust level weights
-    trust_weights = {
-        'trusted': 1.0,
-        'mixed': 0.5,
-        'low': 0.1,
-        'unknown': 0.3
-    }
-    
     counts = {
         'SUPPORTS': 0,
         'REFUTES': 0,
@@ -137,13 +245,12 @@ def weighted_stance(stances_with_domains: List[Dict]) -> Dict:
     
     for item in stances_with_domains:
         stance = item.get('stance', 'UNRELATED')
-        domain = item.get('domain')
         
         counts[stance] = counts.get(stance, 0) + 1
         
-        # Get domain trust
-        domain_trust = score_domain(item.get('url', ''))
-        weight = trust_weights.get(domain_trust['score'], 0.3)
+        # Get domain trust weight
+        domain = item.get('domain') or (extract_domain(item['url']) if item.get('url') else None)
+        weight = trust_weight(score_domain_name(domain)['score'] if domain else None)
         
         if stance == 'SUPPORTS':
             weighted_scores['supports'] += weight
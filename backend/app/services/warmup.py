@@ -0,0 +1,136 @@
+"""
+TruthLens Startup Warm-up
+
+Loads models and reference data before the app takes traffic, so the first
+requests on a new worker do not pay for spaCy model loading, the domain
+trust CSV parse or Gemini client setup. Progress is recorded in
+``readiness``, which backs the /ready endpoint.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.http_client import init_http_client
+from app.services.claim_extractor import nlp_pool
+from app.services.domain_store import DomainStore
+from app.services.domain_trust import load_domain_trust_db
+from app.services.llm_gateway import init_llm_models
+
+
+class Readiness:
+    """Warm-up state of this process."""
+
+    def __init__(self):
+        self.status = 'starting'  # starting, ready, failed
+        self.components: Dict[str, Dict] = {}
+        self.started_at: Optional[datetime] = None
+        self.ready_at: Optional[datetime] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == 'ready'
+
+    def to_dict(self) -> Dict:
+        return {
+            'status': self.status,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'ready_at': self.ready_at.isoformat() if self.ready_at else None,
+            'components': self.components
+        }
+
+
+readiness = Readiness()
+
+
+async def _warm_nlp() -> str:
+    await nlp_pool.start()
+    # Loads the model in this process too when there is no worker pool
+    components = await asyncio.to_thread(nlp_pool.components)
+    workers = nlp_pool.stats()['workers']
+    return f"{settings.nlp_mode} mode ({', '.join(components)}), {workers or 'no'} worker processes"
+
+
+async def _warm_domain_trust() -> str:
+    db = await asyncio.to_thread(load_domain_trust_db)
+    if not db:
+        raise RuntimeError(f"No domain trust data found at {settings.domain_trust_csv_path}")
+    source = f"store {db.path}" if isinstance(db, DomainStore) else "CSV"
+    return f"{len(db)} domains from {source}"
+
+
+async def _warm_llm() -> str:
+    if not settings.gemini_api_key:
+        return "No API key configured; LLM features disabled"
+    await asyncio.to_thread(init_llm_models)
+    return "Gemini client configured"
+
+
+async def _warm_http() -> str:
+    await init_http_client()
+    return "Connection pool open"
+
+
+# (name, step, required); a failed required step keeps the process unready
+WARMUP_STEPS = [
+    ('spacy', _warm_nlp, True),
+    ('domain_trust', _warm_domain_trust, False),
+    ('llm', _warm_llm, False),
+    ('http_client', _warm_http, True),
+]
+
+
+async def _run_step(name: str, step: Callable[[], Awaitable[str]], required: bool):
+    start = time.perf_counter()
+    entry = {'required': required}
+    try:
+        entry['detail'] = await step()
+        entry['ok'] = True
+    except Exception as e:
+        print(f"Warm-up of {name} failed: {e}")
+        entry['ok'] = False
+        entry['error'] = str(e)
+    entry['duration_ms'] = round((time.perf_counter() - start) * 1000, 1)
+    readiness.components[name] = entry
+
+
+async def warm_up(parallel: Optional[bool] = None, fail_fast: Optional[bool] = None) -> Readiness:
+    """
+    Load models and data, recording the outcome in ``readiness``.
+
+    Args:
+        parallel: Run the steps concurrently (defaults to settings.warmup_parallel)
+        fail_fast: Raise if a required step fails (defaults to settings.warmup_fail_fast)
+
+    Returns:
+        The readiness state
+
+    Raises:
+        RuntimeError: If a required step failed and fail_fast is set
+    """
+    parallel = settings.warmup_parallel if parallel is None else parallel
+    fail_fast = settings.warmup_fail_fast if fail_fast is None else fail_fast
+
+    readiness.status = 'starting'
+    readiness.started_at = datetime.utcnow()
+    readiness.components = {}
+
+    if parallel:
+        await asyncio.gather(*(_run_step(*step) for step in WARMUP_STEPS))
+    else:
+        for step in WARMUP_STEPS:
+            await _run_step(*step)
+
+    failed = [name for name, entry in readiness.components.items() if entry['required'] and not entry['ok']]
+    if failed:
+        readiness.status = 'failed'
+        if fail_fast:
+            errors = '; '.join(f"{name}: {readiness.components[name]['error']}" for name in failed)
+            raise RuntimeError(f"Startup warm-up failed ({errors})")
+        return readiness
+
+    readiness.status = 'ready'
+    readiness.ready_at = datetime.utcnow()
+    return readiness
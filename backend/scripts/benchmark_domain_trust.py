@@ -0,0 +1,137 @@
+"""
+Benchmark domain trust lookups on a synthetic domain list.
+
+Compares the old exact ``dict.get`` lookup with suffix matching
+(match_domain_rule) over the same rule table held as a dict and as a
+compiled memory-mapped DomainStore. Queries are a mix of exact
+rule hits, subdomains of rules (e.g. edition.cnn.com), subdomains covered by
+wildcard rules, and unknown domains.
+
+Usage (from backend/):
+    python scripts/benchmark_domain_trust.py
+    python scripts/benchmark_domain_trust.py --domains 200000 --queries 500000
+"""
+
+import argparse
+import random
+import resource
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.domain_store import DomainStore, build_domain_store  # noqa: E402
+from app.services.domain_trust import match_domain_rule  # noqa: E402
+
+TLDS = ["com", "org", "net", "co.uk", "com.au", "de", "io", "news", "info", "ca"]
+SUBDOMAINS = ["www", "news", "edition", "m", "amp", "blog", "en.m"]
+TRUST_LEVELS = ["trusted", "mixed", "low"]
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def random_label(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 12)))
+
+
+def random_notes(rng: random.Random, vocabulary: list, length: int) -> str:
+    # Labels average about 8.5 characters plus a space
+    return " ".join(rng.choices(vocabulary, k=max(1, length // 10)))
+
+
+def build_rules(count: int, wildcard_share: float, notes_length: int, rng: random.Random) -> dict:
+    rules = {}
+    vocabulary = [random_label(rng) for _ in range(2000)]
+    while len(rules) < count:
+        domain = f"{random_label(rng)}.{rng.choice(TLDS)}"
+        if rng.random() < wildcard_share:
+            domain = "*." + domain
+        rules[domain] = {
+            "trust_level": rng.choice(TRUST_LEVELS),
+            "category": "news",
+            "score": rng.randint(0, 100),
+            "label": "Synthetic",
+            "notes": random_notes(rng, vocabulary, notes_length) if notes_length else "",
+        }
+    return rules
+
+
+def build_queries(rules: dict, count: int, rng: random.Random) -> list:
+    plain = [rule for rule in rules if not rule.startswith("*.")]
+    wildcard = [rule[2:] for rule in rules if rule.startswith("*.")]
+    queries = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            queries.append(rng.choice(plain))
+        elif kind == 1:
+            queries.append(f"{rng.choice(SUBDOMAINS)}.{rng.choice(plain)}")
+        elif kind == 2 and wildcard:
+            queries.append(f"{random_label(rng)}.{rng.choice(wildcard)}")
+        else:
+            queries.append(f"{rng.choice(SUBDOMAINS)}.{random_label(rng)}.{rng.choice(TLDS)}")
+    return queries
+
+
+def timed(lookup, queries: list):
+    start = time.perf_counter()
+    resolved = sum(1 for q in queries if lookup(q) is not None)
+    elapsed = time.perf_counter() - start
+    return elapsed, resolved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark domain trust lookups")
+    parser.add_argument("--domains", type=int, default=1_000_000, help="Synthetic rules to load")
+    parser.add_argument("--queries", type=int, default=1_000_000, help="Lookups per strategy")
+    parser.add_argument("--wildcards", type=float, default=0.02, help="Share of rules written as *.domain")
+    parser.add_argument("--notes-length", type=int, default=80, help="Approximate characters of free-text notes per rule")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    rss_before = max_rss_mb()
+    start = time.perf_counter()
+    rules = build_rules(args.domains, args.wildcards, args.notes_length, rng)
+    build_s = time.perf_counter() - start
+    table_mb = max_rss_mb() - rss_before
+
+    queries = build_queries(rules, args.queries, rng)
+    print(f"{len(rules):,} rules built in {build_s:.2f}s ({table_mb:.0f} MB); {len(queries):,} queries\n")
+
+    store_dir = tempfile.TemporaryDirectory()
+    store_path = Path(store_dir.name) / "domain_trust.bin"
+    start = time.perf_counter()
+    build_domain_store(rules, store_path)
+    build_store_s = time.perf_counter() - start
+    tracemalloc.start()
+    store = DomainStore(store_path)
+    open_heap_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    print(f"Store compiled in {build_store_s:.2f}s ({store_path.stat().st_size / (1024 * 1024):.0f} MB file, "
+          f"mapped read-only and shared between processes); opening it allocated {open_heap_kb:.0f} KB of heap\n")
+
+    strategies = [
+        ("dict.get (exact)", rules.get),
+        ("suffix match", lambda domain: match_domain_rule(domain, rules)),
+        ("store suffix", lambda domain: match_domain_rule(domain, store)),
+    ]
+
+    print(f"{'strategy':<18} {'time (s)':>9} {'lookups/s':>12} {'ns/lookup':>10} {'resolved':>9}")
+    for name, lookup in strategies:
+        elapsed, resolved = timed(lookup, queries)
+        print(f"{name:<18} {elapsed:>9.2f} {len(queries) / elapsed:>12,.0f} "
+              f"{elapsed / len(queries) * 1e9:>10.0f} {resolved / len(queries):>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
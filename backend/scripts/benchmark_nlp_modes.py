@@ -0,0 +1,106 @@
+"""
+Benchmark spaCy extraction modes for claim candidate extraction.
+
+Each mode runs in a fresh subprocess so load time and resident memory are
+measured in isolation. Inputs are the claims in data/test_claims.json
+(or any file with the same layout), repeated to the requested count.
+
+Usage (from backend/):
+    python scripts/benchmark_nlp_modes.py
+    python scripts/benchmark_nlp_modes.py --texts 5000 --modes senter sentencizer
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_DATA = BACKEND_DIR.parent / "data" / "test_claims.json"
+
+sys.path.insert(0, str(BACKEND_DIR))
+
+
+def load_texts(path: Path, count: int) -> list:
+    claims = json.loads(path.read_text(encoding="utf-8"))["test_claims"]
+    texts = [claim["text"] for claim in claims if claim.get("text")]
+    return [texts[i % len(texts)] for i in range(count)]
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_mode(mode: str, data: Path, count: int, batch_size: int) -> dict:
+    """Measure one mode inside the current process."""
+    import spacy  # noqa: F401  (imported before the baseline so it is not counted)
+    from app.services.claim_extractor import _candidates_from_doc, load_nlp
+
+    texts = load_texts(data, count)
+    baseline_mb = max_rss_mb()
+
+    start = time.perf_counter()
+    nlp = load_nlp(mode)
+    load_s = time.perf_counter() - start
+
+    # Warm-up pass so lazy initialisation is not timed
+    list(nlp.pipe(texts[:batch_size], batch_size=batch_size))
+
+    start = time.perf_counter()
+    sentences = 0
+    for doc in nlp.pipe(texts, batch_size=batch_size):
+        sentences += len(_candidates_from_doc(doc))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "components": nlp.pipe_names,
+        "load_s": round(load_s, 3),
+        "texts_per_s": round(len(texts) / elapsed, 1),
+        "candidates": sentences,
+        "rss_mb": round(max_rss_mb() - baseline_mb, 1),
+    }
+
+
+def main():
+    from app.services.claim_extractor import NLP_MODES
+
+    parser = argparse.ArgumentParser(description="Benchmark spaCy extraction modes")
+    parser.add_argument("--data", type=Path, default=DEFAULT_DATA, help="test_claims.json-style input")
+    parser.add_argument("--texts", type=int, default=2000, help="Number of texts to process per mode")
+    parser.add_argument("--batch-size", type=int, default=32, help="nlp.pipe batch size")
+    parser.add_argument("--modes", nargs="+", default=list(NLP_MODES), choices=list(NLP_MODES))
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_mode(args.child, args.data, args.texts, args.batch_size)))
+        return
+
+    print(f"{args.texts} texts from {args.data.name}, batch size {args.batch_size}\n")
+    print(f"{'mode':<12} {'load (s)':>9} {'texts/s':>10} {'RSS (MB)':>9} {'candidates':>11}  components")
+
+    for mode in args.modes:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", mode, "--data", str(args.data),
+             "--texts", str(args.texts), "--batch-size", str(args.batch_size)],
+            capture_output=True, text=True
+        )
+        lines = proc.stdout.strip().splitlines()
+        if proc.returncode != 0 or not lines:
+            error = (proc.stderr.strip().splitlines() or ["unknown error"])[-1]
+            print(f"{mode:<12} failed: {error}")
+            continue
+
+        r = json.loads(lines[-1])
+        print(f"{r['mode']:<12} {r['load_s']:>9} {r['texts_per_s']:>10} {r['rss_mb']:>9} "
+              f"{r['candidates']:>11}  {', '.join(r['components'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark fact-check rating normalization.
+
+Compares the old linear substring scan over RATING_NORMALIZATION with the
+compiled RatingMatcher, on its own and behind the memo normalize_rating
+uses, on a stream of textual ratings shaped like a bulk re-verification
+run. Also lists the sample ratings whose verdict changed, since an
+order-dependent substring hit (e.g. "not true" as True) is a wrong verdict
+rather than just a slow one.
+
+Usage (from backend/):
+    python scripts/benchmark_rating_normalization.py
+    python scripts/benchmark_rating_normalization.py --ratings 5000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.factcheck import RATING_NORMALIZATION, RatingMatcher, normalize_rating  # noqa: E402
+
+# Textual ratings as published, most common first
+SAMPLE_RATINGS = [
+    "False", "False", "False", "False", "Mostly False", "Misleading", "Misleading",
+    "True", "Mostly True", "Half True", "Pants on Fire!", "Missing Context",
+    "Partly false", "Not true", "Not entirely true", "Incorrect", "Inaccurate",
+    "Out of context", "Unproven", "Unverified", "Four Pinocchios", "Falso",
+    "Satire", "Altered photo", "Mixture", "Exaggerated", "Cherry-picked",
+    "Correct", "Untrue", "Needs Context", "No evidence",
+    "False: the photo is out of context", "Mostly true but misleading",
+]
+
+
+def linear_scan(rating: str):
+    """normalize_rating before it was compiled: first substring hit wins."""
+    if not rating:
+        return None
+    rating_lower = rating.lower().strip()
+    for key, value in RATING_NORMALIZATION.items():
+        if key in rating_lower:
+            return value
+    return None
+
+
+def timed(normalize, ratings: list):
+    start = time.perf_counter()
+    results = [normalize(rating) for rating in ratings]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fact-check rating normalization")
+    parser.add_argument("--ratings", type=int, default=1_000_000, help="Ratings to normalize per strategy")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    ratings = rng.choices(SAMPLE_RATINGS, k=args.ratings)
+
+    start = time.perf_counter()
+    matcher = RatingMatcher(RATING_NORMALIZATION)
+    compile_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(RATING_NORMALIZATION)} phrases compiled in {compile_ms:.2f} ms; {len(ratings):,} ratings\n")
+
+    strategies = [
+        ("linear scan", linear_scan),
+        ("compiled", lambda rating: matcher.match(rating) if rating else None),
+        ("memoized", normalize_rating),
+    ]
+
+    print(f"{'strategy':<12} {'time (s)':>9} {'ratings/s':>12} {'ns/rating':>10} {'matched':>8}")
+    for name, normalize in strategies:
+        elapsed, results = timed(normalize, ratings)
+        matched = sum(1 for result in results if result is not None)
+        print(f"{name:<12} {elapsed:>9.2f} {len(ratings) / elapsed:>12,.0f} "
+              f"{elapsed / len(ratings) * 1e9:>10.0f} {matched / len(ratings):>7.1%}")
+
+    print("\nVerdicts that changed:")
+    print(f"  {'rating':<36} {'linear scan':<13} {'compiled':<13}")
+    for rating in SAMPLE_RATINGS:
+        before, after = linear_scan(rating), normalize_rating(rating)
+        if before != after:
+            print(f"  {rating:<36} {str(before):<13} {str(after):<13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measure import time of backend modules with a per-module breakdown.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter
+and reports the total, the slowest modules by cumulative time and the
+time per top-level package. Use --budget-ms and --forbid to fail (exit 1)
+on regressions, e.g. in CI.
+
+Usage (from backend/):
+    python scripts/measure_import_time.py
+    python scripts/measure_import_time.py app.api.auth.auth --top 30
+    python scripts/measure_import_time.py app.main --budget-ms 2000 --forbid spacy google.generativeai
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Heavy dependencies that should only load on first use
+DEFAULT_FORBIDDEN = ["spacy", "google.generativeai"]
+
+
+def measure(module: str, runs: int = 3) -> list:
+    """
+    Import a module in fresh interpreters and keep the fastest run.
+
+    Returns:
+        List of (module name, self microseconds, cumulative microseconds, depth)
+    """
+    best = None
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+    for _ in range(max(1, runs)):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {module}"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, env=env
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+        rows = []
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            depth = (len(name) - len(name.lstrip())) // 2
+            rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+
+        total = sum(row[1] for row in rows)
+        if best is None or total < best[0]:
+            best = (total, rows)
+
+    return best[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure backend import time")
+    parser.add_argument("modules", nargs="*", default=["app.main"], help="Modules to import (default: app.main)")
+    parser.add_argument("--top", type=int, default=20, help="Slowest modules to list")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per module; the fastest is kept")
+    parser.add_argument("--budget-ms", type=float, help="Fail if total import time exceeds this")
+    parser.add_argument("--forbid", nargs="*", default=None,
+                        help=f"Fail if any of these packages get imported (default: {' '.join(DEFAULT_FORBIDDEN)})")
+    args = parser.parse_args()
+
+    forbidden = DEFAULT_FORBIDDEN if args.forbid is None else args.forbid
+    failed = False
+
+    for module in args.modules:
+        rows = measure(module, args.runs)
+        total_ms = sum(row[1] for row in rows) / 1000
+
+        print(f"\n{module}: {total_ms:.1f} ms, {len(rows)} modules")
+
+        print("\n  Slowest modules (cumulative ms / self ms):")
+        for name, self_us, cumulative_us, _ in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+            print(f"  {cumulative_us / 1000:>9.1f} {self_us / 1000:>9.1f}  {name}")
+
+        packages = defaultdict(int)
+        for name, self_us, _, _ in rows:
+            packages[name.split(".")[0]] += self_us
+        print("\n  By top-level package (self ms):")
+        for package, self_us in sorted(packages.items(), key=lambda p: p[1], reverse=True)[:args.top]:
+            print(f"  {self_us / 1000:>9.1f}  {package}")
+
+        imported = {row[0] for row in rows}
+        loaded = [name for name in forbidden if name in imported]
+        if loaded:
+            print(f"\n  FAIL: imports {', '.join(loaded)} eagerly")
+            failed = True
+
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            print(f"\n  FAIL: {total_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
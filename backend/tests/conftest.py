@@ -0,0 +1,131 @@
+"""
+Shared fixtures for the backend unit tests.
+
+Tests run against a throwaway SQLite database and never call Gemini,
+GNews or the Fact Check API.
+"""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+# Settings are read at import time, so configure them before importing the app
+_DB_DIR = tempfile.mkdtemp(prefix="truthlens-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(_DB_DIR) / 'test.db'}"
+os.environ["GEMINI_API_KEY"] = ""
+os.environ["GOOGLE_FACTCHECK_API_KEY"] = ""
+os.environ["GNEWS_API_KEY"] = ""
+
+import pytest  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app.models  # noqa: E402,F401  (registers every table)
+import app.services.pipeline as pipeline  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, async_session, engine  # noqa: E402
+from app.core.security import get_current_user  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.result_cache import analysis_cache  # noqa: E402
+
+
+def _run(coro):
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            await engine.dispose()
+    return asyncio.run(wrapper())
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine on a fresh event loop, releasing pooled DB connections after."""
+    return _run
+
+
+@pytest.fixture
+def db():
+    """Empty tables for each test; returns the database URL."""
+    async def reset():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+    _run(reset())
+    return os.environ["DATABASE_URL"]
+
+
+@pytest.fixture
+def user_id(db):
+    """Id of a user stored in the empty database."""
+    async def create_user() -> int:
+        async with async_session() as session:
+            user = User(email="user@test.com", hashed_password="x")
+            session.add(user)
+            await session.commit()
+            return user.id
+    return _run(create_user())
+
+
+@pytest.fixture
+def api_client(user_id):
+    """
+    Build a test client for routers, authenticated as the ``user_id`` user.
+
+    Returns a function taking the routers to mount.
+    """
+    def build(*routers) -> TestClient:
+        api = FastAPI()
+        for router in routers:
+            api.include_router(router)
+        api.dependency_overrides[get_current_user] = lambda: {"user_id": user_id, "email": "user@test.com"}
+        return TestClient(api)
+    yield build
+    # Release connections opened on the test clients' event loops
+    _run(engine.dispose())
+
+
+@pytest.fixture
+def fake_pipeline(monkeypatch):
+    """
+    Replace every external call of the analysis pipeline with a successful fake.
+
+    Returns a dict counting news searches. The analysis cache starts empty
+    and the similar claim index is disabled.
+    """
+    analysis_cache.clear()
+    monkeypatch.setattr(settings, "claim_index_enabled", False)
+    calls = {"news": 0}
+
+    async def extract_claims(text):
+        return {"primary_claim": text}
+
+    async def search_factchecks(claim, language="en", on_degraded=None):
+        return {"found": False, "rating": None, "summary": None, "source": None, "url": None}
+
+    async def search_news(claim, max_results=5, language="en", on_degraded=None):
+        calls["news"] += 1
+        return [
+            {"title": claim, "description": "", "domain": "bbc.co.uk", "url": "https://bbc.co.uk/a"},
+            {"title": "Other", "description": "", "domain": "example.com", "url": "https://example.com/b"},
+        ]
+
+    async def classify_all_stances(claim, articles, on_result=None, on_degraded=None):
+        classified = [{**article, "stance": "REFUTES"} for article in articles]
+        for index, article in enumerate(classified):
+            if on_result is not None:
+                on_result(index, article)
+        return classified
+
+    async def llm_assess_claim(claim):
+        return {"used": False}
+
+    async def generate_explanation(context):
+        return "Explanation"
+
+    for fake in (extract_claims, search_factchecks, search_news, classify_all_stances,
+                 llm_assess_claim, generate_explanation):
+        monkeypatch.setattr(pipeline, fake.__name__, fake)
+    yield calls
+    analysis_cache.clear()
@@ -0,0 +1,121 @@
+"""Tests for the batch analyze endpoint and its NDJSON stream."""
+
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+import app.api.v1.batch as batch
+from app.core.database import async_session
+from app.models.check import Check
+
+
+def fake_result(claim, cached=False):
+    return {
+        "claim": claim,
+        "domain_trust": {"domain": None, "score": "unknown", "category": "unknown"},
+        "factcheck": {"found": False},
+        "articles": [],
+        "stance_summary": {"counts": {}, "weighted": {}, "total_articles": 0},
+        "verdict": "Likely False",
+        "confidence": "medium",
+        "explanation": "Explanation",
+        "cached": cached,
+        "degraded": [],
+    }
+
+
+async def count_checks() -> int:
+    async with async_session() as session:
+        return (await session.execute(select(func.count()).select_from(Check))).scalar()
+
+
+@pytest.fixture
+def events(db, monkeypatch):
+    """Fake pipeline; returns the ordered list of analyses, saves and index additions."""
+    log = []
+
+    async def fake_run_analysis(text, url=None, language="en", use_cache=True):
+        log.append(("analyze", text))
+        if text == "boom":
+            raise RuntimeError("pipeline failed")
+        return fake_result(text, cached=text == "cached claim")
+
+    save_results = batch._save_results
+
+    async def logged_save(*args):
+        check_ids = await save_results(*args)
+        log.append(("saved", len(check_ids)))
+        return check_ids
+
+    monkeypatch.setattr(batch, "run_analysis", fake_run_analysis)
+    monkeypatch.setattr(batch, "_save_results", logged_save)
+    monkeypatch.setattr(batch, "remember_analysis", lambda result, *args: log.append(("remember", result["claim"])))
+    return log
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(batch.router)
+
+
+ITEMS = [
+    {"id": "a", "text": "The Earth is flat"},
+    {"id": "b", "text": "the earth is FLAT!"},
+    {"id": "c"},
+    {"id": "d", "text": "boom"},
+    {"id": "e", "text": "cached claim"},
+]
+
+
+def test_duplicates_run_once_and_are_saved_before_indexing(client, events, run):
+    response = client.post("/api/v1/analyze/batch", json={"items": ITEMS})
+    body = response.json()
+
+    assert response.status_code == 200
+    assert (body["total"], body["unique"], body["failed"]) == (5, 3, 2)
+    items = body["items"]
+    assert [item["id"] for item in items] == ["a", "b", "c", "d", "e"]
+    assert items[0]["check_id"] and items[1]["check_id"] and items[0]["check_id"] != items[1]["check_id"]
+    assert items[2]["error"] == "Either text or url must be provided"
+    assert items[3]["error"] == "Analysis failed" and items[3]["check_id"] is None
+    assert run(count_checks()) == 3
+
+    analyzed = [text for event, text in events if event == "analyze"]
+    assert sorted(analyzed) == ["The Earth is flat", "boom", "cached claim"]
+    # Only the fresh result is indexed, after the checks were committed
+    assert events[-2:] == [("saved", 3), ("remember", "The Earth is flat")]
+
+
+def test_failed_save_is_not_indexed(client, events, monkeypatch):
+    async def failing_save(*args):
+        raise RuntimeError("database down")
+
+    monkeypatch.setattr(batch, "_save_results", failing_save)
+
+    lines = client.post("/api/v1/analyze/batch", json={"items": ITEMS[:1], "stream": True}).text.splitlines()
+
+    assert json.loads(lines[-1]) == {"done": True, "error": "Batch failed"}
+    assert not [event for event in events if event[0] == "remember"]
+
+
+def test_stream_is_ndjson_with_summary(client, events):
+    response = client.post("/api/v1/analyze/batch", json={"items": ITEMS, "stream": True})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    items, summary = lines[:-1], lines[-1]
+    assert sorted(item["index"] for item in items) == [0, 1, 2, 3, 4]
+    # The invalid item is reported before any analysis finishes
+    assert items[0]["index"] == 2 and items[0]["error"]
+    assert all(item["check_id"] is None for item in items)
+    assert summary["done"] is True
+    assert (summary["total"], summary["unique"], summary["failed"]) == (5, 3, 2)
+    assert set(summary["check_ids"]) == {"0", "1", "4"}
+
+
+def test_limits(client, monkeypatch):
+    monkeypatch.setattr(batch.settings, "batch_max_items", 2)
+
+    assert client.post("/api/v1/analyze/batch", json={"items": []}).status_code == 400
+    assert client.post("/api/v1/analyze/batch", json={"items": ITEMS}).status_code == 400
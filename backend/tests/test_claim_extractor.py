@@ -0,0 +1,28 @@
+"""Tests for spaCy pipeline modes used by claim candidate extraction."""
+
+import pytest
+
+import app.services.claim_extractor as claim_extractor
+from app.core.config import Settings
+from app.services.claim_extractor import load_nlp
+
+TEXT = "The vaccine was tested on thousands of people. Is it safe? It was approved by regulators in 2021."
+
+
+def test_full_pipeline_is_the_default():
+    assert Settings.model_fields["nlp_mode"].default == "full"
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        load_nlp("fastest")
+
+
+def test_sentencizer_needs_no_trained_model(monkeypatch):
+    nlp = load_nlp("sentencizer", "en_not_installed")
+    monkeypatch.setattr(claim_extractor, "_nlp", nlp)
+
+    expected = ["The vaccine was tested on thousands of people.", "It was approved by regulators in 2021."]
+    assert nlp.pipe_names == ["sentencizer"]
+    assert claim_extractor.extract_candidates(TEXT) == expected
+    assert claim_extractor.extract_candidates_batch([TEXT, "", TEXT]) == [expected, [], expected]
@@ -0,0 +1,140 @@
+"""Tests for the near-duplicate claim index."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.claim_index as claim_index_module
+import app.services.pipeline as pipeline
+from app.api.v1.analyze import remember_analysis
+from app.core.config import settings
+from app.services.claim_index import SimilarClaimIndex, claim_index, claim_tokens, index_analysis
+from app.services.result_cache import analysis_cache
+
+SCOPE = ("v1", "en", "")
+THRESHOLD = 0.7
+
+
+@pytest.fixture
+def index():
+    return SimilarClaimIndex(num_perm=64, bands=16, max_entries=100)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(claim_index_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def shared_index(monkeypatch):
+    """Empty, enabled shared index."""
+    monkeypatch.setattr(claim_index, "_entries", type(claim_index._entries)())
+    monkeypatch.setattr(claim_index, "_buckets", type(claim_index._buckets)(list))
+    monkeypatch.setattr(settings, "claim_index_enabled", True)
+
+
+def test_paraphrase_matches(index):
+    index.add("5G towers spread COVID", SCOPE, {"verdict": "Likely False"})
+
+    match = index.query("COVID is spread by 5G towers", SCOPE, THRESHOLD)
+
+    assert match["payload"] == {"verdict": "Likely False"}
+    assert match["similarity"] == 1.0
+
+
+@pytest.mark.parametrize("stored, submitted", [
+    ("Unemployment rose 5% in March 2020", "Unemployment rose 5% in 2021"),
+    ("Unemployment rose 5% in March 2020", "Unemployment rose 7% in March 2020"),
+    ("The vaccine was approved in 2021", "The vaccine was approved in the 2020s"),
+    ("Three million people lost their jobs", "Two million people lost their jobs"),
+    ("Who invented the vaccine in 1955", "What invented the vaccine in 1955"),
+    ("All vaccines contain mercury", "Some vaccines contain mercury"),
+    ("He won the election", "She won the election"),
+    ("Vaccines cause autism", "Vaccines do not cause autism"),
+    ("Biden won the 2020 presidential election in the state of Georgia by a narrow margin",
+     "Trump won the 2020 presidential election in the state of Georgia by a narrow margin"),
+    ("Pfizer vaccine causes heart inflammation in young men",
+     "Moderna vaccine causes heart inflammation in young men"),
+])
+def test_near_duplicates_with_different_meaning_do_not_match(index, stored, submitted):
+    index.add(stored, SCOPE, {})
+
+    assert index.query(submitted, SCOPE, THRESHOLD) is None
+
+
+def test_names_match_in_any_case(index):
+    index.add("Vaccines cause autism in Denmark", SCOPE, {})
+
+    assert index.query("in denmark, autism is caused by vaccines", SCOPE, THRESHOLD) is not None
+
+
+def test_numbers_are_not_stemmed():
+    assert {"1990s", "2020"} <= claim_tokens("Crime fell in the 1990s and 2020")
+
+
+def test_other_scope_does_not_match(index):
+    index.add("5G towers spread COVID", SCOPE, {})
+
+    assert index.query("5G towers spread COVID", ("v1", "de", ""), THRESHOLD) is None
+
+
+def test_oldest_entries_are_evicted():
+    index = SimilarClaimIndex(max_entries=2)
+    for claim in ("Cats can fly", "Dogs can swim", "Fish can climb trees"):
+        index.add(claim, SCOPE, {"claim": claim})
+
+    assert len(index) == 2
+    assert index.query("Cats can fly", SCOPE, THRESHOLD) is None
+    assert index.query("Fish can climb trees", SCOPE, THRESHOLD) is not None
+
+
+def test_expired_entries_are_not_returned(clock):
+    index = SimilarClaimIndex(ttl=60)
+    index.add("Cats can fly", SCOPE, {})
+
+    clock[0] += 59
+    assert index.query("Cats can fly", SCOPE, THRESHOLD) is not None
+    clock[0] += 1
+    assert index.query("Cats can fly", SCOPE, THRESHOLD) is None
+    assert len(index) == 0
+
+
+def test_claim_is_reanalyzed_once_the_cached_result_expires(fake_pipeline, shared_index, clock):
+    assert claim_index.ttl == settings.analysis_cache_ttl_seconds
+    result = asyncio.run(pipeline.run_analysis("5G towers spread COVID"))
+    remember_analysis(result, "5G towers spread COVID", None, "en")
+
+    # Both stores expire together
+    clock[0] += claim_index.ttl
+    analysis_cache.clear()
+    again = asyncio.run(pipeline.run_analysis("5G towers spread COVID"))
+
+    assert again["cached"] is False
+    assert fake_pipeline["news"] == 2
+
+
+def test_url_only_submissions_are_not_indexed(fake_pipeline, shared_index):
+    url = "https://example.com/politics/biden-wins-election"
+    result = asyncio.run(pipeline.run_analysis(None, url))
+    remember_analysis(result, None, url, "en")
+
+    assert len(claim_index) == 0
+
+    # Nor looked up, even when the placeholder would match an indexed text
+    index_analysis([f"Content from: {url}"], result, url_domain="example.com")
+    other = asyncio.run(pipeline.run_analysis(None, "https://example.com/politics/trump-wins-election"))
+    assert other["cached"] is False
+
+
+def test_reused_analysis_reports_the_submitted_claim(monkeypatch, shared_index):
+    monkeypatch.setattr(pipeline, "get_cached_analysis", lambda *args: None)
+    index_analysis(["5G towers spread COVID"], {"claim": "5G towers spread COVID-19", "verdict": "Likely False"})
+
+    result = asyncio.run(pipeline.run_analysis("COVID is spread by 5G towers"))
+
+    assert result["claim"] == "COVID is spread by 5G towers"
+    assert result["similar_claim"] == "5G towers spread COVID"
+    assert result["verdict"] == "Likely False"
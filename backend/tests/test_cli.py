@@ -0,0 +1,80 @@
+"""Tests for the offline verify command."""
+
+import asyncio
+import json
+
+import pytest
+
+import app.cli as cli
+from app.core.config import settings
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Fake run_analysis; returns the settings each call saw and the init_db calls."""
+    seen = {"calls": [], "init_db": 0}
+
+    async def fake_run_analysis(text, url=None, language="en", use_cache=True):
+        if text == "boom":
+            raise RuntimeError("pipeline failed")
+        seen["calls"].append((settings.factcheck_cache_enabled, settings.rating_learning_enabled))
+        return {"claim": text, "verdict": "Likely False", "cached": False}
+
+    async def fake_init_db():
+        seen["init_db"] += 1
+
+    monkeypatch.setattr(cli, "run_analysis", fake_run_analysis)
+    monkeypatch.setattr(cli, "init_db", fake_init_db)
+    # verify_file switches these off for the run; restore them afterwards
+    monkeypatch.setattr(settings, "factcheck_cache_enabled", True)
+    monkeypatch.setattr(settings, "rating_learning_enabled", True)
+    return seen
+
+
+def read_output(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_verify_runs_without_a_database(tmp_path, pipeline):
+    claims = tmp_path / "claims.jsonl"
+    claims.write_text('{"id": "a", "text": "Claim one"}\n\nnot json\n{"id": "c", "text": "boom"}\n', encoding="utf-8")
+    output = tmp_path / "results.jsonl"
+
+    progress = asyncio.run(cli.verify_file(claims, output, workers=0))
+
+    assert pipeline["init_db"] == 0
+    assert pipeline["calls"] == [(False, False)]
+    assert (progress.done, progress.failed) == (3, 2)
+    entries = {entry["line"]: entry for entry in read_output(output)}
+    assert entries[0]["result"]["claim"] == "Claim one"
+    assert entries[2]["error"] == "Unparseable input line"
+    assert entries[3]["error"] == "pipeline failed"
+
+
+def test_save_initialises_the_database(tmp_path, pipeline):
+    claims = tmp_path / "claims.csv"
+    claims.write_text("id,text,url\n1,Claim one,\n", encoding="utf-8")
+
+    asyncio.run(cli.verify_file(claims, tmp_path / "results.jsonl", workers=0, save=True))
+
+    assert pipeline["init_db"] == 1
+    assert pipeline["calls"] == [(True, True)]
+
+
+def test_rerun_retries_only_failed_lines(tmp_path, pipeline):
+    claims = tmp_path / "claims.jsonl"
+    claims.write_text('{"text": "Claim one"}\n{"text": "boom"}\n', encoding="utf-8")
+    output = tmp_path / "results.jsonl"
+
+    asyncio.run(cli.verify_file(claims, output, workers=0))
+    progress = asyncio.run(cli.verify_file(claims, output, workers=0))
+
+    assert (progress.skipped, progress.done, progress.failed) == (1, 1, 1)
+    assert cli.load_completed(output) == {0}
+
+
+def test_save_flag_is_parsed():
+    args = cli.build_parser().parse_args(["verify", "claims.jsonl", "-o", "out.jsonl", "--save"])
+
+    assert args.save is True
+    assert cli.build_parser().parse_args(["verify", "claims.jsonl", "-o", "out.jsonl"]).save is False
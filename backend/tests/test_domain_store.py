@@ -0,0 +1,157 @@
+"""Tests for the compiled memory-mapped domain store and its hot reload."""
+
+import os
+import struct
+
+import pytest
+
+import app.services.domain_trust as domain_trust
+from app.core.config import settings
+from app.services.domain_store import (
+    _HEADER,
+    DomainStore,
+    DomainStoreError,
+    build_domain_store,
+    build_domain_store_from_csv,
+)
+
+
+def info(score, trust_level="trusted", notes=""):
+    return {
+        "trust_level": trust_level,
+        "category": "news",
+        "score": score,
+        "label": "Reputable News",
+        "notes": notes,
+    }
+
+
+RULES = {
+    "bbc.co.uk": info(90, notes="Public broadcaster"),
+    "*.blogspot.com": info(30, "low", notes="User-generated – unvetted"),
+    "example.org": info(50, "mixed"),
+    "théguardian.com": info(88, notes="Unicode key"),
+}
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    path = tmp_path / "domain_trust.bin"
+    build_domain_store(RULES, path)
+    return path
+
+
+def corrupt(path, offset, data):
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(data)
+
+
+def test_round_trip(store_path):
+    store = DomainStore(store_path)
+
+    assert len(store) == len(RULES)
+    assert sorted(store) == sorted(RULES)
+    for domain, expected in RULES.items():
+        assert store[domain] == expected
+        assert domain in store
+    assert store.get("missing.com") is None
+    assert "missing.com" not in store
+    with pytest.raises(KeyError):
+        store["missing.com"]
+
+
+def test_empty_store(tmp_path):
+    path = tmp_path / "empty.bin"
+    build_domain_store({}, path)
+
+    store = DomainStore(path)
+
+    assert len(store) == 0
+    assert store.get("bbc.co.uk") is None
+
+
+def test_build_from_csv_later_rows_win(tmp_path):
+    csv_path = tmp_path / "feed.csv"
+    csv_path.write_text(
+        "domain,trust_level,category,score,label,notes\n"
+        "Example.com.,mixed,news,40,Mixed,first\n"
+        "example.com,trusted,news,200,Trusted,second\n"
+        ",low,news,10,Empty,skipped\n",
+        encoding="utf-8"
+    )
+
+    count = build_domain_store_from_csv(csv_path, tmp_path / "feed.bin")
+    store = DomainStore(tmp_path / "feed.bin")
+
+    assert count == 1
+    assert store["example.com"]["notes"] == "second"
+    assert store["example.com"]["score"] == 100  # Clamped to 0-100
+
+
+def test_opening_does_not_decode_strings(store_path):
+    store = DomainStore(store_path)
+
+    assert store._string.cache_info().currsize == 0
+    store.get("bbc.co.uk")
+    assert store._string.cache_info().currsize > 0
+
+
+def test_truncated_file(store_path):
+    data = store_path.read_bytes()
+    # Sections are padded to 8 bytes, so cutting 8 always removes string data
+    for size in (0, _HEADER.size - 1, _HEADER.size + 8, len(data) // 2, len(data) - 8):
+        store_path.write_bytes(data[:size])
+        with pytest.raises(DomainStoreError):
+            DomainStore(store_path)
+
+
+def test_wrong_magic(store_path):
+    corrupt(store_path, 0, b"NOTSTORE")
+
+    with pytest.raises(DomainStoreError):
+        DomainStore(store_path)
+
+
+def test_section_offset_out_of_bounds(store_path):
+    # First section offset follows magic, version and the three counts
+    corrupt(store_path, struct.calcsize("<8sIIII"), struct.pack("<Q", 1 << 40))
+
+    with pytest.raises(DomainStoreError):
+        DomainStore(store_path)
+
+
+def test_corrupt_string_id_raises_store_error(store_path):
+    store = DomainStore(store_path)
+    notes_off = _HEADER.unpack_from(store_path.read_bytes(), 0)[5 + 8]
+    del store
+    # Point every record's notes at a string id past the string table
+    corrupt(store_path, notes_off, struct.pack(f"<{len(RULES)}I", *[0xFFFFFF] * len(RULES)))
+
+    store = DomainStore(store_path)
+    with pytest.raises(DomainStoreError):
+        store.get("bbc.co.uk")
+
+
+def test_hot_reload(tmp_path, monkeypatch, request):
+    # Do not leak lookups from this store into other tests
+    request.addfinalizer(domain_trust._lookup_domain.cache_clear)
+    path = tmp_path / "domain_trust.bin"
+    build_domain_store(RULES, path)
+
+    monkeypatch.setattr(settings, "domain_trust_store_path", str(path))
+    monkeypatch.setattr(settings, "domain_trust_reload_interval", 0)
+    monkeypatch.setattr(domain_trust, "_store", None)
+    monkeypatch.setattr(domain_trust, "_store_rejected_id", None)
+    monkeypatch.setattr(domain_trust, "_store_checked_at", None)
+
+    assert domain_trust.score_domain_name("news.bbc.co.uk")["trust_score"] == 90
+
+    build_domain_store({**RULES, "bbc.co.uk": info(60, "mixed")}, path)
+    assert domain_trust.score_domain_name("news.bbc.co.uk")["trust_score"] == 60
+
+    # A corrupt replacement keeps the previous store in service
+    garbage = tmp_path / "garbage.bin"
+    garbage.write_bytes(b"\0" * 64)
+    os.replace(garbage, path)
+    assert domain_trust.score_domain_name("news.bbc.co.uk")["trust_score"] == 60
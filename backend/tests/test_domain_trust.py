@@ -0,0 +1,143 @@
+"""Tests for domain trust lookups and trust-weighted stance summaries."""
+
+import os
+
+import pytest
+
+import app.services.domain_trust as domain_trust
+from app.api.v1.domain_trust import router
+from app.core.config import settings
+from app.services.domain_store import build_domain_store
+from app.services.stance import weighted_stance
+
+
+def info(trust_level, score):
+    return {"trust_level": trust_level, "category": "news", "score": score, "label": trust_level, "notes": ""}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch, request):
+    """Serve domain trust from a temporary compiled store; returns a function rebuilding it."""
+    path = tmp_path / "domain_trust.bin"
+    monkeypatch.setattr(settings, "domain_trust_store_path", str(path))
+    monkeypatch.setattr(settings, "domain_trust_reload_interval", 0)
+    monkeypatch.setattr(domain_trust, "_store", None)
+    monkeypatch.setattr(domain_trust, "_store_rejected_id", None)
+    monkeypatch.setattr(domain_trust, "_store_checked_at", None)
+    request.addfinalizer(domain_trust._lookup_domain.cache_clear)
+
+    def build(rules):
+        build_domain_store(rules, path)
+    return build
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(router)
+
+
+def test_weight_follows_the_current_store_not_the_article(store):
+    store({"example.com": info("low", 20)})
+    # As cached by an older search_news, with the trust of that time attached
+    article = {"domain": "news.example.com", "stance": "SUPPORTS", "trust_level": "trusted", "trust_weight": 1.0}
+
+    assert weighted_stance([article])["weighted"]["supports"] == 0.1
+
+    store({"example.com": info("trusted", 90)})
+    assert weighted_stance([article])["weighted"]["supports"] == 1.0
+
+
+def test_weight_resolves_domain_from_url(store):
+    store({"example.com": info("mixed", 50)})
+
+    summary = weighted_stance([
+        {"url": "https://www.example.com/story", "stance": "REFUTES"},
+        {"url": None, "stance": "REFUTES"},
+        {"domain": "unknown.org", "stance": "DISCUSS"},
+    ])
+
+    assert summary["weighted"] == {"supports": 0.0, "refutes": 0.5 + 0.3}
+    assert summary["counts"]["REFUTES"] == 2 and summary["counts"]["DISCUSS"] == 1
+    assert summary["total_articles"] == 3
+
+
+def test_missing_store_file_is_checked_once_per_interval(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "domain_trust_store_path", str(tmp_path / "missing.bin"))
+    monkeypatch.setattr(settings, "domain_trust_reload_interval", 60)
+    monkeypatch.setattr(domain_trust, "_store", None)
+    monkeypatch.setattr(domain_trust, "_store_checked_at", None)
+    domain_trust.score_domain_name("example.com")
+
+    stats = []
+    real_stat = os.stat
+    monkeypatch.setattr(os, "stat", lambda *args, **kwargs: stats.append(args[0]) or real_stat(*args, **kwargs))
+    for _ in range(1000):
+        domain_trust.score_domain_name("example.com")
+
+    assert stats == []
+
+
+RULES = {"example.com": "apex", "*.blogs.example.com": "blogs", "news.example.com": "news", "*.wild.org": "wild"}
+
+
+@pytest.mark.parametrize("domain, expected", [
+    ("example.com", ("example.com", "apex")),
+    ("www.example.com", ("example.com", "apex")),
+    ("live.news.example.com", ("news.example.com", "news")),
+    ("me.blogs.example.com", ("*.blogs.example.com", "blogs")),
+    ("a.b.wild.org", ("*.wild.org", "wild")),
+    ("wild.org", None),  # A wildcard does not match the apex
+    ("notexample.com", None),
+    ("com", None),
+])
+def test_longest_rule_matches_by_label(domain, expected):
+    assert domain_trust.match_domain_rule(domain, RULES) == expected
+
+
+def test_store_lookup_reports_the_matched_rule(store):
+    store({"example.com": info("mixed", 50), "*.opinion.example.com": info("low", 20)})
+
+    assert domain_trust.score_domain_name("columns.opinion.example.com")["matched_rule"] == "*.opinion.example.com"
+    assert domain_trust.score_domain_name("opinion.example.com")["score"] == "mixed"
+    assert domain_trust.score_domain_name("example.org")["score"] == "unknown"
+
+
+def test_get_is_cacheable(store, client):
+    store({"example.com": info("trusted", 90)})
+
+    response = client.get("/api/v1/domain-trust", params={"domain": "News.Example.com"})
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert response.json()["matched_rule"] == "example.com"
+    assert response.headers["Cache-Control"].startswith("private, max-age=")
+    assert client.get("/api/v1/domain-trust", params={"domain": "https://news.example.com/a"},
+                      headers={"If-None-Match": etag}).status_code == 304
+
+    # A changed score changes the ETag
+    store({"example.com": info("low", 20)})
+    changed = client.get("/api/v1/domain-trust", params={"domain": "news.example.com"},
+                         headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["score"] == "low"
+
+
+def test_batch_post_is_not_cached(store, client):
+    store({"example.com": info("mixed", 50)})
+    urls = ["https://a.example.com/1", "https://b.example.com/2", "https://a.example.com/1", "not a url"]
+
+    response = client.post("/api/v1/domain-trust/batch", json={"urls": urls}, headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    body = response.json()
+    assert body["domains"] == 2
+    assert set(body["results"]) == set(urls)
+    assert body["results"]["not a url"]["domain"] is None
+
+
+def test_batch_limits(client, monkeypatch):
+    monkeypatch.setattr(settings, "domain_trust_batch_max_urls", 2)
+
+    assert client.post("/api/v1/domain-trust/batch", json={"urls": []}).status_code == 400
+    assert client.post("/api/v1/domain-trust/batch", json={"urls": ["a", "b", "c"]}).status_code == 400
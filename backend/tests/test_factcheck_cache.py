@@ -0,0 +1,148 @@
+"""Tests for the persisted fact-check cache and its TTLs."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+import app.services.factcheck as factcheck
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.factcheck_cache import FactCheckCache
+from app.services.factcheck import search_factchecks
+from app.services.factcheck_cache import get_cached_factcheck, prune_factcheck_cache, store_factcheck
+
+
+def review(rating):
+    return {"claims": [{"text": "Claim", "claimReview": [{
+        "textualRating": rating,
+        "url": "https://example.com/fact-check",
+        "publisher": {"name": "Example Checks"}
+    }]}]}
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class FakeClient:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    async def get(self, url, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+@pytest.fixture(autouse=True)
+def factcheck_api(monkeypatch):
+    monkeypatch.setattr(settings, "google_factcheck_api_key", "test-key")
+    monkeypatch.setattr(settings, "rating_learning_enabled", False)
+
+
+async def stored_ttl(query):
+    async with async_session() as session:
+        row = (await session.execute(select(FactCheckCache).where(FactCheckCache.query == query))).scalar_one()
+    return row.expires_at - row.created_at
+
+
+def test_lookup_ignores_case_and_punctuation(db, run):
+    async def scenario():
+        await store_factcheck("The Earth is FLAT!", "en", {"found": False})
+        return (
+            await get_cached_factcheck("the earth is flat", "en"),
+            await get_cached_factcheck("the earth is flat", "de"),
+        )
+
+    assert run(scenario()) == ({"found": False}, None)
+
+
+@pytest.mark.parametrize("result, hours", [
+    ({"found": True, "rating": "False", "rating_fallback": False}, 7 * 24),
+    ({"found": True, "rating": "Unverifiable", "rating_fallback": True}, 12),
+    ({"found": False}, 12),
+])
+def test_ttl_depends_on_result(db, result, hours, run):
+    async def scenario():
+        await store_factcheck("claim", "en", result)
+        return await stored_ttl("claim")
+
+    assert run(scenario()) == timedelta(hours=hours)
+
+
+def test_expired_entry_is_a_miss(db, monkeypatch, run):
+    monkeypatch.setattr(settings, "factcheck_cache_negative_ttl_hours", 0)
+
+    async def scenario():
+        await store_factcheck("claim", "en", {"found": False})
+        return await get_cached_factcheck("claim", "en")
+
+    assert run(scenario()) is None
+
+
+def test_expired_rows_are_pruned(db, monkeypatch, run):
+    async def scenario():
+        await store_factcheck("fresh claim", "en", {"found": False})
+        monkeypatch.setattr(settings, "factcheck_cache_negative_ttl_hours", 0)
+        await store_factcheck("expired claim", "en", {"found": False})
+        deleted = await prune_factcheck_cache()
+        async with async_session() as session:
+            queries = (await session.execute(select(FactCheckCache.query))).scalars().all()
+        return deleted, queries
+
+    assert run(scenario()) == (1, ["fresh claim"])
+
+
+def test_uninterpretable_rating_is_a_short_lived_fallback(db, run):
+    # No Gemini key is configured in tests, so the LLM cannot interpret the label
+    client = FakeClient(FakeResponse(200, review("Four Pinocchios")))
+
+    async def scenario():
+        result = await search_factchecks("claim", client=client)
+        return result, await stored_ttl("claim")
+
+    result, ttl = run(scenario())
+
+    assert (result["rating"], result["rating_fallback"]) == ("Unverifiable", True)
+    assert ttl == timedelta(hours=settings.factcheck_cache_negative_ttl_hours)
+
+
+def test_llm_unverifiable_answer_is_not_a_fallback(db, monkeypatch, run):
+    async def fake_generate(prompt, site="default", use_cache=True, **kwargs):
+        return "UNVERIFIABLE"
+
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(factcheck, "generate_text", fake_generate)
+    client = FakeClient(FakeResponse(200, review("Four Pinocchios")))
+
+    async def scenario():
+        result = await search_factchecks("claim", client=client)
+        return result, await stored_ttl("claim")
+
+    result, ttl = run(scenario())
+
+    assert (result["rating"], result["rating_fallback"]) == ("Unverifiable", False)
+    assert ttl == timedelta(hours=settings.factcheck_cache_positive_ttl_hours)
+
+
+def test_hit_skips_the_api_and_errors_are_not_stored(db, run):
+    failing = FakeClient(FakeResponse(503))
+    working = FakeClient(FakeResponse(200, review("False")))
+
+    async def scenario():
+        error = await search_factchecks("claim", client=failing)
+        first = await search_factchecks("claim", client=working)
+        second = await search_factchecks("claim", client=working)
+        return error, first, second
+
+    error, first, second = run(scenario())
+
+    assert error["summary"] == "API error: 503"
+    assert first == second and first["rating"] == "False"
+    assert working.calls == 1
@@ -0,0 +1,59 @@
+"""Tests for the shared pooled HTTP client."""
+
+import asyncio
+
+import pytest
+
+import app.core.http_client as http_client
+from app.core.config import settings
+from app.services.news_search import search_news
+
+
+@pytest.fixture(autouse=True)
+def no_shared_client(monkeypatch):
+    monkeypatch.setattr(http_client, "_client", None)
+
+
+def test_client_is_shared_until_closed():
+    async def scenario():
+        first = http_client.get_http_client()
+        same = http_client.get_http_client()
+        await http_client.close_http_client()
+        return first, same, http_client.get_http_client()
+
+    first, same, after_close = asyncio.run(scenario())
+
+    assert first is same
+    assert first.is_closed
+    assert after_close is not first
+    asyncio.run(after_close.aclose())
+
+
+def test_pool_limits_come_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "http_max_connections", 7)
+    monkeypatch.setattr(settings, "http_enable_http2", True)
+    monkeypatch.setattr(http_client, "_http2_available", lambda: False)
+    monkeypatch.setattr(http_client.httpx, "AsyncClient", lambda **options: options)
+
+    options = http_client.create_http_client()
+
+    assert options["limits"].max_connections == 7
+    assert options["http2"] is False  # Falls back without the h2 package
+
+
+def test_upstream_calls_use_the_shared_client(monkeypatch):
+    requests = []
+
+    class SharedClient:
+        is_closed = False
+
+        async def get(self, url, **kwargs):
+            requests.append(url)
+            return type("Response", (), {"status_code": 503})()
+
+    monkeypatch.setattr(http_client, "_client", SharedClient())
+    monkeypatch.setattr(settings, "gnews_api_key", "test-key")
+    monkeypatch.setattr(settings, "news_cache_enabled", False)
+
+    assert asyncio.run(search_news("claim")) == []
+    assert requests == ["https://gnews.io/api/v4/search"]
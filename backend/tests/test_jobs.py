@@ -0,0 +1,131 @@
+"""Tests for the analysis job queue and its persisted job status."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.database import async_session
+from app.models.check import Check
+from app.services.jobs import Job, JobManager, JobQueueBackend, InProcessJobQueue, get_job_status
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+async def save_check(job) -> int:
+    async with async_session() as session:
+        check = Check(user_id=job.user_id, claim=job.payload, verdict="Likely False", confidence="high")
+        session.add(check)
+        await session.commit()
+        return check.id
+
+
+async def wait_for(job_id: str, statuses=("completed", "failed")):
+    for _ in range(200):
+        row = await get_job_status(job_id)
+        if row is not None and row.status in statuses:
+            return row
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_completed_job_status_is_stored(user_id, run):
+    async def scenario():
+        manager = JobManager()
+        manager.start(save_check, num_workers=1)
+        job = await manager.submit(user_id, "The moon is made of cheese", "bulk")
+        row = await wait_for(job.id)
+        await manager.stop()
+        return job, row
+
+    job, row = run(scenario())
+
+    assert row.status == "completed"
+    assert row.check_id is not None
+    assert row.priority == "bulk"
+    assert row.started_at is not None and row.finished_at is not None
+
+
+def test_job_status_is_readable_from_another_process(db, user_id, run):
+    async def scenario():
+        manager = JobManager()
+        manager.start(save_check, num_workers=1)
+        job = await manager.submit(user_id, "Claim")
+        await wait_for(job.id)
+        await manager.stop()
+        return job.id
+
+    job_id = run(scenario())
+
+    code = (
+        "import asyncio, sys\n"
+        "from app.services.jobs import get_job_status\n"
+        "row = asyncio.run(get_job_status(sys.argv[1]))\n"
+        "print(row.status, row.check_id is not None)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code, job_id],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+        env={**os.environ, "DATABASE_URL": db}
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == ["completed", "True"]
+
+
+def test_failed_job_records_error(user_id, run):
+    async def failing(job):
+        raise ValueError("upstream exploded")
+
+    async def scenario():
+        manager = JobManager()
+        manager.start(failing, num_workers=1)
+        job = await manager.submit(user_id, "Claim")
+        row = await wait_for(job.id)
+        await manager.stop()
+        return row
+
+    row = run(scenario())
+
+    assert row.status == "failed"
+    assert row.error == "upstream exploded"
+
+
+def test_stop_fails_running_and_queued_jobs(user_id, run):
+    async def scenario():
+        release = asyncio.Event()
+
+        async def blocked(job):
+            await release.wait()
+
+        manager = JobManager()
+        manager.start(blocked, num_workers=1)
+        first = await manager.submit(user_id, "First")
+        second = await manager.submit(user_id, "Second")
+        await wait_for(first.id, statuses=("running",))
+        await manager.stop()
+        return await get_job_status(first.id), await get_job_status(second.id)
+
+    first, second = run(scenario())
+
+    assert (first.status, first.error) == ("failed", "Cancelled during shutdown")
+    assert (second.status, second.error) == ("failed", "Server shut down before the job ran")
+
+
+def test_interactive_jobs_run_before_bulk():
+    async def scenario():
+        queue = InProcessJobQueue()
+        bulk, interactive = Job(1, "a", "bulk"), Job(1, "b", "interactive")
+        await queue.put(bulk)
+        await queue.put(interactive)
+        return [await queue.get(), await queue.get()]
+
+    assert [job.priority for job in asyncio.run(scenario())] == ["interactive", "bulk"]
+
+
+def test_queue_backend_is_abstract():
+    with pytest.raises(TypeError):
+        JobQueueBackend()
@@ -0,0 +1,44 @@
+"""Tests for lazily imported services and heavy dependencies."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import app.services
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+HEAVY = ["spacy", "google.generativeai"]
+
+
+def loaded_after(statement, modules=HEAVY):
+    """Import in a fresh interpreter and report which of the given modules got loaded."""
+    code = f"import json, sys\n{statement}\nprint(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_app_import_loads_no_heavy_packages():
+    assert loaded_after("import app.main") == []
+
+
+def test_history_api_does_not_load_the_pipeline():
+    assert loaded_after("import app.api.v1.history", HEAVY + ["app.services.pipeline"]) == []
+
+
+def test_exports_resolve_on_access():
+    from app.services.stance import weighted_stance
+
+    assert app.services.weighted_stance is weighted_stance
+    assert "weighted_stance" in vars(app.services)
+    assert "run_analysis" in dir(app.services)
+
+
+def test_unknown_export_raises():
+    with pytest.raises(AttributeError, match="no_such_service"):
+        app.services.no_such_service
@@ -0,0 +1,98 @@
+"""Tests for the content-addressed LLM response cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import app.core.cache as cache_module
+import app.services.llm_gateway as llm_gateway
+from app.services.llm_cache import (
+    LLMCacheBackend,
+    MemoryLLMCache,
+    get_llm_cache_backend,
+    llm_cache_key,
+    llm_cache_stats,
+    set_llm_cache_backend,
+)
+
+
+class FakeModel:
+    def __init__(self, text="FALSE"):
+        self.text = text
+        self.calls = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        return SimpleNamespace(text=f" {self.text} ")
+
+
+@pytest.fixture
+def model(monkeypatch):
+    previous = get_llm_cache_backend()
+    set_llm_cache_backend(MemoryLLMCache(maxsize=10, ttl=60))
+    fake = FakeModel()
+    monkeypatch.setattr(llm_gateway, "get_model", lambda name, config=None: fake)
+    yield fake
+    set_llm_cache_backend(previous)
+
+
+def test_key_covers_model_config_and_prompt():
+    key = llm_cache_key("gemini", "{}", "prompt")
+
+    assert key == llm_cache_key("gemini", "{}", "prompt")
+    assert key != llm_cache_key("gemini-pro", "{}", "prompt")
+    assert key != llm_cache_key("gemini", '{"temperature": 0}', "prompt")
+    assert key != llm_cache_key("gemini", "{}", "prompt ")
+    # Parts are separated, so shifting text between them changes the key
+    assert llm_cache_key("ab", "c", "") != llm_cache_key("a", "bc", "")
+
+
+def test_identical_prompt_is_answered_from_cache(model):
+    async def scenario():
+        first = await llm_gateway.generate_text("prompt", site="test_hits")
+        second = await llm_gateway.generate_text("prompt", site="test_hits")
+        other = await llm_gateway.generate_text("prompt", generation_config={"temperature": 0}, site="test_hits")
+        return first, second, other
+
+    assert asyncio.run(scenario()) == ("FALSE", "FALSE", "FALSE")
+    assert model.calls == 2
+    assert llm_cache_stats()["sites"]["test_hits"] == {"hits": 1, "misses": 2}
+
+
+def test_uncached_calls_and_empty_answers(model):
+    async def scenario():
+        await llm_gateway.generate_text("prompt", use_cache=False)
+        await llm_gateway.generate_text("prompt", use_cache=False)
+        model.text = ""
+        await llm_gateway.generate_text("empty")
+        await llm_gateway.generate_text("empty")
+
+    asyncio.run(scenario())
+
+    assert model.calls == 4
+
+
+def test_memory_backend_expires_entries(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    backend = MemoryLLMCache(maxsize=10, ttl=60)
+
+    async def scenario():
+        await backend.set("key", "value")
+        fresh = await backend.get("key")
+        now[0] += 61
+        return fresh, await backend.get("key")
+
+    assert asyncio.run(scenario()) == ("value", None)
+
+
+def test_backend_interface_is_abstract():
+    class Incomplete(LLMCacheBackend):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        LLMCacheBackend()
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,122 @@
+"""Tests for the non-blocking Gemini gateway."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.llm_gateway as llm_gateway
+from app.core.config import settings
+
+
+class BlockingModel:
+    """SDK model without generate_content_async, like older SDK versions."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.threads = []
+
+    def generate_content(self, prompt):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return SimpleNamespace(text=f"  {prompt.upper()}  ")
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    """Fresh semaphore and thread pool; no response cache."""
+    monkeypatch.setattr(settings, "llm_cache_enabled", False)
+    monkeypatch.setattr(llm_gateway, "_semaphore", None)
+    monkeypatch.setattr(llm_gateway, "_executor", None)
+    yield
+    if llm_gateway._executor is not None:
+        llm_gateway._executor.shutdown(wait=True)
+
+
+def use_model(monkeypatch, model):
+    monkeypatch.setattr(llm_gateway, "get_model", lambda name=None, config=None: model)
+
+
+def test_blocking_sdk_call_runs_off_the_event_loop(gateway, monkeypatch):
+    model = BlockingModel(delay=0.2)
+    use_model(monkeypatch, model)
+    ticks = []
+    finished = []
+
+    async def call():
+        text = await llm_gateway.generate_text("hello")
+        finished.append(time.perf_counter())
+        return text
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.005)
+
+    async def scenario():
+        text, _ = await asyncio.gather(call(), ticker())
+        return text
+
+    assert asyncio.run(scenario()) == "HELLO"
+    assert model.threads[0].startswith("llm")
+    # The loop kept running while the SDK call blocked its thread
+    assert ticks[-1] < finished[0]
+
+
+def test_concurrent_calls_are_bounded(gateway, monkeypatch):
+    monkeypatch.setattr(settings, "llm_max_concurrency", 2)
+    in_flight, peak = [0], [0]
+
+    class AsyncModel:
+        async def generate_content_async(self, prompt):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return SimpleNamespace(text=prompt)
+
+    use_model(monkeypatch, AsyncModel())
+
+    async def scenario():
+        return await asyncio.gather(*(llm_gateway.generate_text(str(i)) for i in range(6)))
+
+    assert asyncio.run(scenario()) == [str(i) for i in range(6)]
+    assert peak[0] == 2
+
+
+def test_slow_call_times_out(gateway, monkeypatch):
+    monkeypatch.setattr(settings, "llm_timeout_seconds", 0.01)
+
+    class HangingModel:
+        async def generate_content_async(self, prompt):
+            await asyncio.sleep(1)
+
+    use_model(monkeypatch, HangingModel())
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(llm_gateway.generate_text("hello"))
+
+
+def test_models_are_created_once_per_name_and_config(monkeypatch):
+    import google.generativeai as genai
+
+    configured, created = [], []
+    monkeypatch.setattr(genai, "configure", lambda api_key: configured.append(api_key))
+    monkeypatch.setattr(genai, "GenerativeModel", lambda name, generation_config=None: created.append(name) or object())
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(llm_gateway, "_models", {})
+    monkeypatch.setattr(llm_gateway, "_configured", False)
+
+    first = llm_gateway.get_model("gemini-test")
+    again = llm_gateway.get_model("gemini-test")
+    tuned = llm_gateway.get_model("gemini-test", {"temperature": 0, "top_p": 1})
+    tuned_again = llm_gateway.get_model("gemini-test", {"top_p": 1, "temperature": 0})
+
+    assert first is again and tuned is tuned_again and first is not tuned
+    assert created == ["gemini-test", "gemini-test"]
+    assert configured == ["test-key"]
+
+    llm_gateway.shutdown_llm_gateway()
+    assert llm_gateway._models == {} and llm_gateway._configured is False
@@ -0,0 +1,131 @@
+"""Tests for the stale-while-revalidate GNews cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import app.core.cache as cache_module
+import app.services.news_search as news_search
+from app.core.config import settings
+from app.services.news_search import news_cache, search_news
+
+
+class FakeResponse:
+    def __init__(self, status_code, titles=()):
+        self.status_code = status_code
+        self.titles = titles
+
+    def json(self):
+        return {"articles": [
+            {"title": title, "url": f"https://www.example.com/{i}", "source": {"name": "Example"}}
+            for i, title in enumerate(self.titles)
+        ]}
+
+
+class FakeGNews:
+    """Shared HTTP client answering with the next queued response."""
+
+    is_closed = False
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.queries = []
+
+    async def get(self, url, params=None, **kwargs):
+        self.queries.append(params["q"])
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    fake_time = SimpleNamespace(monotonic=lambda: now[0])
+    monkeypatch.setattr(news_search, "time", fake_time)
+    monkeypatch.setattr(cache_module, "time", fake_time)
+    monkeypatch.setattr(settings, "gnews_api_key", "test-key")
+    monkeypatch.setattr(settings, "news_cache_fresh_seconds", 60)
+    news_cache.clear()
+    yield now
+    news_cache.clear()
+
+
+def use_gnews(monkeypatch, gnews):
+    monkeypatch.setattr(news_search, "get_http_client", lambda: gnews)
+    return gnews
+
+
+def titles(articles):
+    return [article["title"] for article in articles]
+
+
+def test_fresh_entry_is_served_from_cache(clock, monkeypatch):
+    gnews = use_gnews(monkeypatch, FakeGNews(FakeResponse(200, ["First"])))
+
+    async def scenario():
+        first = await search_news("The Earth is FLAT!")
+        clock[0] += 30
+        return first, await search_news("the earth is flat")
+
+    first, second = asyncio.run(scenario())
+
+    assert titles(first) == titles(second) == ["First"]
+    assert first[0]["domain"] == "example.com"
+    assert len(gnews.queries) == 1
+
+
+def test_stale_entry_is_served_while_refreshing_once(clock, monkeypatch):
+    gnews = use_gnews(monkeypatch, FakeGNews(FakeResponse(200, ["Old"]), FakeResponse(200, ["New"])))
+
+    async def scenario():
+        await search_news("claim")
+        clock[0] += 90
+        stale = await asyncio.gather(search_news("claim"), search_news("claim"))
+        await asyncio.gather(*news_search._refresh_tasks.values())
+        return stale, await search_news("claim")
+
+    stale, refreshed = asyncio.run(scenario())
+
+    assert [titles(articles) for articles in stale] == [["Old"], ["Old"]]
+    assert titles(refreshed) == ["New"]
+    assert len(gnews.queries) == 2
+
+
+def test_expired_entry_is_fetched_again(clock, monkeypatch):
+    gnews = use_gnews(monkeypatch, FakeGNews(FakeResponse(200, ["Old"]), FakeResponse(200, ["New"])))
+
+    async def scenario():
+        await search_news("claim")
+        clock[0] += news_cache.ttl + 1
+        return await search_news("claim")
+
+    assert titles(asyncio.run(scenario())) == ["New"]
+    assert len(gnews.queries) == 2
+
+
+def test_failure_is_reported_and_not_cached(clock, monkeypatch):
+    gnews = use_gnews(monkeypatch, FakeGNews(FakeResponse(429), FakeResponse(200, ["Later"])))
+    reasons = []
+
+    async def scenario():
+        failed = await search_news("claim", on_degraded=reasons.append)
+        return failed, await search_news("claim", on_degraded=reasons.append)
+
+    failed, later = asyncio.run(scenario())
+
+    assert failed == [] and titles(later) == ["Later"]
+    assert reasons == ["news_error"]
+    assert len(gnews.queries) == 2
+
+
+def test_failed_refresh_keeps_the_stale_entry(clock, monkeypatch):
+    use_gnews(monkeypatch, FakeGNews(FakeResponse(200, ["Old"]), FakeResponse(500)))
+
+    async def scenario():
+        await search_news("claim")
+        clock[0] += 90
+        await search_news("claim")
+        await asyncio.gather(*news_search._refresh_tasks.values())
+        return await search_news("claim")
+
+    assert titles(asyncio.run(scenario())) == ["Old"]
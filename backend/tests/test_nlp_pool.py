@@ -0,0 +1,101 @@
+"""Tests for the spaCy worker pool and its micro-batching."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import app.services.claim_extractor as claim_extractor
+from app.core.config import settings
+from app.services.claim_extractor import NLPPool
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Record the batches sent to workers; each text yields itself upper-cased."""
+    sent = []
+
+    def extract_batch(texts):
+        sent.append(list(texts))
+        return [[text.upper()] for text in texts]
+
+    monkeypatch.setattr(claim_extractor, "extract_candidates_batch", extract_batch)
+    monkeypatch.setattr(settings, "nlp_batch_window_ms", 20)
+    monkeypatch.setattr(settings, "nlp_batch_size", 8)
+    return sent
+
+
+def running_pool(executor=None):
+    """Pool whose workers are threads, so batching runs without spawning processes."""
+    pool = NLPPool()
+    pool._executor = executor or ThreadPoolExecutor(max_workers=1)
+    pool._workers = 1
+    return pool
+
+
+def extract_all(pool, texts):
+    async def scenario():
+        results = await asyncio.gather(*(pool.extract(text) for text in texts))
+        await pool.shutdown()
+        return results
+
+    return asyncio.run(scenario())
+
+
+def test_requests_within_the_window_share_a_batch(batches):
+    pool = running_pool()
+
+    assert extract_all(pool, ["a", "b", "c"]) == [["A"], ["B"], ["C"]]
+    assert batches == [["a", "b", "c"]]
+    assert pool.stats()["texts"] == 3 and pool.stats()["batches"] == 1
+
+
+def test_full_batch_is_sent_without_waiting(batches, monkeypatch):
+    monkeypatch.setattr(settings, "nlp_batch_size", 2)
+
+    assert extract_all(running_pool(), ["a", "b", "c", "d", "e"]) == [["A"], ["B"], ["C"], ["D"], ["E"]]
+    assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_broken_pool_falls_back_in_process(batches):
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    pool = running_pool(executor)
+
+    assert extract_all(pool, ["a", "b"]) == [["A"], ["B"]]
+    assert pool.stats()["fallbacks"] == 1
+
+
+def test_without_workers_extraction_runs_in_a_thread(monkeypatch):
+    monkeypatch.setattr(claim_extractor, "extract_candidates", lambda text: [text])
+    pool = NLPPool()
+
+    async def scenario():
+        await pool.start(workers=0)
+        return await pool.extract("claim"), await pool.extract("  ")
+
+    assert asyncio.run(scenario()) == (["claim"], [])
+    assert not pool.running
+    assert pool.stats()["workers"] == 0 and pool.stats()["batches"] == 0
+
+
+def test_spawned_workers_extract(monkeypatch):
+    # Workers are spawned and read their settings from the environment
+    monkeypatch.setenv("NLP_MODE", "sentencizer")
+    monkeypatch.setattr(settings, "nlp_mode", "sentencizer")
+    monkeypatch.setattr(settings, "nlp_batch_window_ms", 5)
+    pool = NLPPool()
+    text = "The vaccine was tested on thousands of people. Is it safe?"
+
+    async def scenario():
+        await pool.start(workers=1)
+        started = pool.running
+        components = pool.components()
+        result = await pool.extract(text)
+        await pool.shutdown()
+        return started, components, result
+
+    started, components, result = asyncio.run(scenario())
+
+    assert started and components == ["sentencizer"]
+    assert result == ["The vaccine was tested on thousands of people."]
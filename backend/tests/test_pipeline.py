@@ -0,0 +1,76 @@
+"""Tests for the analysis stage graph."""
+
+import asyncio
+
+import pytest
+
+from app.services.pipeline import ANALYSIS_STAGES, Stage, _topological_order, run_stages
+
+
+def names(stages):
+    return [stage.name for stage in stages]
+
+
+def test_dependencies_come_first():
+    ordered = names(_topological_order(list(reversed(ANALYSIS_STAGES))))
+
+    for stage in ANALYSIS_STAGES:
+        for dep in stage.depends_on:
+            assert ordered.index(dep) < ordered.index(stage.name)
+
+
+@pytest.mark.parametrize("stages, message", [
+    ([Stage("a", lambda r: 1, depends_on=["b"]), Stage("b", lambda r: 2, depends_on=["a"])], "cycle"),
+    ([Stage("a", lambda r: 1, depends_on=["missing"])], "unknown stage"),
+])
+def test_invalid_graphs_are_rejected(stages, message):
+    with pytest.raises(ValueError, match=message):
+        _topological_order(stages)
+
+
+def test_independent_stages_overlap():
+    running = []
+    peak = [0]
+
+    async def slow(name):
+        running.append(name)
+        peak[0] = max(peak[0], len(running))
+        await asyncio.sleep(0.02)
+        running.remove(name)
+        return name
+
+    stages = [
+        Stage("claim", lambda r: r["text"].upper()),
+        Stage("factcheck", lambda r: slow("factcheck"), depends_on=["claim"]),
+        Stage("news", lambda r: slow("news"), depends_on=["claim"]),
+        Stage("verdict", lambda r: (r["factcheck"], r["news"]), depends_on=["factcheck", "news"]),
+    ]
+    completed = []
+
+    results, timings = asyncio.run(run_stages(stages, {"text": "claim"}, lambda name, value: completed.append(name)))
+
+    assert results["claim"] == "CLAIM"
+    assert results["verdict"] == ("factcheck", "news")
+    assert peak[0] == 2
+    assert completed[0] == "claim" and completed[-1] == "verdict"
+    assert set(timings) == {"claim", "factcheck", "news", "verdict", "total"}
+
+
+def test_failing_stage_cancels_the_rest():
+    cancelled = []
+
+    async def never_finishes():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    def fail(results):
+        raise RuntimeError("stage failed")
+
+    stages = [Stage("slow", lambda r: never_finishes()), Stage("broken", fail)]
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        asyncio.run(run_stages(stages))
+    assert cancelled == [True]
@@ -0,0 +1,144 @@
+"""Tests for the learned fact-check rating table."""
+
+import asyncio
+
+import pytest
+
+import app.services.factcheck as factcheck
+from app.core.config import settings
+from app.services.rating_learning import (
+    CONTEXTUAL,
+    forget_learned_rating,
+    learned_rating,
+    list_learned_ratings,
+    rating_key,
+    record_interpretation,
+)
+
+
+@pytest.fixture(autouse=True)
+def promote_after_three(monkeypatch):
+    monkeypatch.setattr(settings, "rating_learning_enabled", True)
+    monkeypatch.setattr(settings, "rating_learning_promote_after", 3)
+    monkeypatch.setattr(settings, "rating_learning_max_samples", 5)
+
+
+async def record(verdicts, publisher="The Washington Post", rating="Four Pinocchios"):
+    for verdict in verdicts:
+        await record_interpretation(publisher, rating, verdict)
+
+
+def test_rating_key_ignores_case_punctuation_and_separators():
+    assert rating_key("PolitiFact ", "Pants on Fire!") == ("politifact", "pants on fire")
+    assert rating_key("PolitiFact", "pants-on-fire") == ("politifact", "pants on fire")
+    assert rating_key("AFP", "¡Falso!") == ("afp", "falso")
+
+
+def test_promoted_after_consistent_sightings(db, run):
+    async def scenario():
+        await record(["False", "False"])
+        before = await learned_rating("The Washington Post", "Four Pinocchios")
+        await record(["False"])
+        after = await learned_rating("the washington post", "Four Pinocchios.")
+        return before, after
+
+    before, after = run(scenario())
+
+    assert before == (None, True)
+    assert after == ("False", False)
+
+
+def test_learned_per_publisher(db, run):
+    async def scenario():
+        await record(["False"] * 3)
+        return await learned_rating("Another Publisher", "Four Pinocchios")
+
+    assert run(scenario()) == (None, True)
+
+
+def test_disagreement_demotes(db, run):
+    async def scenario():
+        await record(["False"] * 3 + ["Misleading"])
+        entries, _ = await list_learned_ratings()
+        return await learned_rating("The Washington Post", "Four Pinocchios"), entries[0]
+
+    lookup, entry = run(scenario())
+
+    assert lookup == (None, True)
+    assert entry.promoted is False
+    assert entry.counts == {"False": 3, "Misleading": 1}
+    assert entry.verdict == "False"
+
+
+def test_inconsistent_rating_stops_being_sampled(db, run):
+    async def scenario():
+        await record(["False", "Misleading", "False", "Misleading", "False"])
+        return await learned_rating("The Washington Post", "Four Pinocchios")
+
+    assert run(scenario()) == (None, False)
+
+
+def test_contextual_label_is_settled_but_not_served(db, run):
+    async def scenario():
+        await record([CONTEXTUAL] * 3, rating="Explainer")
+        return await learned_rating("The Washington Post", "Explainer")
+
+    assert run(scenario()) == (None, False)
+
+
+def test_forget_makes_the_llm_decide_again(db, run):
+    async def scenario():
+        await record(["False"] * 3)
+        entries, _ = await list_learned_ratings()
+        forgotten = await forget_learned_rating(entries[0].id)
+        again = await forget_learned_rating(entries[0].id)
+        return forgotten, again, await learned_rating("The Washington Post", "Four Pinocchios")
+
+    forgotten, again, lookup = run(scenario())
+
+    assert (forgotten, again) == (True, False)
+    assert lookup == (None, True)
+
+
+def test_concurrent_sightings_are_all_counted(db, run):
+    async def scenario():
+        await asyncio.gather(*(record_interpretation("Lead Stories", "Hoax Alert", "False") for _ in range(5)))
+        entries, total = await list_learned_ratings()
+        return entries, total
+
+    entries, total = run(scenario())
+
+    assert total == 1
+    assert entries[0].sightings == 5
+    assert entries[0].promoted is True
+
+
+def test_factcheck_learns_from_rating_only_prompt(db, monkeypatch, run):
+    calls = []
+
+    async def fake_generate(prompt, site="default", use_cache=True, **kwargs):
+        calls.append(site)
+        # The article-specific verdict differs from what the label means
+        return "TRUE" if site == "rating_interpretation" else "FALSE"
+
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(factcheck, "generate_text", fake_generate)
+
+    response = {"claims": [{"text": "Claim", "claimReview": [{
+        "textualRating": "Four Pinocchios",
+        "url": "https://example.com/fact-check",
+        "publisher": {"name": "The Washington Post"}
+    }]}]}
+
+    async def scenario():
+        ratings = [(await factcheck._parse_factcheck_response(response, "Claim"))["rating"] for _ in range(4)]
+        entries, _ = await list_learned_ratings()
+        return ratings, entries
+
+    ratings, entries = run(scenario())
+
+    # The first three answers come from the per-article prompt, the fourth from the table
+    assert ratings == ["True", "True", "True", "False"]
+    assert calls.count("rating_label") == 3
+    assert calls.count("rating_interpretation") == 3
+    assert entries[0].counts == {"False": 3}
@@ -0,0 +1,105 @@
+"""
+Golden table for fact-check rating normalization.
+
+Textual ratings as published by fact-checkers (via the Google Fact Check
+API) and the verdict normalize_rating must give them. None means the
+static table has no answer and the LLM fallback is used.
+"""
+
+import pytest
+
+from app.services.factcheck import RatingMatcher, normalize_rating
+
+
+GOLDEN_RATINGS = [
+    # Plain verdicts
+    ("True", "True"),
+    ("TRUE", "True"),
+    ("Mostly True", "True"),
+    ("Correct", "True"),
+    ("Accurate", "True"),
+    ("Mostly accurate", "True"),
+    ("Verified", "True"),
+    ("False", "False"),
+    ("False.", "False"),
+    ("FALSE!", "False"),
+    ("Mostly False", "False"),
+    ("Pants on Fire!", "False"),
+    ("Pants on Fire", "False"),
+    ("Incorrect", "False"),
+    ("Inaccurate", "False"),
+    ("Untrue", "False"),
+    ("Wrong", "False"),
+    ("Fake", "False"),
+    ("Hoax", "False"),
+    ("Debunked", "False"),
+    ("Baseless", "False"),
+    ("Unfounded", "False"),
+    ("Misleading", "Misleading"),
+    ("Half True", "Misleading"),
+    ("Half-True", "Misleading"),
+    ("half  true", "Misleading"),
+    ("Mixture", "Misleading"),
+    ("Partly false", "Misleading"),
+    ("Partly True", "Misleading"),
+    ("Out of context", "Misleading"),
+    ("Missing Context", "Misleading"),
+    ("Lacks context", "Misleading"),
+    ("Exaggerated", "Misleading"),
+    ("Cherry-picked", "Misleading"),
+    ("Cherry picked", "Misleading"),
+    ("Unproven", "Unverifiable"),
+    ("Unverified", "Unverifiable"),
+    ("Unsupported", "Unverifiable"),
+    ("No evidence", "Unverifiable"),
+    ("Needs Context", "Unverifiable"),
+    ("Insufficient evidence", "Unverifiable"),
+    ("Unclear", "Unverifiable"),
+    ("Not proven", "Unverifiable"),
+    ("Not verified", "Unverifiable"),
+    ("Not supported by evidence", "Unverifiable"),
+
+    # Negation
+    ("Not true", "False"),
+    ("NOT TRUE", "False"),
+    ("That's not true", "False"),
+    ("It isn't true", "False"),
+    ("It isn’t accurate", "False"),
+    ("Not correct", "False"),
+    ("Not false", None),
+    ("Not entirely true", "Misleading"),
+    ("Not quite accurate", "Misleading"),
+    ("Not entirely false", "Misleading"),
+    ("Not misleading", None),
+
+    # Longest phrase wins regardless of position
+    ("Mostly true but misleading", "True"),
+    ("Misleading, and partly false", "Misleading"),
+    ("False: the photo is out of context", "Misleading"),
+
+    # Word boundaries
+    ("Truth", None),
+    ("Truthful hyperbole", None),
+    ("Unsafe", None),
+    ("Falsehood", None),
+
+    # Left to the LLM
+    ("Four Pinocchios", None),
+    ("Falso", None),
+    ("Satire", None),
+    ("", None),
+    (None, None),
+]
+
+
+@pytest.mark.parametrize("rating,expected", GOLDEN_RATINGS)
+def test_normalize_rating(rating, expected):
+    assert normalize_rating(rating) == expected
+
+
+def test_custom_mapping():
+    matcher = RatingMatcher({'four pinocchios': 'False', 'falso': 'False'})
+
+    assert matcher.match("Four Pinocchios") == 'False'
+    assert matcher.match("Falso") == 'False'
+    assert matcher.match("True") is None
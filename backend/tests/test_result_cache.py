@@ -0,0 +1,83 @@
+"""Tests for the analysis result cache and when pipeline results are stored."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import app.core.cache as cache_module
+import app.services.pipeline as pipeline
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.services.result_cache import analysis_cache_key, get_cached_analysis
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_key_is_canonical_per_language_domain_and_version(monkeypatch):
+    key = analysis_cache_key("The Earth is FLAT!", "https://www.bbc.co.uk/news/1", "en")
+
+    assert key == analysis_cache_key("the earth is flat", "https://bbc.co.uk/other", "en")
+    assert key != analysis_cache_key("the earth is flat", "https://bbc.co.uk/other", "de")
+    assert key != analysis_cache_key("the earth is flat", None, "en")
+    assert analysis_cache_key("?!", None) is None
+
+    monkeypatch.setattr(settings, "pipeline_version", settings.pipeline_version + "-next")
+    assert key != analysis_cache_key("the earth is flat", "https://bbc.co.uk/other", "en")
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=5)
+
+    clock[0] += 30
+    assert (cache.get("a"), cache.get("b")) == (1, None)
+
+    clock[0] += 30
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_successful_analysis_is_cached(fake_pipeline):
+    first = asyncio.run(pipeline.run_analysis("The Earth is flat"))
+    second = asyncio.run(pipeline.run_analysis("the earth is FLAT!"))
+
+    assert first["degraded"] == [] and not first["cached"]
+    assert second["cached"] and second["verdict"] == first["verdict"]
+    assert fake_pipeline["news"] == 1
+
+
+@pytest.mark.parametrize("stage, reason", [
+    ("search_factchecks", "factcheck_error"),
+    ("search_news", "news_error"),
+    ("classify_all_stances", "stance_keyword_fallback"),
+])
+def test_degraded_analysis_is_not_cached(fake_pipeline, monkeypatch, stage, reason):
+    succeed = getattr(pipeline, stage)
+
+    async def degrade(*args, on_degraded=None, **kwargs):
+        on_degraded(reason)
+        return await succeed(*args, **kwargs)
+
+    monkeypatch.setattr(pipeline, stage, degrade)
+
+    result = asyncio.run(pipeline.run_analysis("The Earth is flat"))
+
+    assert result["degraded"] == [reason]
+    assert get_cached_analysis("The Earth is flat") is None
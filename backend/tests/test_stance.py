@@ -0,0 +1,119 @@
+"""Tests for stance classification and the stance store."""
+
+import asyncio
+
+import pytest
+
+import app.services.stance as stance
+from app.core.config import settings
+from app.services.stance import classify_all_stances, stance_store, stance_store_key
+
+CLAIM = "The Eiffel Tower was moved to Berlin"
+ARTICLES = [
+    {"title": "Eiffel Tower moved to Berlin", "description": "Hoax spreads", "url": "https://example.com/1"},
+    {"title": "Paris weather", "description": "Sunny", "url": None},
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_store():
+    stance_store.clear()
+    yield
+    stance_store.clear()
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """Fake Gemini answering REFUTES; returns the list of prompts sent."""
+    prompts = []
+
+    async def fake_generate(prompt, site="default", use_cache=True, **kwargs):
+        prompts.append(prompt)
+        if "Sunny" in prompt:
+            raise TimeoutError("LLM timed out")
+        return "REFUTES"
+
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(stance, "generate_text", fake_generate)
+    return prompts
+
+
+def classify(reasons=None):
+    on_degraded = reasons.append if reasons is not None else None
+    return asyncio.run(classify_all_stances(CLAIM, ARTICLES, on_degraded=on_degraded))
+
+
+def test_store_key(monkeypatch):
+    key = stance_store_key("The Earth is FLAT!", {"url": "https://example.com/1"}, "snippet")
+
+    assert key == stance_store_key("the earth is flat", {"url": "https://example.com/1"}, "other snippet")
+    assert key != stance_store_key("the earth is flat", {"url": "https://example.com/2"}, "snippet")
+    # Without a URL the snippet identifies the article
+    assert stance_store_key("claim", {}, "a") != stance_store_key("claim", {}, "b")
+
+    monkeypatch.setattr(settings, "pipeline_version", settings.pipeline_version + "-next")
+    assert key != stance_store_key("the earth is flat", {"url": "https://example.com/1"}, "snippet")
+
+
+def test_llm_stances_are_memoized_and_failures_are_not(llm):
+    reasons = []
+    first = classify(reasons)
+    second = classify()
+
+    assert [article["stance"] for article in first] == ["REFUTES", "UNRELATED"]
+    assert [article["stance"] for article in second] == ["REFUTES", "UNRELATED"]
+    assert reasons == ["stance_error"]
+    # The failed article is asked again, the classified one is not
+    assert len(llm) == 3
+    assert len(stance_store) == 1
+
+
+def test_keyword_fallback_is_not_memoized():
+    reasons = []
+    result = classify(reasons)
+
+    assert [article["stance"] for article in result] == ["DISCUSS", "UNRELATED"]
+    assert reasons == ["stance_keyword_fallback"]
+    assert len(stance_store) == 0
+
+
+def test_stored_llm_stance_is_used_without_an_llm(llm, monkeypatch):
+    classify()
+    monkeypatch.setattr(settings, "gemini_api_key", "")
+
+    reasons = []
+    result = classify(reasons)
+
+    assert result[0]["stance"] == "REFUTES"
+    # The second article still needed the keyword fallback
+    assert reasons == ["stance_keyword_fallback"]
+
+
+@pytest.mark.parametrize("concurrent, limit, expected_peak", [(True, 2, 2), (False, 4, 1)])
+def test_classification_is_bounded_and_keeps_order(monkeypatch, concurrent, limit, expected_peak):
+    in_flight, peak = [0], [0]
+
+    async def slow_generate(prompt, site="default", use_cache=True, **kwargs):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return "SUPPORTS" if "even" in prompt else "REFUTES"
+
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(stance, "generate_text", slow_generate)
+    # The process-wide semaphore is created on first use, on the running loop
+    monkeypatch.setattr(stance, "_process_semaphore", None)
+    articles = [{"title": f"Article {i} {'even' if i % 2 == 0 else 'odd'}", "url": f"https://example.com/{i}"}
+                for i in range(6)]
+    finished = []
+
+    result = asyncio.run(classify_all_stances(
+        CLAIM, articles, concurrent=concurrent, max_concurrency=limit,
+        on_result=lambda index, article: finished.append(index)
+    ))
+
+    assert peak[0] == expected_peak
+    assert [article["stance"] for article in result] == ["SUPPORTS", "REFUTES"] * 3
+    assert [article["url"] for article in result] == [article["url"] for article in articles]
+    assert sorted(finished) == list(range(6))
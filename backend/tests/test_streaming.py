@@ -0,0 +1,89 @@
+"""Tests for streaming stage results as Server-Sent Events."""
+
+import asyncio
+import json
+
+import pytest
+
+import app.api.v1.analyze as analyze
+import app.services.pipeline as pipeline
+
+STAGE_EVENTS = ["domain_trust", "claim", "factcheck", "evidence", "evidence",
+                "stance_summary", "verdict", "explanation"]
+
+
+def collect(text):
+    events = []
+    result = asyncio.run(pipeline.run_analysis(text, on_event=lambda name, data: events.append((name, data))))
+    return result, events
+
+
+def parse_sse(body):
+    events = []
+    for message in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in message.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stage_events_follow_the_graph(fake_pipeline):
+    result, events = collect("The Earth is flat")
+    names = [name for name, _ in events]
+
+    assert sorted(names) == sorted(STAGE_EVENTS)
+    # Each event comes after the events of the stages it depends on
+    assert names.index("claim") < names.index("factcheck") < names.index("verdict")
+    assert max(i for i, name in enumerate(names) if name == "evidence") < names.index("stance_summary")
+    assert names[-1] == "explanation"
+    assert dict(events)["claim"] == {"claim": result["claim"]}
+
+
+def test_cached_result_replays_the_same_events(fake_pipeline):
+    fresh_result, fresh = collect("The Earth is flat")
+    cached_result, replayed = collect("The Earth is flat")
+
+    assert cached_result["cached"] is True
+    assert [name for name, _ in replayed] == STAGE_EVENTS
+    assert sorted(data["index"] for name, data in replayed if name == "evidence") == [0, 1]
+    assert dict(replayed)["verdict"]["verdict"] == fresh_result["verdict"]
+
+
+def test_format_sse():
+    assert analyze.format_sse("claim", {"claim": "Ünïcode"}) == 'event: claim\ndata: {"claim": "\\u00dcn\\u00efcode"}\n\n'
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(analyze.router)
+
+
+def test_stream_endpoint_ends_with_saved_check(client, fake_pipeline):
+    response = client.post("/api/v1/analyze/stream", json={"text": "The Earth is flat"})
+    events = parse_sse(response.text)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert sorted(name for name, _ in events[:-1]) == sorted(STAGE_EVENTS)
+    assert events[-1][0] == "complete"
+    complete = events[-1][1]
+    assert complete["check_id"] is not None
+    assert complete["result"]["claim"] == "The Earth is flat"
+
+
+def test_stream_endpoint_reports_failure(client, monkeypatch):
+    async def failing_analysis(*args, **kwargs):
+        raise RuntimeError("pipeline failed")
+
+    monkeypatch.setattr(analyze, "run_analysis", failing_analysis)
+
+    events = parse_sse(client.post("/api/v1/analyze/stream", json={"text": "claim"}).text)
+
+    assert events == [("error", {"detail": "Analysis failed"})]
+
+
+def test_responses_report_the_matched_domain_rule(client, fake_pipeline):
+    request = {"url": "https://news.bbc.co.uk/story"}
+    result = client.post("/api/v1/analyze", json=request).json()
+    streamed = parse_sse(client.post("/api/v1/analyze/stream", json=request).text)[-1][1]["result"]
+
+    assert result["domain_trust"]["matched_rule"] == "bbc.co.uk"
+    assert streamed["domain_trust"]["matched_rule"] == "bbc.co.uk"
@@ -0,0 +1,93 @@
+"""Tests for startup warm-up and the readiness probe."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.services.warmup as warmup
+from app.main import app
+from app.services.warmup import readiness, warm_up
+
+
+@pytest.fixture(autouse=True)
+def fresh_readiness(monkeypatch):
+    monkeypatch.setattr(readiness, "status", "starting")
+    monkeypatch.setattr(readiness, "components", {})
+    monkeypatch.setattr(readiness, "started_at", None)
+    monkeypatch.setattr(readiness, "ready_at", None)
+
+
+def use_steps(monkeypatch, **outcomes):
+    """Replace the warm-up steps; an outcome is a detail string or an exception to raise."""
+    def step(outcome):
+        async def run_step():
+            await asyncio.sleep(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return run_step
+
+    required = {"model", "pool"}
+    monkeypatch.setattr(warmup, "WARMUP_STEPS", [
+        (name, step(outcome), name in required) for name, outcome in outcomes.items()
+    ])
+
+
+def probe():
+    # Without a context manager the client does not run the lifespan warm-up
+    return TestClient(app).get("/ready")
+
+
+def test_not_ready_before_warm_up():
+    response = probe()
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "starting"
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_ready_after_warm_up(monkeypatch, parallel):
+    use_steps(monkeypatch, model="loaded", pool="open")
+
+    asyncio.run(warm_up(parallel=parallel, fail_fast=False))
+    response = probe()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready" and body["ready_at"] is not None
+    assert body["components"]["model"]["detail"] == "loaded"
+    assert body["components"]["pool"]["ok"] is True
+
+
+def test_optional_step_failure_still_ready(monkeypatch):
+    use_steps(monkeypatch, model="loaded", pool="open", extras=RuntimeError("no data"))
+
+    asyncio.run(warm_up(fail_fast=False))
+
+    assert readiness.ready
+    assert readiness.components["extras"] == {
+        "required": False, "ok": False, "error": "no data",
+        "duration_ms": readiness.components["extras"]["duration_ms"],
+    }
+
+
+def test_required_step_failure_keeps_process_unready(monkeypatch):
+    use_steps(monkeypatch, model=RuntimeError("model missing"), pool="open")
+
+    asyncio.run(warm_up(fail_fast=False))
+
+    assert readiness.status == "failed"
+    assert probe().status_code == 503
+
+
+def test_fail_fast_raises(monkeypatch):
+    use_steps(monkeypatch, model=RuntimeError("model missing"), pool="open")
+
+    with pytest.raises(RuntimeError, match="model: model missing"):
+        asyncio.run(warm_up(fail_fast=True))
+    assert readiness.status == "failed"
+
+
+def test_llm_step_without_key_is_skipped():
+    assert "disabled" in asyncio.run(warmup._warm_llm())
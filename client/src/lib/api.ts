@@ -20,6 +20,7 @@ export interface AnalyzeRequest {
 export interface DomainTrust {
     domain: string | null;
     score: string | number;
+    matched_rule?: string | null;
 }
 
 export interface FactCheck {
@@ -132,6 +133,85 @@ export async function analyzeClaim(data: AnalyzeRequest): Promise<AnalyzeRespons
     });
 }
 
+export type AnalyzeStreamEvent =
+    | 'domain_trust'
+    | 'claim'
+    | 'factcheck'
+    | 'evidence'
+    | 'stance_summary'
+    | 'verdict'
+    | 'explanation'
+    | 'complete'
+    | 'error';
+
+// Streams stage results from /api/v1/analyze/stream as they complete.
+// Resolves with the final response carried by the `complete` event.
+export async function analyzeClaimStream(
+    data: AnalyzeRequest,
+    onEvent: (event: AnalyzeStreamEvent, payload: any) => void
+): Promise<AnalyzeResponse & { check_id?: number }> {
+    const token = localStorage.getItem('token');
+    const response = await fetch(`${API_URL}/api/v1/analyze/stream`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            Accept: 'text/event-stream',
+            ...(token ? { Authorization: `Bearer ${token}` } : {}),
+        },
+        body: JSON.stringify(data),
+    });
+
+    if (response.status === 401) {
+        logout();
+        window.location.href = '/login';
+        throw new Error('Unauthorized');
+    }
+
+    if (!response.ok || !response.body) {
+        const errorData = await response.json().catch(() => ({}));
+        throw new Error(errorData.detail || 'API request failed');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let final: (AnalyzeResponse & { check_id?: number }) | null = null;
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary = buffer.indexOf('\n\n');
+        while (boundary !== -1) {
+            const message = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            boundary = buffer.indexOf('\n\n');
+
+            let event = 'message';
+            let payload = '';
+            for (const line of message.split('\n')) {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) payload += line.slice(5).trim();
+            }
+
+            const parsed = payload ? JSON.parse(payload) : null;
+            onEvent(event as AnalyzeStreamEvent, parsed);
+
+            if (event === 'complete') {
+                final = { ...parsed.result, check_id: parsed.check_id };
+            } else if (event === 'error') {
+                throw new Error(parsed?.detail || 'Analysis failed');
+            }
+        }
+    }
+
+    if (!final) {
+        throw new Error('Analysis stream ended unexpectedly');
+    }
+    return final;
+}
+
 export async function extractClaim(data: { text?: string; url?: string }): Promise<{ primary_claim: string; claim?: string }> {
     return authFetch('/api/v1/extract-claim', {
         method: 'POST',
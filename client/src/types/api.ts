@@ -33,6 +33,7 @@ export interface AnalyzeRequest {
 export interface DomainTrust {
     domain: string | null;
     score: string | number;
+    matched_rule?: string | null;
 }
 
 export interface FactCheck {